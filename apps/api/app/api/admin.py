@@ -0,0 +1,34 @@
+import hmac
+from typing import Any
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+
+from app.core.config import Settings
+from app.core.deps import get_settings
+from app.services.llm import get_llm_gateway, get_model_router, get_token_accounting
+
+router = APIRouter()
+
+
+def require_admin(
+    settings: Settings = Depends(get_settings),
+    x_admin_token: str | None = Header(default=None),
+) -> None:
+    # Fail closed: without a configured token the admin API is not available at all.
+    # Compare bytes: compare_digest rejects non-ASCII str, and header values are client-controlled.
+    supplied = (x_admin_token or "").encode()
+    if not settings.admin_token or not hmac.compare_digest(supplied, settings.admin_token.encode()):
+        raise HTTPException(status_code=403, detail="admin token required")
+
+
+@router.get("/admin/llm/routing", dependencies=[Depends(require_admin)])
+async def llm_routing(request: Request, settings: Settings = Depends(get_settings)) -> dict[str, Any]:
+    quick_translate_cache = getattr(request.app.state, "quick_translate_cache", None)
+    suggestions_cache = getattr(getattr(request.app.state, "suggestion_service", None), "cache", None)
+    return {
+        "routes": get_model_router(settings).snapshot(),
+        "gateway": get_llm_gateway(settings).snapshot(),
+        "token_usage": get_token_accounting().snapshot(),
+        "quick_translate_cache": quick_translate_cache.stats.snapshot() if quick_translate_cache else None,
+        "suggestions_cache": suggestions_cache.stats.snapshot() if suggestions_cache else None,
+    }
@@ -1,19 +1,102 @@
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+import logging
+import time
 
-from app.core.deps import get_translation_service
-from app.domain.models.translate import TranslateRequest, TranslateResponse
+from fastapi import APIRouter, Depends, HTTPException, Response
+
+from app.core.config import Settings
+from app.core.deps import get_quick_translate_cache, get_settings, get_translation_service
+from app.core.logging import log_event
+from app.domain.models.translate import (
+    BatchTranslateItem,
+    BatchTranslateRequest,
+    BatchTranslateResponse,
+    TranslateRequest,
+    TranslateResponse,
+)
 from app.services.translation import TranslationServiceProtocol
+from app.services.translation.coalescing import CoalescingCache
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 @router.post("/translate/ko-en", response_model=TranslateResponse)
 async def translate_ko_en(
     payload: TranslateRequest,
+    response: Response,
     translation_service: TranslationServiceProtocol = Depends(get_translation_service),
+    cache: CoalescingCache[str] = Depends(get_quick_translate_cache),
 ) -> TranslateResponse:
     text = (payload.text or "").strip()
     if not text:
         raise HTTPException(status_code=400, detail="text is required")
-    translated = await translation_service.translate_ko_to_en(text)
+    started = time.perf_counter()
+    # Double-clicks, retries and pasted duplicates share one upstream call.
+    translated, status = await cache.get_or_run(
+        ("ko-en", " ".join(text.split())),
+        lambda: translation_service.translate_ko_to_en(text),
+    )
+    response.headers["X-Cache"] = status
+    log_event(
+        logger,
+        "translate.quick",
+        cache=status,
+        text_len=len(text),
+        latency_ms=int((time.perf_counter() - started) * 1000),
+    )
     return TranslateResponse(translated_text=translated)
+
+
+@router.post("/translate/batch", response_model=BatchTranslateResponse)
+async def translate_batch(
+    payload: BatchTranslateRequest,
+    settings: Settings = Depends(get_settings),
+    translation_service: TranslationServiceProtocol = Depends(get_translation_service),
+    cache: CoalescingCache[str] = Depends(get_quick_translate_cache),
+) -> BatchTranslateResponse:
+    if not payload.texts:
+        raise HTTPException(status_code=400, detail="texts is required")
+    if len(payload.texts) > settings.quick_translate_batch_max:
+        raise HTTPException(
+            status_code=400,
+            detail=f"at most {settings.quick_translate_batch_max} texts per request",
+        )
+    translate = (
+        translation_service.translate_ko_to_en
+        if payload.direction == "ko-en"
+        else translation_service.translate_en_to_ko
+    )
+    started = time.perf_counter()
+    # Duplicates collapse to one key; each unique text shares the single-text cache,
+    # and the fan-out below is bounded by the provider's LLM gateway.
+    keys = [" ".join(text.split()) for text in payload.texts]
+    unique = [key for key in dict.fromkeys(keys) if key]
+    outcomes = await asyncio.gather(
+        *(cache.get_or_run((payload.direction, key), lambda key=key: translate(key)) for key in unique),
+        return_exceptions=True,
+    )
+    by_key = dict(zip(unique, outcomes))
+    results: list[BatchTranslateItem] = []
+    for key in keys:
+        outcome = by_key.get(key)
+        if outcome is None:
+            results.append(BatchTranslateItem(error="text is required"))
+        elif isinstance(outcome, BaseException):
+            results.append(BatchTranslateItem(error="translation failed"))
+        else:
+            translated, status = outcome
+            results.append(BatchTranslateItem(translated_text=translated, cache=status))
+    failed = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+    for error in failed:
+        logger.error("Batch translation item failed", exc_info=error)
+    log_event(
+        logger,
+        "translate.batch",
+        direction=payload.direction,
+        items=len(keys),
+        unique=len(unique),
+        errors=len(failed),
+        latency_ms=int((time.perf_counter() - started) * 1000),
+    )
+    return BatchTranslateResponse(results=results)
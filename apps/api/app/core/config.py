@@ -25,6 +25,57 @@ class Settings(BaseSettings):
         "global.anthropic.claude-haiku-4-5-20251001-v1:0",
         validation_alias="BEDROCK_TRANSLATION_HIGH_MODEL_ID",
     )
+    bedrock_translation_fast_model_candidates: str = Field(
+        "", validation_alias="BEDROCK_TRANSLATION_FAST_MODEL_CANDIDATES"
+    )
+    bedrock_translation_high_model_candidates: str = Field(
+        "", validation_alias="BEDROCK_TRANSLATION_HIGH_MODEL_CANDIDATES"
+    )
+    bedrock_quick_translate_model_candidates: str = Field(
+        "", validation_alias="BEDROCK_QUICK_TRANSLATE_MODEL_CANDIDATES"
+    )
+    bedrock_max_connections: int = Field(64, validation_alias="BEDROCK_MAX_CONNECTIONS")
+    bedrock_timeout_seconds: float = Field(30.0, validation_alias="BEDROCK_TIMEOUT_SECONDS")
+    llm_initial_concurrency: int = Field(8, validation_alias="LLM_INITIAL_CONCURRENCY")
+    llm_min_concurrency: int = Field(2, validation_alias="LLM_MIN_CONCURRENCY")
+    llm_max_concurrency: int = Field(32, validation_alias="LLM_MAX_CONCURRENCY")
+    llm_latency_target_ms: int = Field(10000, validation_alias="LLM_LATENCY_TARGET_MS")
+    llm_routing_ewma_alpha: float = Field(0.2, validation_alias="LLM_ROUTING_EWMA_ALPHA")
+    llm_routing_explore_interval_s: float = Field(30.0, validation_alias="LLM_ROUTING_EXPLORE_INTERVAL_S")
+    admin_token: str | None = Field(None, validation_alias="ADMIN_TOKEN")
+    translation_two_tier: bool = Field(True, validation_alias="TRANSLATION_TWO_TIER")
+    translation_correction_window_ms: int = Field(2000, validation_alias="TRANSLATION_CORRECTION_WINDOW_MS")
+    translation_correction_max_batch: int = Field(4, validation_alias="TRANSLATION_CORRECTION_MAX_BATCH")
+    translation_micro_batch_enabled: bool = Field(False, validation_alias="TRANSLATION_MICRO_BATCH_ENABLED")
+    translation_micro_batch_window_ms: int = Field(30, validation_alias="TRANSLATION_MICRO_BATCH_WINDOW_MS")
+    translation_micro_batch_max: int = Field(6, validation_alias="TRANSLATION_MICRO_BATCH_MAX")
+    translation_memory_path: str = Field("", validation_alias="TRANSLATION_MEMORY_PATH")
+    translation_memory_serve_similarity: float = Field(0.95, validation_alias="TRANSLATION_MEMORY_SERVE_SIMILARITY")
+    translation_memory_reference_similarity: float = Field(
+        0.6, validation_alias="TRANSLATION_MEMORY_REFERENCE_SIMILARITY"
+    )
+    local_mt_call_classes: str = Field("", validation_alias="LOCAL_MT_CALL_CLASSES")
+    local_mt_en_ko_model_path: str = Field("", validation_alias="LOCAL_MT_EN_KO_MODEL_PATH")
+    local_mt_en_ko_source_prefix: str = Field("", validation_alias="LOCAL_MT_EN_KO_SOURCE_PREFIX")
+    local_mt_ko_en_model_path: str = Field("", validation_alias="LOCAL_MT_KO_EN_MODEL_PATH")
+    local_mt_workers: int = Field(1, validation_alias="LOCAL_MT_WORKERS")
+    local_mt_threads_per_worker: int = Field(2, validation_alias="LOCAL_MT_THREADS_PER_WORKER")
+    local_mt_batch_window_ms: int = Field(5, validation_alias="LOCAL_MT_BATCH_WINDOW_MS")
+    local_mt_max_batch: int = Field(16, validation_alias="LOCAL_MT_MAX_BATCH")
+    local_mt_beam_size: int = Field(2, validation_alias="LOCAL_MT_BEAM_SIZE")
+    quick_translate_cache_ttl_s: float = Field(30.0, validation_alias="QUICK_TRANSLATE_CACHE_TTL_S")
+    quick_translate_cache_max_entries: int = Field(1024, validation_alias="QUICK_TRANSLATE_CACHE_MAX_ENTRIES")
+    quick_translate_batch_max: int = Field(32, validation_alias="QUICK_TRANSLATE_BATCH_MAX")
+    suggestions_min_interval_s: float = Field(8.0, validation_alias="SUGGESTIONS_MIN_INTERVAL_S")
+    suggestions_novelty_threshold: float = Field(0.8, validation_alias="SUGGESTIONS_NOVELTY_THRESHOLD")
+    suggestions_cache_ttl_s: float = Field(600.0, validation_alias="SUGGESTIONS_CACHE_TTL_S")
+    suggestions_cache_max_entries: int = Field(512, validation_alias="SUGGESTIONS_CACHE_MAX_ENTRIES")
+    summary_window_chars: int = Field(4000, validation_alias="SUMMARY_WINDOW_CHARS")
+    summary_max_chunks: int = Field(8, validation_alias="SUMMARY_MAX_CHUNKS")
+    summary_refresh_min_transcripts: int = Field(5, validation_alias="SUMMARY_REFRESH_MIN_TRANSCRIPTS")
+    summary_refresh_idle_s: float = Field(2.0, validation_alias="SUMMARY_REFRESH_IDLE_S")
+    translation_hedge_final_ms: int = Field(2500, validation_alias="TRANSLATION_HEDGE_FINAL_MS")
+    translation_hedge_history_ms: int = Field(4000, validation_alias="TRANSLATION_HEDGE_HISTORY_MS")
     openai_api_key: str | None = Field(None, validation_alias="OPENAI_API_KEY")
     openai_stt_model: str = Field("gpt-4o-transcribe", validation_alias="OPENAI_STT_MODEL")
     openai_translation_model: str = Field("gpt-4o-mini", validation_alias="OPENAI_TRANSLATION_MODEL")
@@ -7,6 +7,7 @@ from app.services.stt import STTServiceProtocol, create_stt_service
 from app.services.suggestion import SuggestionService
 from app.services.translation import TranslationServiceProtocol, create_translation_service
 from app.services.translation.aws import AWSTranslationService
+from app.services.translation.coalescing import CoalescingCache
 
 
 def get_settings(request: Request) -> Settings:
@@ -21,6 +22,18 @@ def get_translation_service(request: Request) -> TranslationServiceProtocol:
     return service
 
 
+def get_quick_translate_cache(request: Request) -> CoalescingCache[str]:
+    cache = getattr(request.app.state, "quick_translate_cache", None)
+    if cache is None:
+        settings: Settings = request.app.state.settings
+        cache = CoalescingCache(
+            ttl_s=settings.quick_translate_cache_ttl_s,
+            max_entries=settings.quick_translate_cache_max_entries,
+        )
+        request.app.state.quick_translate_cache = cache
+    return cache
+
+
 def get_stt_service(request: Request) -> STTServiceProtocol:
     service = getattr(request.app.state, "stt_service", None)
     if service is None:
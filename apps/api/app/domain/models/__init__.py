@@ -5,15 +5,27 @@ from .events import (
     SessionStartEvent,
     SessionStopEvent,
     SuggestionItem,
+    SuggestionsDeltaEvent,
     SuggestionsUpdateEvent,
+    SummaryDeltaEvent,
     SummaryUpdateEvent,
     TranscriptFinalEvent,
     TranscriptPartialEvent,
+    TranslateResultEvent,
+    TranslationDeltaEvent,
     TranslationFinalEvent,
 )
+from .glossary import GlossaryEntry, MeetingGlossary
 from .provider import ProviderMode, TranscriptResult
 from .session import MeetingSession, TranscriptEntry, TranslationEntry
-from .translate import TranslateRequest, TranslateResponse
+from .topic import SuggestionTrigger
+from .translate import (
+    BatchTranslateItem,
+    BatchTranslateRequest,
+    BatchTranslateResponse,
+    TranslateRequest,
+    TranslateResponse,
+)
 
 __all__ = [
     "BaseEvent",
@@ -22,15 +34,25 @@ __all__ = [
     "TranscriptPartialEvent",
     "TranscriptFinalEvent",
     "TranslationFinalEvent",
+    "TranslationDeltaEvent",
+    "TranslateResultEvent",
+    "SuggestionsDeltaEvent",
     "SuggestionsUpdateEvent",
     "SuggestionItem",
+    "SummaryDeltaEvent",
     "SummaryUpdateEvent",
     "ErrorEvent",
     "ProviderMode",
     "TranscriptResult",
     "TranslateRequest",
     "TranslateResponse",
+    "BatchTranslateRequest",
+    "BatchTranslateItem",
+    "BatchTranslateResponse",
     "MeetingSession",
+    "MeetingGlossary",
+    "GlossaryEntry",
+    "SuggestionTrigger",
     "TranscriptEntry",
     "TranslationEntry",
     "CamelModel",
@@ -49,6 +49,14 @@ class TranslationFinalEvent(BaseEvent):
     translated_text: str
 
 
+class TranslationDeltaEvent(BaseEvent):
+    type: Literal["translation.delta"] = "translation.delta"
+    session_id: str
+    source_ts: int
+    segment_id: int | None = None
+    delta: str
+
+
 class TranscriptCorrectedEvent(BaseEvent):
     type: Literal["transcript.corrected"] = "transcript.corrected"
     session_id: str
@@ -66,6 +74,13 @@ class TranslationCorrectedEvent(BaseEvent):
     translated_text: str
 
 
+class TranslateResultEvent(BaseEvent):
+    type: Literal["translate.result"] = "translate.result"
+    request_id: str
+    translated_text: str | None = None
+    error: str | None = None
+
+
 class SubtitleSegmentEvent(CamelModel):
     id: str
     text: str
@@ -96,6 +111,19 @@ class SuggestionsUpdateEvent(BaseEvent):
     items: list[SuggestionItem]
 
 
+class SuggestionsDeltaEvent(BaseEvent):
+    type: Literal["suggestions.delta"] = "suggestions.delta"
+    session_id: str
+    index: int
+    item: SuggestionItem
+
+
+class SummaryDeltaEvent(BaseEvent):
+    type: Literal["summary.delta"] = "summary.delta"
+    session_id: str
+    delta: str
+
+
 class SummaryUpdateEvent(BaseEvent):
     type: Literal["summary.update"] = "summary.update"
     session_id: str
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, Literal
+
+_WORD_RE = re.compile(r"[\w']+")
+_KEY_TERM_RE = re.compile(r"\*\*(.+?)\*\*")
+_LATIN_RE = re.compile(r"[A-Za-z]")
+_TRAILING_PUNCT_RE = re.compile(r"[.!?]+$")
+_LIST_SEPARATORS = {"and", "or"}
+_MAX_TERM_WORDS = 4
+_MAX_LOCAL_WORDS = 8
+
+
+@dataclass(slots=True)
+class GlossaryEntry:
+    source: str
+    target: str
+    origin: Literal["seed", "learned"]
+    uses: int = 0
+
+
+class MeetingGlossary:
+    """EN→KO key terms for one meeting.
+
+    Seeded terms always win; learned terms are fixed the first time a
+    translation settles them, so later lines reuse the same rendering instead
+    of having the model decide again.
+    """
+
+    def __init__(self, max_entries: int = 200) -> None:
+        self.max_entries = max_entries
+        self._entries: dict[str, GlossaryEntry] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def entries(self) -> list[GlossaryEntry]:
+        return list(self._entries.values())
+
+    def seed(self, terms: Iterable[tuple[str, str]]) -> int:
+        added = 0
+        for source, target in terms:
+            key = _term_key(source)
+            target = target.strip()
+            if not key or not target or len(key.split()) > _MAX_TERM_WORDS:
+                continue
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                continue
+            self._entries[key] = GlossaryEntry(source.strip(), target, "seed")
+            added += 1
+        return added
+
+    def learn(self, source_text: str, translated_text: str) -> list[GlossaryEntry]:
+        """Record key terms the model marked with **…** and kept in English from the source.
+
+        A Korean rendering cannot be tied to a source word reliably (the bolded
+        term may translate a noun next to a proper noun), so only terms copied
+        through unchanged, such as product names and acronyms, are learned.
+        Everything else comes from seeding.
+        """
+        source_keys = set(_word_keys(source_text))
+        learned = []
+        for term in _KEY_TERM_RE.findall(translated_text):
+            term = term.strip()
+            key = _term_key(term)
+            if not key or not _LATIN_RE.search(term) or key not in source_keys:
+                continue
+            if key in self._entries or len(self._entries) >= self.max_entries:
+                continue
+            entry = GlossaryEntry(term, term, "learned")
+            self._entries[key] = entry
+            learned.append(entry)
+        return learned
+
+    def relevant(self, text: str, limit: int = 12) -> list[tuple[str, str]]:
+        """Entries whose source term occurs in `text`, in order of appearance."""
+        if not self._entries:
+            return []
+        matches: list[tuple[str, str]] = []
+        seen: set[str] = set()
+        for key in _word_keys(text):
+            entry = self._entries.get(key)
+            if entry is None or key in seen:
+                continue
+            seen.add(key)
+            entry.uses += 1
+            matches.append((entry.source, entry.target))
+            if len(matches) >= limit:
+                break
+        return matches
+
+    def relevant_to_target(self, text: str, limit: int = 12) -> list[tuple[str, str]]:
+        """Entries whose Korean rendering occurs in `text` (for KO→EN lookups)."""
+        matches: list[tuple[str, str]] = []
+        for entry in self._entries.values():
+            if entry.target and entry.target in text:
+                entry.uses += 1
+                matches.append((entry.source, entry.target))
+                if len(matches) >= limit:
+                    break
+        return matches
+
+    def render(self, text: str) -> str | None:
+        """Translate an utterance made only of glossary terms without the LLM.
+
+        Accepts a single term or a short list joined by commas/"and"/"or"
+        (e.g. "Kubernetes and Terraform?"); returns None for anything else.
+        """
+        if not self._entries:
+            return None
+        stripped = text.strip()
+        words = [word.lower() for word in _WORD_RE.findall(stripped)]
+        if not words or len(words) > _MAX_LOCAL_WORDS:
+            return None
+        rendered: list[str] = []
+        index = 0
+        while index < len(words):
+            if rendered and words[index] in _LIST_SEPARATORS:
+                index += 1
+                continue
+            for size in range(min(_MAX_TERM_WORDS, len(words) - index), 0, -1):
+                entry = self._entries.get(" ".join(words[index : index + size]))
+                if entry is not None:
+                    entry.uses += 1
+                    rendered.append(f"**{entry.target}**")
+                    index += size
+                    break
+            else:
+                return None
+        if not rendered or words[-1] in _LIST_SEPARATORS:
+            return None
+        trailing = _TRAILING_PUNCT_RE.search(stripped)
+        return ", ".join(rendered) + (trailing.group(0) if trailing else "")
+
+
+def _term_key(term: str) -> str:
+    return " ".join(word.lower() for word in _WORD_RE.findall(term))
+
+
+def _word_keys(text: str) -> list[str]:
+    """Every run of up to `_MAX_TERM_WORDS` words, longest first at each position."""
+    words = [word.lower() for word in _WORD_RE.findall(text)]
+    keys: list[str] = []
+    for start in range(len(words)):
+        for size in range(min(_MAX_TERM_WORDS, len(words) - start), 0, -1):
+            keys.append(" ".join(words[start : start + size]))
+    return keys
+
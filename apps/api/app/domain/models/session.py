@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
 
+from .glossary import MeetingGlossary
 from .subtitle import DisplayBuffer, SubtitleSegment
+from .topic import SuggestionTrigger, TriggerReason
 
 _SENTENCE_END_RE = re.compile(r"[.!?。？！]")
 _CLAUSE_BREAK_RE = re.compile(r"[,;:，、—]")
@@ -21,6 +24,9 @@ _CONFIRMED_SUBTITLE_COUNT = 4
 _CHUNK_MIN_WORDS = 10
 _CHUNK_MAX_WORDS = 25
 _CHUNK_MAX_SENTENCES = 2
+_PARTIAL_REUSE_MIN_SIMILARITY = 0.85
+_PARTIAL_SENTENCE_MIN_CHARS = 30
+_NORMALIZE_STRIP_RE = re.compile(r"[^\w\s']+")
 
 
 @dataclass(slots=True)
@@ -59,21 +65,70 @@ class PartialTranslationState:
     last_caption_text: str = ""
     last_emit_ts: int = 0
     last_emit_length: int = 0
-    last_translation_text: str = ""
-    last_translation_ts: int = 0
-    last_translation_segment_id: int | None = None
     segment_id: int | None = None
+    sentence_translations: dict[str, str] = field(default_factory=dict)
+    remainder_source: str = ""
+    remainder_translation: str = ""
+
+
+@dataclass(slots=True)
+class PartialTranslation:
+    source_text: str
+    translated_text: str
+
+
+@dataclass(slots=True)
+class PartialTranslationMatch:
+    kind: str
+    similarity: float
+    source_text: str
+    translated_text: str
+
+
+@dataclass(slots=True)
+class PartialReuseStats:
+    exact: int = 0
+    similar: int = 0
+    miss: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.exact + self.similar + self.miss
+        return (self.exact + self.similar) / total if total else 0.0
+
+
+@dataclass(slots=True)
+class SpeculativeSuggestions:
+    segment_id: int
+    source_text: str
+    context: list[TranscriptEntry]
+
+
+@dataclass(slots=True)
+class SpeculationStats:
+    started: int = 0
+    committed: int = 0
+    discarded: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        resolved = self.committed + self.discarded
+        return self.committed / resolved if resolved else 0.0
+
+    @property
+    def waste_rate(self) -> float:
+        resolved = self.committed + self.discarded
+        return self.discarded / resolved if resolved else 0.0
 
 
 @dataclass(slots=True)
 class PartialEmit:
     caption_text: str
-    translation_text: str | None
     segment_id: int
 
 
 class MeetingSession:
-    def __init__(self, session_id: str) -> None:
+    def __init__(self, session_id: str, suggestion_trigger: SuggestionTrigger | None = None) -> None:
         self.session_id = session_id
         self.transcripts: list[TranscriptEntry] = []
         self.translations: list[TranslationEntry] = []
@@ -82,7 +137,14 @@ class MeetingSession:
         self._display_buffer = DisplayBuffer(confirmed=[], current=None)
         self._since_last_suggestion = 0
         self._segment_counter = 0
+        self._partial_translations: dict[int, PartialTranslation] = {}
+        self.partial_reuse_stats = PartialReuseStats()
         self.suggestions_prompt = ""
+        self.glossary = MeetingGlossary()
+        self.suggestion_trigger = suggestion_trigger or SuggestionTrigger()
+        self._speculation: SpeculativeSuggestions | None = None
+        self._speculated_segment_id: int | None = None
+        self.speculation_stats = SpeculationStats()
 
     def update_display_buffer(self, segment: SubtitleSegment) -> DisplayBuffer:
         if segment.is_final:
@@ -97,6 +159,16 @@ class MeetingSession:
     def get_display_buffer(self) -> DisplayBuffer:
         return self._display_buffer
 
+    def set_display_translation(self, segment_id: int, translation: str, *, llm_corrected: bool = False) -> bool:
+        buffer = self._display_buffer
+        segments = buffer.confirmed + ([buffer.current] if buffer.current else [])
+        for segment in segments:
+            if segment.segment_id == segment_id:
+                segment.translation = translation
+                segment.llm_corrected = segment.llm_corrected or llm_corrected
+                return True
+        return False
+
     def add_final_transcript(
         self,
         speaker: str,
@@ -179,35 +251,111 @@ class MeetingSession:
         state.last_emit_length = len(caption_text)
         if state.segment_id is None:
             state.segment_id = self._next_segment_id()
-        translation_text = self._build_translation_chunk(sentences)
-        if translation_text and translation_text != state.last_translation_text:
-            state.last_translation_text = translation_text
-            state.last_translation_ts = ts
-            state.last_translation_segment_id = state.segment_id
-        else:
-            translation_text = None
         self._partial_state = state
-        return PartialEmit(
-            caption_text=caption_text,
-            translation_text=translation_text,
-            segment_id=state.segment_id,
+        return PartialEmit(caption_text=caption_text, segment_id=state.segment_id)
+
+    def record_partial_translation(self, segment_id: int, source_text: str, translated_text: str) -> None:
+        self._partial_translations[segment_id] = PartialTranslation(
+            source_text=source_text.strip(),
+            translated_text=translated_text.strip(),
         )
 
-    def is_partial_translation_current(
+    def match_partial_translation(self, segment_id: int, final_text: str) -> PartialTranslationMatch | None:
+        """Pop the segment's last Composing translation and compare it with the final text.
+
+        Returns an "exact" match when the normalized texts are equal, a "similar"
+        match above `_PARTIAL_REUSE_MIN_SIMILARITY`, and None otherwise.
+        """
+        cached = self._partial_translations.pop(segment_id, None)
+        if cached is None or not cached.translated_text:
+            self.partial_reuse_stats.miss += 1
+            return None
+        final_norm = self._normalize_text(final_text)
+        cached_norm = self._normalize_text(cached.source_text)
+        if final_norm == cached_norm:
+            self.partial_reuse_stats.exact += 1
+            kind, similarity = "exact", 1.0
+        else:
+            similarity = SequenceMatcher(None, cached_norm, final_norm).ratio()
+            if similarity < _PARTIAL_REUSE_MIN_SIMILARITY:
+                self.partial_reuse_stats.miss += 1
+                return None
+            self.partial_reuse_stats.similar += 1
+            kind = "similar"
+        return PartialTranslationMatch(
+            kind=kind,
+            similarity=similarity,
+            source_text=cached.source_text,
+            translated_text=cached.translated_text,
+        )
+
+    def plan_partial_translation(self, segment_id: int, caption_text: str) -> tuple[list[str], str]:
+        """Return the closed sentences of the caption still lacking a translation, and the open remainder.
+
+        Sentences shorter than `_PARTIAL_SENTENCE_MIN_CHARS` ("OK.", "Yes.") are
+        merged into the next one, so they never cost a call of their own.
+        """
+        state = self._partial_state
+        if state is None or state.segment_id != segment_id:
+            return [], ""
+        sentences, remainder = self._split_partial_units(caption_text)
+        missing = [sentence for sentence in sentences if sentence not in state.sentence_translations]
+        return missing, remainder
+
+    def closed_sentences_before(self, segment_id: int, caption_text: str, sentence: str) -> list[str]:
+        sentences, _ = self._split_partial_units(caption_text)
+        if sentence not in sentences:
+            return []
+        return sentences[: sentences.index(sentence)]
+
+    def record_sentence_translation(
         self,
-        speaker: str,
-        ts: int,
-        text: str,
         segment_id: int,
+        source_text: str,
+        translated_text: str,
+        *,
+        is_remainder: bool = False,
     ) -> bool:
         state = self._partial_state
-        if state is None:
+        if state is None or state.segment_id != segment_id:
             return False
-        return (
-            state.last_translation_ts == ts
-            and state.last_translation_text == text
-            and state.last_translation_segment_id == segment_id
-        )
+        if is_remainder:
+            state.remainder_source = source_text
+            state.remainder_translation = translated_text.strip()
+        else:
+            state.sentence_translations[source_text] = translated_text.strip()
+        return True
+
+    def compose_partial_translation(self, segment_id: int, caption_text: str) -> str | None:
+        """Join per-sentence translations with the latest remainder translation.
+
+        When every part of the caption is covered, the result is also recorded
+        for reuse by the final translation.
+        """
+        state = self._partial_state
+        if state is None or state.segment_id != segment_id:
+            return None
+        sentences, remainder = self._split_partial_units(caption_text)
+        parts: list[str] = []
+        complete = True
+        for sentence in sentences:
+            translated = state.sentence_translations.get(sentence)
+            if translated:
+                parts.append(translated)
+            else:
+                complete = False
+        if remainder:
+            if state.remainder_translation and remainder.startswith(state.remainder_source):
+                parts.append(state.remainder_translation)
+                complete = complete and remainder == state.remainder_source
+            else:
+                complete = False
+        if not parts:
+            return None
+        translation = " ".join(parts)
+        if complete:
+            self.record_partial_translation(segment_id, caption_text, translation)
+        return translation
 
     def add_translation(self, speaker: str, source_ts: int, source_text: str, translated_text: str) -> None:
         self.translations.append(
@@ -219,21 +367,72 @@ class MeetingSession:
             )
         )
 
+    def correct_translation(self, source_ts: int, translated_text: str) -> bool:
+        """Replace the history translation of the final spoken at `source_ts`."""
+        for entry in reversed(self.translations):
+            if entry.source_ts == source_ts:
+                if entry.translated_text == translated_text:
+                    return False
+                entry.translated_text = translated_text
+                return True
+        return False
+
     def set_suggestions_prompt(self, prompt: str | None) -> None:
         self.suggestions_prompt = (prompt or "").strip()
 
-    def should_update_suggestions(self, speaker_changed: bool) -> bool:
-        if len(self.transcripts) < 1:
-            return False
-        # First suggestion after 1 transcript, then every 2 transcripts
-        if self._since_last_suggestion == 0:
-            return False
-        if len(self.transcripts) == 1:
-            return True
-        return self._since_last_suggestion >= 2
+    def should_update_suggestions(self, speaker_changed: bool) -> TriggerReason | None:
+        """Why suggestions should be regenerated now, or None to keep the current ones."""
+        if not self.transcripts or self._since_last_suggestion == 0:
+            return None
+        new_texts = [entry.text for entry in self.transcripts[-self._since_last_suggestion :]]
+        return self.suggestion_trigger.evaluate(new_texts)
 
-    def mark_suggestions_updated(self) -> None:
+    def start_speculative_suggestions(
+        self, segment_id: int, speaker: str, ts: int, partial_text: str
+    ) -> SpeculativeSuggestions | None:
+        """Plan suggestions ahead of the final when the partial ends in a question or soft boundary.
+
+        Speculates at most once per segment and only when the final, if it
+        matched this partial, would trigger a regeneration anyway.
+        """
+        trimmed = partial_text.strip()
+        if self._speculation is not None or self._speculated_segment_id == segment_id:
+            return None
+        if not (trimmed.endswith("?") or _SOFT_BOUNDARY_RE.search(trimmed)):
+            return None
+        pending = self.transcripts[-self._since_last_suggestion :] if self._since_last_suggestion else []
+        if not self.suggestion_trigger.preview([entry.text for entry in pending] + [trimmed]):
+            return None
+        partial = TranscriptEntry(speaker=speaker, ts=ts, text=trimmed)
+        self._speculation = SpeculativeSuggestions(segment_id, trimmed, [*self.recent_transcripts(4), partial])
+        self._speculated_segment_id = segment_id
+        self.speculation_stats.started += 1
+        return self._speculation
+
+    def resolve_speculative_suggestions(
+        self, segment_id: int, final_text: str, triggered: bool
+    ) -> SpeculativeSuggestions | None:
+        """Return the pending speculation if it can stand in for this final; otherwise discard it."""
+        speculation = self._speculation
+        if speculation is None:
+            return None
+        self._speculation = None
+        matches = speculation.segment_id == segment_id and (
+            SequenceMatcher(
+                None, self._normalize_text(speculation.source_text), self._normalize_text(final_text)
+            ).ratio()
+            >= _PARTIAL_REUSE_MIN_SIMILARITY
+        )
+        if triggered and matches:
+            self.speculation_stats.committed += 1
+            return speculation
+        self.speculation_stats.discarded += 1
+        return None
+
+    def mark_suggestions_updated(self, context: list[TranscriptEntry] | None = None) -> None:
         self._since_last_suggestion = 0
+        entries = context if context is not None else self.recent_transcripts()
+        self.suggestion_trigger.mark_generated([entry.text for entry in entries])
 
     def recent_transcripts(self, limit: int = 5) -> list[TranscriptEntry]:
         return self.transcripts[-limit:]
@@ -440,6 +639,10 @@ class MeetingSession:
             start = end
         return chunks
 
+    @staticmethod
+    def _normalize_text(text: str) -> str:
+        return " ".join(_NORMALIZE_STRIP_RE.sub(" ", text.lower()).split())
+
     @staticmethod
     def _count_words(text: str) -> int:
         return len(text.split())
@@ -462,7 +665,18 @@ class MeetingSession:
         return " ".join(parts).strip()
 
     @staticmethod
-    def _build_translation_chunk(sentences: list[str]) -> str | None:
-        if not sentences:
-            return None
-        return sentences[-1].strip()
+    def _split_partial_units(text: str) -> tuple[list[str], str]:
+        """Split a caption into translation units of at least `_PARTIAL_SENTENCE_MIN_CHARS`.
+
+        Short sentences are joined with the following ones; any short tail is
+        left to the open remainder.
+        """
+        sentences, remainder = MeetingSession._split_sentences(text.strip())
+        units: list[str] = []
+        pending = ""
+        for sentence in sentences:
+            pending = f"{pending} {sentence}".strip()
+            if len(pending) >= _PARTIAL_SENTENCE_MIN_CHARS:
+                units.append(pending)
+                pending = ""
+        return units, f"{pending} {remainder}".strip()
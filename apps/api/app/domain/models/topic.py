@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import math
+import re
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Iterable, Literal
+
+_WORD_RE = re.compile(r"[a-z][a-z0-9'+#-]*|\d+")
+# Transcripts often drop the "?", so a leading wh-word or an auxiliary followed by a
+# subject pronoun ("Did anyone…", "Can you…") also counts; "Do the migration first." does not.
+_QUESTION_START_RE = re.compile(
+    r"^(?:(?:who|what|when|where|why|how|which)\b"
+    r"|(?:can|could|would|will|should|do|does|did|is|are|was|were|have|has)(?:n't)?\s+"
+    r"(?:i|you|we|they|he|she|it|this|that|there|anyone|anybody|someone|somebody|everyone|everybody)\b)",
+    re.IGNORECASE,
+)
+_STOPWORDS = frozenset(
+    """
+    a about above after again all also am an and any are as at be because been before being below between
+    both but by can could did do does doing down during each few for from further get got had has have
+    having he her here hers him his how i if in into is it its itself just let like me more most my no nor
+    not now of off on once only or other our ours out over own really right same she should so some such
+    than that the their theirs them then there these they this those through to too under until up us
+    very was we well were what when where which while who whom why will with would yeah yes you your
+    yours okay ok um uh oh going gonna think know mean thing things kind sort
+    """.split()
+)
+_HASH_BUCKETS = 1 << 18
+
+TriggerReason = Literal["first", "question", "topic_shift"]
+
+
+def topic_vector(texts: Iterable[str]) -> Counter[int]:
+    """Hashed bag of content words (stopwords and fillers dropped)."""
+    counts: Counter[int] = Counter()
+    for text in texts:
+        for word in _WORD_RE.findall(text.lower()):
+            if len(word) > 1 and word not in _STOPWORDS:
+                counts[zlib.crc32(word.encode()) % _HASH_BUCKETS] += 1
+    return counts
+
+
+def topic_novelty(current: Counter[int], baseline: Counter[int]) -> float:
+    """1 - cosine similarity; 0.0 when `current` has no content words."""
+    if not current:
+        return 0.0
+    if not baseline:
+        return 1.0
+    dot = sum(count * baseline.get(feature, 0) for feature, count in current.items())
+    norm = math.sqrt(sum(count * count for count in current.values())) * math.sqrt(
+        sum(count * count for count in baseline.values())
+    )
+    return 1.0 - dot / norm
+
+
+@dataclass(slots=True)
+class SuggestionTriggerStats:
+    triggered: int = 0
+    # Finals where the old "every second final" rule would have called the model.
+    saved: int = 0
+
+    def snapshot(self) -> dict[str, int]:
+        return {"triggered": self.triggered, "saved": self.saved}
+
+
+class SuggestionTrigger:
+    """Decides when a new final is worth regenerating suggestions for.
+
+    Suggestions are regenerated for the first final, for a question, or when
+    the finals since the last generation have drifted away from the context
+    that generation saw. Nothing fires within `min_interval_s` of the last
+    trigger.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_interval_s: float = 8.0,
+        novelty_threshold: float = 0.8,
+        window: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.min_interval_s = min_interval_s
+        self.novelty_threshold = novelty_threshold
+        self.window = window
+        self.stats = SuggestionTriggerStats()
+        self.last_novelty: float | None = None
+        self._clock = clock
+        self._baseline: Counter[int] | None = None
+        self._last_fired_at: float | None = None
+        self._legacy_count = 0
+
+    def evaluate(self, new_texts: list[str]) -> TriggerReason | None:
+        """`new_texts` are the finals since the last generation, oldest first."""
+        self.last_novelty = None
+        if not new_texts:
+            return None
+        self._legacy_count += 1
+        reason, self.last_novelty = self._decide(new_texts)
+        return self._fire(reason) if reason else self._skip()
+
+    def preview(self, new_texts: list[str]) -> TriggerReason | None:
+        """What `evaluate` would decide for `new_texts`, without recording anything."""
+        if not new_texts:
+            return None
+        return self._decide(new_texts)[0]
+
+    def _decide(self, new_texts: list[str]) -> tuple[TriggerReason | None, float | None]:
+        if self._last_fired_at is not None and self._clock() - self._last_fired_at < self.min_interval_s:
+            return None, None
+        if self._baseline is None:
+            return "first", None
+        latest = new_texts[-1].strip()
+        if latest.endswith("?") or _QUESTION_START_RE.match(latest):
+            return "question", None
+        novelty = topic_novelty(topic_vector(new_texts[-self.window :]), self._baseline)
+        return ("topic_shift" if novelty >= self.novelty_threshold else None), novelty
+
+    def mark_generated(self, context_texts: list[str]) -> None:
+        self._baseline = topic_vector(context_texts)
+
+    def _fire(self, reason: TriggerReason) -> TriggerReason:
+        self.stats.triggered += 1
+        self._last_fired_at = self._clock()
+        self._legacy_count = 0
+        return reason
+
+    def _skip(self) -> None:
+        if self._legacy_count >= 2:
+            self.stats.saved += 1
+            self._legacy_count = 0
+        return None
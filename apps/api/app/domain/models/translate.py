@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from typing import Literal
+
+from pydantic import Field
+
 from .base import CamelModel
 
 
@@ -9,3 +13,18 @@ class TranslateRequest(CamelModel):
 
 class TranslateResponse(CamelModel):
     translated_text: str
+
+
+class BatchTranslateRequest(CamelModel):
+    texts: list[str] = Field(default_factory=list)
+    direction: Literal["ko-en", "en-ko"] = "ko-en"
+
+
+class BatchTranslateItem(CamelModel):
+    translated_text: str | None = None
+    error: str | None = None
+    cache: Literal["HIT", "MISS", "COALESCED"] | None = None
+
+
+class BatchTranslateResponse(CamelModel):
+    results: list[BatchTranslateItem]
@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -8,7 +10,20 @@ from app.ws import ws_router
 configure_logging()
 settings = Settings()
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    for name in ("translation_service", "bedrock_service"):
+        aclose = getattr(getattr(app.state, name, None), "aclose", None)
+        if aclose is not None:
+            await aclose()
+    translation_memory = getattr(app.state, "translation_memory", None)
+    if translation_memory is not None:
+        translation_memory.close()
+
+
+app = FastAPI(lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
@@ -31,5 +46,6 @@ async def root():
             "health": "/api/v1/health",
             "websocket": "/ws/v1/meetings/{sessionId}",
             "quick_translate": "/api/v1/translate/quick",
+            "llm_routing": "/api/v1/admin/llm/routing",
         },
     }
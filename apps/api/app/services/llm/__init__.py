@@ -0,0 +1,22 @@
+from .bedrock import BedrockRuntimeClient, BedrockRuntimeError
+from .gateway import LLMGateway, LLMPriority, current_llm_session, get_llm_gateway, is_throttling_error
+from .hedging import HedgeStats, hedged_call, hedged_stream
+from .routing import ModelRouter, get_model_router
+from .usage import TokenAccounting, get_token_accounting
+
+__all__ = [
+    "BedrockRuntimeClient",
+    "BedrockRuntimeError",
+    "HedgeStats",
+    "LLMGateway",
+    "LLMPriority",
+    "ModelRouter",
+    "TokenAccounting",
+    "current_llm_session",
+    "get_llm_gateway",
+    "get_model_router",
+    "get_token_accounting",
+    "hedged_call",
+    "hedged_stream",
+    "is_throttling_error",
+]
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, AsyncIterator
+from urllib.parse import quote
+
+import boto3
+import httpx
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
+from botocore.credentials import ReadOnlyCredentials
+from botocore.eventstream import EventStreamBuffer
+
+from app.core.config import Settings
+
+_SIGNING_NAME = "bedrock"
+_THROTTLING_CODES = frozenset(
+    {
+        "ThrottlingException",
+        "TooManyRequestsException",
+        "ServiceUnavailableException",
+        "ModelNotReadyException",
+    }
+)
+
+
+class BedrockRuntimeError(RuntimeError):
+    def __init__(self, status_code: int, code: str, message: str) -> None:
+        super().__init__(f"{code} ({status_code}): {message}")
+        self.status_code = status_code
+        self.code = code[:1].upper() + code[1:]
+
+    @property
+    def is_throttling(self) -> bool:
+        return self.status_code == 429 or self.code in _THROTTLING_CODES
+
+
+class BedrockRuntimeClient:
+    """Async Bedrock Runtime client: SigV4-signed requests over a pooled httpx client.
+
+    Concurrency is bounded by `bedrock_max_connections` sockets instead of
+    executor threads, so in-flight LLM calls never compete with other
+    `asyncio.to_thread` work. Credentials are resolved off the event loop
+    (IMDS/STS lookups can block) and reused until botocore says they are due
+    for refresh.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        session: boto3.Session | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.region = settings.aws_region
+        self.endpoint = f"https://bedrock-runtime.{self.region}.amazonaws.com"
+        self._session = session or boto3.Session(region_name=self.region)
+        self._limits = httpx.Limits(
+            max_connections=settings.bedrock_max_connections,
+            max_keepalive_connections=settings.bedrock_max_connections,
+        )
+        self._timeout = httpx.Timeout(settings.bedrock_timeout_seconds, connect=5.0)
+        self._transport = transport
+        self._http: httpx.AsyncClient | None = None
+        self._credentials: Any = None
+        self._frozen: ReadOnlyCredentials | None = None
+        self._credentials_lock = asyncio.Lock()
+
+    async def converse(
+        self,
+        *,
+        modelId: str,
+        messages: list[dict[str, Any]],
+        system: list[dict[str, Any]] | None = None,
+        inferenceConfig: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        body = self._build_body(messages, system, inferenceConfig)
+        response = await self._post(f"/model/{quote(modelId, safe='')}/converse", body)
+        return response.json()
+
+    async def converse_stream(
+        self,
+        *,
+        modelId: str,
+        messages: list[dict[str, Any]],
+        system: list[dict[str, Any]] | None = None,
+        inferenceConfig: dict[str, Any] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield ConverseStream events as `{event_type: payload}` dicts."""
+        body = self._build_body(messages, system, inferenceConfig)
+        payload = json.dumps(body).encode("utf-8")
+        url = f"{self.endpoint}/model/{quote(modelId, safe='')}/converse-stream"
+        headers = await self._sign(url, payload, accept="application/vnd.amazon.eventstream")
+        async with self._client().stream("POST", url, content=payload, headers=headers) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                raise self._to_error(response)
+            buffer = EventStreamBuffer()
+            async for chunk in response.aiter_bytes():
+                buffer.add_data(chunk)
+                for message in buffer:
+                    yield self._decode_stream_message(message.headers, message.payload)
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def _post(self, path: str, body: dict[str, Any]) -> httpx.Response:
+        payload = json.dumps(body).encode("utf-8")
+        url = f"{self.endpoint}{path}"
+        headers = await self._sign(url, payload)
+        response = await self._client().post(url, content=payload, headers=headers)
+        if response.status_code >= 400:
+            raise self._to_error(response)
+        return response
+
+    def _client(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                limits=self._limits,
+                timeout=self._timeout,
+                transport=self._transport,
+            )
+        return self._http
+
+    async def _sign(self, url: str, payload: bytes, accept: str = "application/json") -> dict[str, str]:
+        request = AWSRequest(
+            method="POST",
+            url=url,
+            data=payload,
+            headers={"Content-Type": "application/json", "Accept": accept},
+        )
+        SigV4Auth(await self._frozen_credentials(), _SIGNING_NAME, self.region).add_auth(request)
+        return dict(request.headers.items())
+
+    async def _frozen_credentials(self) -> ReadOnlyCredentials:
+        if self._frozen is not None and not self._refresh_needed():
+            return self._frozen
+        async with self._credentials_lock:
+            if self._frozen is None or self._refresh_needed():
+                self._frozen = await asyncio.to_thread(self._load_credentials)
+            return self._frozen
+
+    def _refresh_needed(self) -> bool:
+        # Only RefreshableCredentials expire; the check compares timestamps and never blocks.
+        refresh_needed = getattr(self._credentials, "refresh_needed", None)
+        return bool(refresh_needed()) if callable(refresh_needed) else False
+
+    def _load_credentials(self) -> ReadOnlyCredentials:
+        if self._credentials is None:
+            self._credentials = self._session.get_credentials()
+            if self._credentials is None:
+                raise BedrockRuntimeError(401, "MissingCredentials", "No AWS credentials available")
+        return self._credentials.get_frozen_credentials()
+
+    @staticmethod
+    def _build_body(
+        messages: list[dict[str, Any]],
+        system: list[dict[str, Any]] | None,
+        inference_config: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        body: dict[str, Any] = {"messages": messages}
+        if system:
+            body["system"] = system
+        if inference_config:
+            body["inferenceConfig"] = inference_config
+        return body
+
+    @staticmethod
+    def _decode_stream_message(headers: dict[str, Any], payload: bytes) -> dict[str, Any]:
+        data = json.loads(payload or b"{}")
+        if headers.get(":message-type") == "exception":
+            code = str(headers.get(":exception-type", "BedrockStreamError"))
+            status_code = 429 if code.lower().startswith("throttling") else 400
+            raise BedrockRuntimeError(status_code, code, str(data.get("message", "")))
+        return {str(headers.get(":event-type", "")): data}
+
+    @staticmethod
+    def _to_error(response: httpx.Response) -> BedrockRuntimeError:
+        code = response.headers.get("x-amzn-errortype", "").split(":", 1)[0]
+        try:
+            data = response.json()
+        except ValueError:
+            data = {}
+        message = str(data.get("message") or data.get("Message") or response.text[:200])
+        return BedrockRuntimeError(response.status_code, code or "BedrockError", message)
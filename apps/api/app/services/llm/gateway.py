@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, AsyncIterator, Awaitable, Callable, TypeVar
+
+from app.core.config import Settings
+from app.core.logging import log_event
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+current_llm_session: ContextVar[str | None] = ContextVar("current_llm_session", default=None)
+_ANONYMOUS_FLOW = "_anonymous"
+_LATENCY_DECREASE_FACTOR = 0.9
+_THROTTLE_DECREASE_FACTOR = 0.5
+
+
+class LLMPriority(IntEnum):
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+def is_throttling_error(exc: BaseException) -> bool:
+    if getattr(exc, "is_throttling", False):
+        return True
+    return getattr(exc, "status_code", None) == 429
+
+
+@dataclass(slots=True)
+class AdaptiveLimit:
+    """AIMD concurrency limit: +1/limit per fast success, multiplicative decrease on throttling or slow calls."""
+
+    limit: float
+    min_limit: float
+    max_limit: float
+    latency_target_ms: float
+
+    def on_success(self, latency_ms: float) -> None:
+        if latency_ms > self.latency_target_ms:
+            self.limit = max(self.min_limit, self.limit * _LATENCY_DECREASE_FACTOR)
+            return
+        self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+
+    def on_throttle(self) -> None:
+        self.limit = max(self.min_limit, self.limit * _THROTTLE_DECREASE_FACTOR)
+
+
+@dataclass(slots=True)
+class _Flow:
+    weight: float = 1.0
+    virtual_time: float = 0.0
+    queues: dict[int, deque[asyncio.Future[None]]] = field(default_factory=dict)
+
+    def has_waiters(self, priority: int) -> bool:
+        return bool(self.queues.get(priority))
+
+
+@dataclass(slots=True)
+class GatewayStats:
+    completed: int = 0
+    throttled: int = 0
+    failed: int = 0
+    total_wait_ms: float = 0.0
+
+
+class LLMGateway:
+    """Process-wide admission control for LLM calls.
+
+    Waiting calls are grouped into per-session flows and served by start-time
+    fair queuing (lowest virtual time first), with interactive work always
+    ahead of background work. The number of calls admitted at once follows an
+    AIMD limit driven by throttling errors and latency.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: float,
+        min_limit: float,
+        max_limit: float,
+        latency_target_ms: float,
+    ) -> None:
+        self.limit = AdaptiveLimit(
+            limit=initial_limit,
+            min_limit=min_limit,
+            max_limit=max_limit,
+            latency_target_ms=latency_target_ms,
+        )
+        self.stats = GatewayStats()
+        self._in_flight = 0
+        self._virtual_time = 0.0
+        self._flows: dict[str, _Flow] = {}
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "LLMGateway":
+        return cls(
+            initial_limit=settings.llm_initial_concurrency,
+            min_limit=settings.llm_min_concurrency,
+            max_limit=settings.llm_max_concurrency,
+            latency_target_ms=settings.llm_latency_target_ms,
+        )
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def saturated(self) -> bool:
+        return self._in_flight >= int(self.limit.limit) or self._has_waiters()
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[T]],
+        *,
+        session_id: str | None = None,
+        priority: LLMPriority = LLMPriority.INTERACTIVE,
+        weight: float = 1.0,
+    ) -> T:
+        async with self.acquire(session_id=session_id, priority=priority, weight=weight):
+            return await call()
+
+    @asynccontextmanager
+    async def acquire(
+        self,
+        *,
+        session_id: str | None = None,
+        priority: LLMPriority = LLMPriority.INTERACTIVE,
+        weight: float = 1.0,
+    ) -> AsyncIterator[float]:
+        """Admit one LLM call; yields the queue wait in milliseconds."""
+        flow_id = session_id or current_llm_session.get() or _ANONYMOUS_FLOW
+        flow = self._flows.setdefault(flow_id, _Flow())
+        flow.weight = max(weight, 0.01)
+        queued_at = time.perf_counter()
+        await self._admit(flow, int(priority))
+        started = time.perf_counter()
+        wait_ms = (started - queued_at) * 1000
+        self.stats.total_wait_ms += wait_ms
+        try:
+            yield wait_ms
+        except BaseException as exc:
+            self._release(exc, (time.perf_counter() - started) * 1000)
+            raise
+        self._release(None, (time.perf_counter() - started) * 1000)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "limit": round(self.limit.limit, 2),
+            "in_flight": self._in_flight,
+            "queued": sum(len(queue) for flow in self._flows.values() for queue in flow.queues.values()),
+            "completed": self.stats.completed,
+            "throttled": self.stats.throttled,
+            "failed": self.stats.failed,
+        }
+
+    async def _admit(self, flow: _Flow, priority: int) -> None:
+        if self._in_flight < int(self.limit.limit) and not self._has_waiters():
+            self._grant(flow)
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        flow.queues.setdefault(priority, deque()).append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Admitted just before cancellation; give the slot back.
+                self._in_flight -= 1
+                self._dispatch()
+            else:
+                queue = flow.queues.get(priority)
+                if queue is not None and future in queue:
+                    queue.remove(future)
+            raise
+
+    def _release(self, exc: BaseException | None, latency_ms: float) -> None:
+        self._in_flight -= 1
+        if exc is None:
+            self.stats.completed += 1
+            self.limit.on_success(latency_ms)
+        elif is_throttling_error(exc):
+            self.stats.throttled += 1
+            self.limit.on_throttle()
+            log_event(logger, "llm.gateway.throttled", level="warning", **self.snapshot())
+        elif not isinstance(exc, (asyncio.CancelledError, GeneratorExit)):
+            # GeneratorExit is a stream closed early (e.g. a hedge loser), not a failure.
+            self.stats.failed += 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._in_flight < int(self.limit.limit):
+            candidate = self._next_flow()
+            if candidate is None:
+                break
+            flow, priority = candidate
+            future = flow.queues[priority].popleft()
+            if future.done():
+                continue
+            self._grant(flow)
+            future.set_result(None)
+        self._prune_idle_flows()
+
+    def _next_flow(self) -> tuple[_Flow, int] | None:
+        for priority in sorted(LLMPriority):
+            ready = [flow for flow in self._flows.values() if flow.has_waiters(priority)]
+            if ready:
+                return min(ready, key=lambda flow: flow.virtual_time), int(priority)
+        return None
+
+    def _grant(self, flow: _Flow) -> None:
+        # Start-time fair queuing: an idle flow cannot bank credit while away.
+        start = max(flow.virtual_time, self._virtual_time)
+        self._virtual_time = start
+        flow.virtual_time = start + 1.0 / flow.weight
+        self._in_flight += 1
+
+    def _has_waiters(self) -> bool:
+        return any(queue for flow in self._flows.values() for queue in flow.queues.values())
+
+    def _prune_idle_flows(self) -> None:
+        # Idle flows at or behind the system virtual time carry no state worth keeping.
+        for flow_id, flow in list(self._flows.items()):
+            if flow.virtual_time <= self._virtual_time and not any(flow.queues.values()):
+                del self._flows[flow_id]
+
+
+_gateway: LLMGateway | None = None
+
+
+def get_llm_gateway(settings: Settings) -> LLMGateway:
+    """Return the worker-wide gateway shared by translation, suggestions and summaries."""
+    global _gateway
+    if _gateway is None:
+        _gateway = LLMGateway.from_settings(settings)
+    return _gateway
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class HedgeStats:
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    suppressed: int = 0
+    fallbacks: int = 0
+
+    @property
+    def hedge_rate(self) -> float:
+        return self.hedged / self.requests if self.requests else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        return self.hedge_wins / self.hedged if self.hedged else 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "suppressed": self.suppressed,
+            "fallbacks": self.fallbacks,
+            "hedge_rate": round(self.hedge_rate, 3),
+            "win_rate": round(self.win_rate, 3),
+        }
+
+
+async def hedged_call(
+    primary: Callable[[], Awaitable[T]],
+    backup: Callable[[], Awaitable[T]],
+    *,
+    budget_s: float,
+    stats: HedgeStats,
+    allow_hedge: Callable[[], bool] = lambda: True,
+) -> T:
+    """Run `primary`; once it exceeds `budget_s`, race it against `backup` and cancel the loser.
+
+    A primary that fails before the budget falls back to `backup` straight away.
+    """
+    stats.requests += 1
+    primary_task = asyncio.ensure_future(primary())
+    try:
+        done, _ = await asyncio.wait({primary_task}, timeout=budget_s if budget_s > 0 else None)
+        if done and primary_task.exception() is None:
+            return primary_task.result()
+        if not done and not allow_hedge():
+            stats.suppressed += 1
+            return await primary_task
+        if done:
+            stats.fallbacks += 1
+            return await backup()
+
+        stats.hedged += 1
+        backup_task = asyncio.ensure_future(backup())
+        try:
+            pending = {primary_task, backup_task}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is backup_task:
+                            stats.hedge_wins += 1
+                        return task.result()
+            # Both failed: surface the primary's error.
+            return primary_task.result()
+        finally:
+            await _cancel(backup_task)
+    finally:
+        await _cancel(primary_task)
+
+
+async def hedged_stream(
+    primary: Callable[[], AsyncIterator[str]],
+    backup: Callable[[], AsyncIterator[str]],
+    *,
+    budget_s: float,
+    stats: HedgeStats,
+    allow_hedge: Callable[[], bool] = lambda: True,
+) -> AsyncIterator[str]:
+    """Hedge a streamed call on time to first chunk; the first stream to produce output is kept."""
+    stats.requests += 1
+    streams: dict[asyncio.Future[str], AsyncIterator[str]] = {}
+    primary_stream = primary()
+    primary_first = asyncio.ensure_future(primary_stream.__anext__())
+    streams[primary_first] = primary_stream
+    winner: AsyncIterator[str] | None = None
+    first_chunk = ""
+    try:
+        done, _ = await asyncio.wait({primary_first}, timeout=budget_s if budget_s > 0 else None)
+        if done and not _failed(primary_first):
+            winner, first_chunk = primary_stream, primary_first.result()
+        elif not done and not allow_hedge():
+            stats.suppressed += 1
+            winner, first_chunk = primary_stream, await primary_first
+        else:
+            if done:
+                stats.fallbacks += 1
+            else:
+                stats.hedged += 1
+            backup_stream = backup()
+            backup_first = asyncio.ensure_future(backup_stream.__anext__())
+            streams[backup_first] = backup_stream
+            pending = {task for task in streams if not task.done()}
+            while winner is None and pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if not _failed(task):
+                        winner, first_chunk = streams[task], task.result()
+                        if task is backup_first:
+                            stats.hedge_wins += 1
+                        break
+            if winner is None:
+                # Every attempt failed; re-raise the most relevant error.
+                (backup_first if primary_first.cancelled() else primary_first).result()
+    except StopAsyncIteration:
+        return
+    finally:
+        for task, stream in streams.items():
+            if stream is not winner:
+                await _cancel(task)
+                with contextlib.suppress(Exception):
+                    await stream.aclose()  # type: ignore[attr-defined]
+
+    assert winner is not None
+    yield first_chunk
+    async for chunk in winner:
+        yield chunk
+
+
+def _failed(task: asyncio.Future[Any]) -> bool:
+    # An empty stream (StopAsyncIteration) is a valid, if short, answer.
+    if task.cancelled():
+        return True
+    exc = task.exception()
+    return exc is not None and not isinstance(exc, StopAsyncIteration)
+
+
+async def _cancel(task: asyncio.Future[Any]) -> None:
+    if task.done():
+        if not task.cancelled():
+            task.exception()  # mark retrieved
+        return
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError, Exception):
+        await task
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from app.core.config import Settings
+
+_LATENCY_WINDOW = 100
+_ERROR_PENALTY = 4.0
+_P95_WEIGHT = 0.3
+
+
+@dataclass(slots=True)
+class CandidateStats:
+    model_id: str
+    ewma_ms: float | None = None
+    error_rate: float = 0.0
+    requests: int = 0
+    errors: int = 0
+    last_routed_at: float = 0.0
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=_LATENCY_WINDOW))
+
+    def record(self, latency_ms: float, ok: bool, alpha: float) -> None:
+        self.requests += 1
+        self.error_rate += alpha * ((0.0 if ok else 1.0) - self.error_rate)
+        if not ok:
+            self.errors += 1
+            return
+        self.latencies.append(latency_ms)
+        self.ewma_ms = latency_ms if self.ewma_ms is None else self.ewma_ms + alpha * (latency_ms - self.ewma_ms)
+
+    @property
+    def p95_ms(self) -> float | None:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+
+    @property
+    def score(self) -> float:
+        """Lower is better; untried candidates score 0 so they get sampled first."""
+        if self.ewma_ms is None:
+            return 0.0 if self.errors == 0 else math.inf
+        latency = (1 - _P95_WEIGHT) * self.ewma_ms + _P95_WEIGHT * (self.p95_ms or self.ewma_ms)
+        return latency * (1 + _ERROR_PENALTY * self.error_rate)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "model_id": self.model_id,
+            "ewma_ms": None if self.ewma_ms is None else round(self.ewma_ms, 1),
+            "p95_ms": None if self.p95_ms is None else round(self.p95_ms, 1),
+            "error_rate": round(self.error_rate, 3),
+            "requests": self.requests,
+            "errors": self.errors,
+            "score": round(self.score, 1) if math.isfinite(self.score) else None,
+        }
+
+
+class ModelRouter:
+    """Routes each call to the best-scoring candidate model/profile id for its role.
+
+    Callers pass the configured primary id (e.g. `bedrock_translation_high_model_id`)
+    and, where two roles can share a primary, the role itself; they get back
+    the candidate of that role with the lowest latency/error score. Without a
+    role, the first role configured with that primary is used. Candidates that have not
+    been routed to for `explore_interval_s` get an occasional probe so their
+    statistics can recover after a bad spell.
+    """
+
+    def __init__(
+        self,
+        roles: dict[str, list[str]],
+        *,
+        alpha: float = 0.2,
+        explore_interval_s: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.alpha = alpha
+        self.explore_interval_s = explore_interval_s
+        self._clock = clock
+        self._roles: dict[str, list[str]] = {}
+        self._by_primary: dict[str, str] = {}
+        self._stats: dict[str, CandidateStats] = {}
+        for role, candidates in roles.items():
+            unique = list(dict.fromkeys(candidate for candidate in candidates if candidate))
+            if not unique:
+                continue
+            self._roles[role] = unique
+            self._by_primary.setdefault(unique[0], role)
+            for candidate in unique:
+                self._stats.setdefault(candidate, CandidateStats(candidate))
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "ModelRouter":
+        return cls(
+            {
+                "fast": [
+                    settings.bedrock_translation_fast_model_id,
+                    *_split_ids(settings.bedrock_translation_fast_model_candidates),
+                ],
+                "high": [
+                    settings.bedrock_translation_high_model_id,
+                    *_split_ids(settings.bedrock_translation_high_model_candidates),
+                ],
+                "quick": [
+                    settings.bedrock_quick_translate_model_id,
+                    *_split_ids(settings.bedrock_quick_translate_model_candidates),
+                ],
+            },
+            alpha=settings.llm_routing_ewma_alpha,
+            explore_interval_s=settings.llm_routing_explore_interval_s,
+        )
+
+    def resolve(self, model_id: str, role: str | None = None) -> str:
+        if role is None or self._roles.get(role, [None])[0] != model_id:
+            role = self._by_primary.get(model_id)
+        candidates = self._roles.get(role) if role else None
+        if not candidates or len(candidates) == 1:
+            return model_id
+        now = self._clock()
+        stats = [self._stats[candidate] for candidate in candidates]
+        best = min(stats, key=lambda candidate: candidate.score)
+        stale = [
+            candidate
+            for candidate in stats
+            if candidate is not best and now - candidate.last_routed_at >= self.explore_interval_s
+        ]
+        chosen = min(stale, key=lambda candidate: candidate.last_routed_at) if stale and best.requests else best
+        chosen.last_routed_at = now
+        return chosen.model_id
+
+    def record(self, model_id: str, latency_ms: float, *, ok: bool) -> None:
+        stats = self._stats.get(model_id)
+        if stats is not None:
+            stats.record(latency_ms, ok, self.alpha)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            role: {
+                "selected": min(candidates, key=lambda candidate: self._stats[candidate].score),
+                "candidates": [self._stats[candidate].snapshot() for candidate in candidates],
+            }
+            for role, candidates in self._roles.items()
+        }
+
+
+def _split_ids(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+_router: ModelRouter | None = None
+
+
+def get_model_router(settings: Settings) -> ModelRouter:
+    """Return the worker-wide router; its statistics are shared by every session."""
+    global _router
+    if _router is None:
+        _router = ModelRouter.from_settings(settings)
+    return _router
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.logging import log_event
+
+logger = logging.getLogger(__name__)
+
+# Cached input is billed at a fraction of the normal input price.
+BEDROCK_CACHE_READ_PRICE_RATIO = 0.1
+OPENAI_CACHE_READ_PRICE_RATIO = 0.5
+
+
+@dataclass(slots=True)
+class CallSiteUsage:
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    saved_input_tokens: float = 0.0
+
+    @property
+    def prompt_tokens(self) -> int:
+        return self.input_tokens + self.cache_read_tokens + self.cache_write_tokens
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        return self.cache_read_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
+            "cache_hit_ratio": round(self.cache_hit_ratio, 3),
+            "saved_input_tokens": round(self.saved_input_tokens, 1),
+        }
+
+
+class TokenAccounting:
+    """Per-call-site token usage, including what prompt caching saved.
+
+    `input_tokens` counts only uncached prompt tokens; cache reads and writes
+    are tracked separately so the hit ratio reflects the whole prompt.
+    """
+
+    def __init__(self) -> None:
+        self.call_sites: dict[str, CallSiteUsage] = {}
+
+    def record(
+        self,
+        call_site: str,
+        *,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
+        cache_read_price_ratio: float = BEDROCK_CACHE_READ_PRICE_RATIO,
+    ) -> None:
+        usage = self.call_sites.setdefault(call_site, CallSiteUsage())
+        usage.calls += 1
+        usage.input_tokens += input_tokens
+        usage.output_tokens += output_tokens
+        usage.cache_read_tokens += cache_read_tokens
+        usage.cache_write_tokens += cache_write_tokens
+        usage.saved_input_tokens += cache_read_tokens * (1 - cache_read_price_ratio)
+        log_event(
+            logger,
+            "llm.usage",
+            call_site=call_site,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cache_read_tokens=cache_read_tokens,
+            cache_write_tokens=cache_write_tokens,
+            cache_hit_ratio=round(usage.cache_hit_ratio, 3),
+            sample_rate=0.1,
+        )
+
+    def record_bedrock(self, call_site: str, usage: dict[str, Any] | None) -> None:
+        if not usage:
+            return
+        self.record(
+            call_site,
+            input_tokens=int(usage.get("inputTokens") or 0),
+            output_tokens=int(usage.get("outputTokens") or 0),
+            cache_read_tokens=int(usage.get("cacheReadInputTokens") or 0),
+            cache_write_tokens=int(usage.get("cacheWriteInputTokens") or 0),
+        )
+
+    def record_openai(self, call_site: str, usage: Any) -> None:
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = int(getattr(details, "cached_tokens", 0) or 0)
+        self.record(
+            call_site,
+            input_tokens=int(getattr(usage, "prompt_tokens", 0) or 0) - cached,
+            output_tokens=int(getattr(usage, "completion_tokens", 0) or 0),
+            cache_read_tokens=cached,
+            cache_read_price_ratio=OPENAI_CACHE_READ_PRICE_RATIO,
+        )
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        return {call_site: usage.snapshot() for call_site, usage in sorted(self.call_sites.items())}
+
+
+_accounting: TokenAccounting | None = None
+
+
+def get_token_accounting() -> TokenAccounting:
+    global _accounting
+    if _accounting is None:
+        _accounting = TokenAccounting()
+    return _accounting
@@ -1,12 +1,110 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import hashlib
 import json
+import logging
 import re
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator
 
 from app.core.config import Settings
+from app.core.logging import log_event
 from app.domain.models.session import TranscriptEntry
 from app.services.translation.aws import AWSTranslationService
+from app.services.translation.coalescing import CoalescingCache
+
+logger = logging.getLogger(__name__)
+
+_SUGGESTION_SYSTEM_PROMPT = (
+    "You are helping a non-native speaker participate in a meeting. "
+    "Suggest 10 natural English sentences they can say. Mix questions and answers.\n"
+    "Rules:\n"
+    "- Use easy-to-edit phrases.\n"
+    "- Keep each sentence under 14 words.\n"
+    "- Avoid jargon and idioms.\n"
+    "- Make them sound polite and natural.\n"
+    "- Vary difficulty from beginner to lower-intermediate.\n"
+    "Return a JSON array of objects with keys \"en\" and \"ko\" only."
+)
+_MAX_SUGGESTIONS = 10
+_CONTEXT_WINDOW = 5
+# "?" is kept: a question and the same words as a statement get different suggestions.
+_FINGERPRINT_STRIP_RE = re.compile(r"[^\w\s'?]+")
+
+
+@dataclass(slots=True)
+class _SharedStream:
+    """One in-flight model stream and the items it has produced so far."""
+
+    items: list[dict[str, str]] = field(default_factory=list)
+    done: bool = False
+    error: Exception | None = None
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+    task: asyncio.Future[None] | None = None
+
+    def notify(self) -> None:
+        # A fresh event per change, so every waiting reader wakes exactly once.
+        changed, self.changed = self.changed, asyncio.Event()
+        changed.set()
+
+
+class JsonArrayStreamParser:
+    """Incremental parser for a streamed JSON array.
+
+    `feed` returns each top-level element as soon as its closing bracket
+    arrives. Anything before the opening `[` (prose, a code fence) is skipped,
+    and input after the closing `]` is ignored.
+    """
+
+    def __init__(self) -> None:
+        self._started = False
+        self._done = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._element: list[str] = []
+
+    def feed(self, chunk: str) -> list[Any]:
+        elements: list[Any] = []
+        for char in chunk:
+            if self._done:
+                break
+            if not self._started:
+                self._started = char == "["
+                continue
+            if self._in_string:
+                self._element.append(char)
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+            if self._depth == 0:
+                if char == "]":
+                    self._done = True
+                elif char in "{[":
+                    self._depth = 1
+                    self._element = [char]
+                # Bare scalars between elements are not expected; skip them.
+                continue
+            self._element.append(char)
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        elements.append(json.loads("".join(self._element)))
+                    except json.JSONDecodeError:
+                        pass
+                    self._element = []
+        return elements
 
 
 class SuggestionService:
@@ -14,17 +112,148 @@ class SuggestionService:
         self.bedrock = bedrock_service
         self.settings = settings
         self.min_transcripts_for_suggestion = 1
+        # Shared by every meeting on this process, so it also covers reconnects.
+        self.cache: CoalescingCache[list[dict[str, str]]] = CoalescingCache(
+            ttl_s=settings.suggestions_cache_ttl_s,
+            max_entries=settings.suggestions_cache_max_entries,
+        )
+        self._inflight: dict[str, _SharedStream] = {}
 
-    async def generate_suggestions(
+    async def stream_suggestions(
         self,
         transcripts: list[TranscriptEntry | dict[str, Any]],
         system_prompt: str | None = None,
-    ) -> list[dict[str, str]]:
+    ) -> AsyncIterator[dict[str, str]]:
+        """Yield suggestions one by one as the model finishes each array element.
+
+        Callers with the same context fingerprint share one model stream: a
+        second caller replays the items produced so far and then follows the
+        rest. The stream runs in its own task, so a caller that stops reading
+        does not cut it short for the others or for the cache.
+        """
         if len(transcripts) < self.min_transcripts_for_suggestion:
-            return []
+            return
+
+        key = self.context_fingerprint(transcripts, system_prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self._log_cache("HIT")
+            for item in cached:
+                yield item
+            return
+        shared = self._inflight.get(key)
+        if shared is not None:
+            self.cache.stats.coalesced += 1
+            self._log_cache("COALESCED")
+        else:
+            self.cache.stats.misses += 1
+            self._log_cache("MISS")
+            shared = _SharedStream()
+            self._inflight[key] = shared
+            shared.task = asyncio.ensure_future(self._produce(key, shared, transcripts, system_prompt))
 
+        index = 0
+        while True:
+            changed = shared.changed
+            while index < len(shared.items):
+                yield shared.items[index]
+                index += 1
+            if shared.done:
+                break
+            await changed.wait()
+        if shared.error is not None:
+            raise shared.error
+
+    async def _produce(
+        self,
+        key: str,
+        shared: "_SharedStream",
+        transcripts: list[TranscriptEntry | dict[str, Any]],
+        system_prompt: str | None,
+    ) -> None:
+        try:
+            async for item in self._stream_from_model(transcripts, system_prompt):
+                shared.items.append(item)
+                shared.notify()
+        except Exception as exc:
+            shared.error = exc
+        finally:
+            shared.done = True
+            self._inflight.pop(key, None)
+            shared.notify()
+        if shared.items and shared.error is None:
+            self.cache.put(key, shared.items)
+
+    async def _stream_from_model(
+        self,
+        transcripts: list[TranscriptEntry | dict[str, Any]],
+        system_prompt: str | None,
+    ) -> AsyncIterator[dict[str, str]]:
+        prompt, system_blocks = self._build_request(transcripts, system_prompt)
+        parser = JsonArrayStreamParser()
+        chunks: list[str] = []
+        items = 0
+        # aclosing: stopping at `_MAX_SUGGESTIONS` must release the stream and its gateway slot now.
+        async with contextlib.aclosing(
+            self.bedrock._stream_model(
+                self.settings.bedrock_translation_fast_model_id,
+                prompt,
+                system=system_blocks,
+                call_site="suggestions",
+            )
+        ) as deltas:
+            async for delta in deltas:
+                chunks.append(delta)
+                for element in parser.feed(delta):
+                    item = self._clean_item(element)
+                    if item is None:
+                        continue
+                    items += 1
+                    yield item
+                    if items >= _MAX_SUGGESTIONS:
+                        return
+        if not items:
+            # Not a JSON array after all; fall back to the line-based parser.
+            for item in self._parse_suggestions("".join(chunks)):
+                yield item
+
+    @staticmethod
+    def context_fingerprint(
+        transcripts: list[TranscriptEntry | dict[str, Any]],
+        system_prompt: str | None,
+    ) -> str:
+        """Hash of the context window and prompt, ignoring case, spacing and punctuation other than "?"."""
+        digest = hashlib.sha256()
+        for line in [*SuggestionService._context_lines(transcripts), system_prompt or ""]:
+            digest.update(" ".join(_FINGERPRINT_STRIP_RE.sub(" ", line.lower()).split()).encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def _log_cache(self, status: str) -> None:
+        log_event(logger, "suggestions.cache", status=status, **self.cache.stats.snapshot())
+
+    @staticmethod
+    def _build_request(
+        transcripts: list[TranscriptEntry | dict[str, Any]],
+        system_prompt: str | None,
+    ) -> tuple[str, list[str]]:
+        context_lines = SuggestionService._context_lines(transcripts)
+        system_prompt = (system_prompt or "").strip()
+        # The static rules come first and a custom prompt (stable per session)
+        # follows; only the context in the user turn changes between calls.
+        system_blocks = [_SUGGESTION_SYSTEM_PROMPT]
+        if system_prompt:
+            system_blocks.append(
+                "Use the following system prompt to guide the suggestions.\n"
+                f"System prompt:\n{system_prompt}"
+            )
+        prompt = "Context:\n" + "\n".join(context_lines)
+        return prompt, system_blocks
+
+    @staticmethod
+    def _context_lines(transcripts: list[TranscriptEntry | dict[str, Any]]) -> list[str]:
         context_lines = []
-        for entry in transcripts[-5:]:
+        for entry in transcripts[-_CONTEXT_WINDOW:]:
             if isinstance(entry, TranscriptEntry):
                 speaker = entry.speaker
                 text = entry.text
@@ -32,32 +261,17 @@ class SuggestionService:
                 speaker = str(entry.get("speaker", "spk"))
                 text = str(entry.get("text", ""))
             context_lines.append(f"- {speaker}: {text}")
+        return context_lines
 
-        system_prompt = (system_prompt or "").strip()
-        prompt_prefix = ""
-        if system_prompt:
-            prompt_prefix = (
-                "Use the following system prompt to guide the suggestions.\n"
-                f"System prompt:\n{system_prompt}\n\n"
-            )
-
-        prompt = (
-            f"{prompt_prefix}"
-            "You are helping a non-native speaker participate in a meeting. "
-            "Suggest 10 natural English sentences they can say. Mix questions and answers.\n"
-            "Rules:\n"
-            "- Use easy-to-edit phrases.\n"
-            "- Keep each sentence under 14 words.\n"
-            "- Avoid jargon and idioms.\n"
-            "- Make them sound polite and natural.\n"
-            "- Vary difficulty from beginner to lower-intermediate.\n"
-            "Return a JSON array of objects with keys \"en\" and \"ko\" only.\n"
-            "Context:\n"
-            f"{chr(10).join(context_lines)}"
-        )
-
-        response = await self.bedrock._invoke_model(self.settings.bedrock_translation_fast_model_id, prompt)
-        return self._parse_suggestions(response)
+    @staticmethod
+    def _clean_item(item: Any) -> dict[str, str] | None:
+        if not isinstance(item, dict):
+            return None
+        en = str(item.get("en", "")).strip()
+        ko = str(item.get("ko", "")).strip()
+        if not en or not ko:
+            return None
+        return {"en": en, "ko": ko}
 
     @staticmethod
     def _parse_suggestions(response: str) -> list[dict[str, str]]:
@@ -67,15 +281,8 @@ class SuggestionService:
 
         data = SuggestionService._try_parse_json(response)
         if isinstance(data, list):
-            items = []
-            for item in data:
-                if not isinstance(item, dict):
-                    continue
-                en = str(item.get("en", "")).strip()
-                ko = str(item.get("ko", "")).strip()
-                if en and ko:
-                    items.append({"en": en, "ko": ko})
-            return items[:10]
+            items = [cleaned for cleaned in map(SuggestionService._clean_item, data) if cleaned]
+            return items[:_MAX_SUGGESTIONS]
 
         suggestions: list[dict[str, str]] = []
         for line in response.splitlines():
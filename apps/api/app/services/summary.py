@@ -1,10 +1,40 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 from app.core.config import Settings
+from app.core.logging import log_event
 from app.domain.models.session import TranscriptEntry
+from app.services.llm.gateway import LLMPriority
 from app.services.translation.aws import AWSTranslationService
+from app.services.translation.coalescing import CacheStatus
+
+logger = logging.getLogger(__name__)
+
+_SUMMARY_SYSTEM_PROMPT = (
+    "You are writing a Meeting Summary for a Korean speaker.\n"
+    "Return Markdown only (no code fences, no extra text).\n"
+    "Format:\n"
+    "## 5줄 요약\n"
+    "- Provide exactly 5 short bullet lines.\n"
+    "## 핵심 내용\n"
+    "- Provide 3 to 7 bullet lines.\n"
+    "## Action Items\n"
+    "- Provide bullet lines only if action items exist. Otherwise omit this section.\n"
+    "Rules:\n"
+    "- Keep language simple and natural.\n"
+    "- Focus on outcomes and decisions."
+)
+
+_CONDENSE_SYSTEM_PROMPT = (
+    "You condense one part of a longer meeting into notes for a later summary.\n"
+    "Return 3 to 8 short English bullet lines, Markdown only.\n"
+    "Keep decisions, numbers, dates, owners, open questions and action items.\n"
+    "Drop small talk and repetition. Do not add anything that is not in the input."
+)
 
 
 class SummaryService:
@@ -16,37 +46,77 @@ class SummaryService:
     async def generate_summary(
         self,
         transcripts: list[TranscriptEntry | dict[str, Any]],
+        chunk_summaries: list[str] | None = None,
+        *,
+        priority: LLMPriority = LLMPriority.INTERACTIVE,
     ) -> str | None:
-        if not transcripts:
-            return None
-
-        context_lines = self._build_context_lines(transcripts)
-        if not context_lines:
+        """Summarize `transcripts`, reducing `chunk_summaries` of earlier windows in with them."""
+        prompt = self._build_prompt(transcripts, chunk_summaries)
+        if prompt is None:
             return None
 
-        prompt = (
-            "You are writing a Meeting Summary for a Korean speaker.\n"
-            "Return Markdown only (no code fences, no extra text).\n"
-            "Format:\n"
-            "## 5줄 요약\n"
-            "- Provide exactly 5 short bullet lines.\n"
-            "## 핵심 내용\n"
-            "- Provide 3 to 7 bullet lines.\n"
-            "## Action Items\n"
-            "- Provide bullet lines only if action items exist. Otherwise omit this section.\n"
-            "Rules:\n"
-            "- Keep language simple and natural.\n"
-            "- Focus on outcomes and decisions.\n"
-            "Transcript:\n"
-            f"{chr(10).join(context_lines)}"
+        response = await self.bedrock._invoke_model(
+            self._model_id(),
+            prompt,
+            system=_SUMMARY_SYSTEM_PROMPT,
+            call_site="summary",
+            priority=priority,
         )
+        return response.strip() or None
+
+    async def stream_summary(
+        self,
+        transcripts: list[TranscriptEntry | dict[str, Any]],
+        chunk_summaries: list[str] | None = None,
+        *,
+        priority: LLMPriority = LLMPriority.INTERACTIVE,
+    ) -> AsyncIterator[str]:
+        """Like `generate_summary`, but yields the Markdown as the model writes it."""
+        prompt = self._build_prompt(transcripts, chunk_summaries)
+        if prompt is None:
+            return
+        async for delta in self.bedrock._stream_model(
+            self._model_id(),
+            prompt,
+            system=_SUMMARY_SYSTEM_PROMPT,
+            call_site="summary",
+            priority=priority,
+        ):
+            yield delta
 
-        model_id = (
+    def _model_id(self) -> str:
+        return (
             self.settings.bedrock_translation_high_model_id
             or self.settings.bedrock_translation_fast_model_id
         )
-        response = await self.bedrock._invoke_model(model_id, prompt)
-        return response.strip() or None
+
+    def _build_prompt(
+        self,
+        transcripts: list[TranscriptEntry | dict[str, Any]],
+        chunk_summaries: list[str] | None,
+    ) -> str | None:
+        context_lines = self._build_context_lines(transcripts) if transcripts else []
+        if not context_lines and not chunk_summaries:
+            return None
+        if not chunk_summaries:
+            return "Transcript:\n" + "\n".join(context_lines)
+        parts = ["Earlier in the meeting (notes, oldest first):"]
+        parts.extend(chunk_summaries)
+        if context_lines:
+            parts.append("Most recent transcript:")
+            parts.extend(context_lines)
+        return "\n".join(parts)
+
+    async def condense(self, lines: list[str]) -> str:
+        """Map step: notes for one closed transcript window (or for older notes being merged)."""
+        response = await self.bedrock._invoke_model(
+            self.settings.bedrock_translation_fast_model_id,
+            "\n".join(lines),
+            system=_CONDENSE_SYSTEM_PROMPT,
+            call_site="summary.map",
+            priority=LLMPriority.BACKGROUND,
+        )
+        return response.strip()
 
     def _build_context_lines(
         self,
@@ -81,3 +151,151 @@ class SummaryService:
             trimmed.append(line)
             current += line_len
         return list(reversed(trimmed))
+
+
+class RollingSummary:
+    """Map-reduce summary state for one meeting.
+
+    Transcripts are cut into windows of about `window_chars`; each closed
+    window is condensed once, in the background, and kept. A summary request
+    then only reduces those notes plus the transcripts after the last closed
+    window. When there are more than `max_chunks` notes, the oldest are
+    merged, so the reduce prompt stays bounded however long the meeting runs.
+
+    The latest summary is kept with the transcript count it covers, so a
+    request with nothing new is answered from memory.
+    """
+
+    def __init__(self, service: SummaryService, *, window_chars: int = 4000, max_chunks: int = 8) -> None:
+        self.service = service
+        self.window_chars = window_chars
+        self.max_chunks = max(2, max_chunks)
+        self.chunks: list[str] = []
+        self.covered = 0
+        self.cached: tuple[int, str] | None = None
+        self._advancing = False
+        self._inflight: tuple[int, LLMPriority, asyncio.Task[str | None]] | None = None
+
+    def has_closed_window(self, transcripts: list[TranscriptEntry]) -> bool:
+        return self._next_window_end(transcripts) is not None
+
+    async def advance(self, transcripts: list[TranscriptEntry], session_id: str | None = None) -> int:
+        """Condense every closed window not yet covered; returns how many were added."""
+        if self._advancing:
+            return 0
+        self._advancing = True
+        added = 0
+        try:
+            while (end := self._next_window_end(transcripts)) is not None:
+                started = time.perf_counter()
+                lines = self.service._build_context_lines(transcripts[self.covered : end])
+                notes = await self.service.condense(lines)
+                if notes:
+                    self.chunks.append(notes)
+                self.covered = end
+                added += 1
+                if len(self.chunks) > self.max_chunks:
+                    merge = len(self.chunks) - self.max_chunks // 2
+                    merged = await self.service.condense(self.chunks[:merge])
+                    self.chunks[:merge] = [merged] if merged else []
+                log_event(
+                    logger,
+                    "summary.map",
+                    session_id=session_id,
+                    covered=self.covered,
+                    chunks=len(self.chunks),
+                    latency_ms=int((time.perf_counter() - started) * 1000),
+                )
+        finally:
+            self._advancing = False
+        return added
+
+    def is_stale(self, transcripts: list[TranscriptEntry], min_new: int) -> bool:
+        version = self.cached[0] if self.cached else 0
+        return len(transcripts) - version >= min_new
+
+    async def summarize(
+        self,
+        transcripts: list[TranscriptEntry],
+        *,
+        priority: LLMPriority = LLMPriority.INTERACTIVE,
+        on_delta: Callable[[str], Awaitable[None]] | None = None,
+    ) -> tuple[str | None, CacheStatus]:
+        """Cached summary for `transcripts`, computing it if needed.
+
+        With `on_delta`, a fresh summary is streamed and each chunk is passed
+        to it as it arrives; cached and shared results are not. A call for the
+        same transcripts is shared only if it runs at least at `priority`; a
+        less urgent one (a background refresh) is cancelled and superseded,
+        and its caller gets the new result instead.
+        """
+        version = len(transcripts)
+        if self.cached is not None and self.cached[0] == version:
+            return self.cached[1], "HIT"
+        if self._inflight is not None and self._inflight[0] == version:
+            _, inflight_priority, inflight_task = self._inflight
+            if inflight_priority <= priority:
+                return await asyncio.shield(inflight_task), "COALESCED"
+            inflight_task.cancel()
+        tail, chunks = transcripts[self.covered :], list(self.chunks)
+        if on_delta is None:
+            task = asyncio.ensure_future(self.service.generate_summary(tail, chunks, priority=priority))
+        else:
+            task = asyncio.ensure_future(self._stream(tail, chunks, priority, on_delta))
+        self._inflight = (version, priority, task)
+        try:
+            markdown = await task
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            superseding = self._inflight
+            if (
+                not task.cancelled()
+                or (current is not None and current.cancelling())
+                or superseding is None
+                or superseding[0] != version
+            ):
+                raise
+            return await asyncio.shield(superseding[2]), "COALESCED"
+        finally:
+            if self._inflight is not None and self._inflight[2] is task:
+                self._inflight = None
+        if markdown and (self.cached is None or self.cached[0] < version):
+            self.cached = (version, markdown)
+        return markdown, "MISS"
+
+    async def _stream(
+        self,
+        tail: list[TranscriptEntry],
+        chunks: list[str],
+        priority: LLMPriority,
+        on_delta: Callable[[str], Awaitable[None]],
+    ) -> str | None:
+        parts: list[str] = []
+        async for delta in self.service.stream_summary(tail, chunks, priority=priority):
+            parts.append(delta)
+            await on_delta(delta)
+        return "".join(parts).strip() or None
+
+    async def refresh(self, transcripts: list[TranscriptEntry], session_id: str | None = None) -> None:
+        """Bring notes and the cached summary up to date at background priority."""
+        started = time.perf_counter()
+        await self.advance(transcripts, session_id)
+        markdown, status = await self.summarize(transcripts, priority=LLMPriority.BACKGROUND)
+        log_event(
+            logger,
+            "summary.refresh",
+            session_id=session_id,
+            version=self.cached[0] if self.cached else None,
+            status=status,
+            ok=bool(markdown),
+            latency_ms=int((time.perf_counter() - started) * 1000),
+        )
+
+    def _next_window_end(self, transcripts: list[TranscriptEntry]) -> int | None:
+        chars = 0
+        for index in range(self.covered, len(transcripts)):
+            chars += len(transcripts[index].text)
+            if chars >= self.window_chars:
+                # The window is closed only once something has been said after it.
+                return index + 1 if index + 1 < len(transcripts) else None
+        return None
@@ -1,23 +1,80 @@
 from __future__ import annotations
 
 import logging
-from typing import Protocol
+from typing import AsyncIterator, Protocol
 
 from app.core.config import Settings
 from app.domain.models.provider import ProviderMode
 
+from .correction import CorrectionItem
+
 
 class TranslationServiceProtocol(Protocol):
-    async def translate_en_to_ko(self, text: str) -> str: ...
+    async def translate_en_to_ko(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> str: ...
 
     async def translate_en_to_ko_history(
-        self, text: str, recent_context: list[str] | None = None
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
     ) -> str: ...
 
-    async def translate_ko_to_en(self, text: str) -> str: ...
+    def stream_en_to_ko_history(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> AsyncIterator[str]: ...
+
+    async def translate_en_to_ko_draft(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> str: ...
+
+    def stream_en_to_ko_draft(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> AsyncIterator[str]: ...
+
+    async def correct_en_to_ko_batch(self, items: list[CorrectionItem]) -> list[str | None]: ...
+
+    async def revise_en_to_ko(
+        self, text: str, draft_source: str, draft_translation: str
+    ) -> str: ...
+
+    async def translate_ko_to_en(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> str: ...
 
 
 def create_translation_service(settings: Settings) -> TranslationServiceProtocol:
+    service = _create_provider_service(settings)
+    if not settings.local_mt_call_classes:
+        return service
+    from .local import HybridTranslationService, LocalTranslationService, parse_call_classes
+
+    call_classes = parse_call_classes(settings.local_mt_call_classes)
+    logging.getLogger(__name__).info("Local MT selected for: %s", ", ".join(sorted(call_classes)))
+    return HybridTranslationService(service, LocalTranslationService(settings), call_classes)
+
+
+def _create_provider_service(settings: Settings) -> TranslationServiceProtocol:
     logger = logging.getLogger(__name__)
     if settings.provider_mode == ProviderMode.AWS:
         from .aws import AWSTranslationService
@@ -1,104 +1,536 @@
 from __future__ import annotations
 
-import asyncio
 import json
-from typing import Any
+import logging
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Sequence
 
 import boto3
 
 from app.core.config import Settings
+from app.core.logging import log_event
+from app.services.llm.bedrock import BedrockRuntimeClient
+from app.services.llm.gateway import LLMGateway, LLMPriority, get_llm_gateway
+from app.services.llm.hedging import HedgeStats, hedged_call, hedged_stream
+from app.services.llm.routing import ModelRouter, get_model_router
+from app.services.llm.usage import TokenAccounting, get_token_accounting
+
+from .batching import MicroBatcher
+from .correction import CorrectionItem
+
+logger = logging.getLogger(__name__)
+
+# Static instructions go in the system prompt so only the user turn varies.
+_EN_KO_SYSTEM_PROMPT = (
+    "Translate the English text in the user message to natural Korean.\n"
+    "Return only the Korean translation. Do not ask questions or add explanations."
+)
+_HISTORY_SYSTEM_PROMPT = "\n".join(
+    [
+        "You are a translator. Translate English to natural Korean.",
+        "Use context for coherence but translate only the current line.",
+        "When reference translations are given, reuse their wording and terminology where they fit.",
+        "Translate glossary terms exactly as the glossary gives them.",
+        "If the line is unclear or incomplete, make the best possible inference.",
+        "Wrap key terms (technical terms, proper nouns, important concepts) with **word**.",
+        "Never ask questions, request more context, or mention language selection.",
+        "Respond in Korean only, without quotes or extra text. Return only the translation.",
+    ]
+)
+_REVISION_SYSTEM_PROMPT = "\n".join(
+    [
+        "You are a translator. A Korean draft was made from an earlier version of an English line.",
+        "Minimally edit the draft so it matches the final English line. Keep unchanged parts as they are.",
+        "Respond in Korean only, without quotes or extra text. Return only the corrected translation.",
+    ]
+)
+_BATCH_SYSTEM_PROMPT = "\n".join(
+    [
+        "You are a translator. Translate each English line to natural Korean.",
+        "Use an item's context for coherence but translate only its \"en\" line.",
+        "When an item has reference translations, reuse their wording and terminology where they fit.",
+        "Translate an item's glossary terms exactly as its glossary gives them.",
+        "If a line is unclear or incomplete, make the best possible inference.",
+        "Wrap key terms (technical terms, proper nouns, important concepts) with **word**.",
+        "Never ask questions or add explanations.",
+        'Return only a JSON array of objects with keys "id" and "ko", one per item.',
+    ]
+)
+_CORRECTION_SYSTEM_PROMPT = "\n".join(
+    [
+        "You are a translation reviewer. Each item has an English line and a fast Korean draft.",
+        "Correct mistranslations, omissions and unnatural phrasing. Keep drafts that are already good unchanged.",
+        "Translate glossary terms exactly as the glossary gives them.",
+        "Wrap key terms (technical terms, proper nouns, important concepts) with **word**.",
+        "Never ask questions or add explanations.",
+        'Return only a JSON array of objects with keys "id" and "ko", one per item.',
+    ]
+)
+_KO_EN_SYSTEM_PROMPT = (
+    "Translate the Korean text in the user message to natural English.\n"
+    "When the message also has meeting context or a glossary, translate only the \"Text\" line; "
+    "use the context for tone and the glossary's English terms for its Korean terms.\n"
+    "Return only the translation, no explanation."
+)
+
+
+@dataclass(slots=True)
+class _SegmentRequest:
+    text: str
+    recent_context: list[str]
+    references: list[tuple[str, str]]
+    glossary: list[tuple[str, str]]
 
 
 class AWSTranslationService:
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        gateway: LLMGateway | None = None,
+        router: ModelRouter | None = None,
+        accounting: TokenAccounting | None = None,
+    ) -> None:
         self.settings = settings
-        self.client = boto3.client("bedrock-runtime", region_name=settings.aws_region)
+        self.gateway = gateway or get_llm_gateway(settings)
+        self.router = router or get_model_router(settings)
+        self.accounting = accounting or get_token_accounting()
+        self.client = BedrockRuntimeClient(
+            settings,
+            session=boto3.Session(region_name=settings.aws_region),
+        )
+        self.hedge_stats = {call_class: HedgeStats() for call_class in ("final", "history")}
+        self.micro_batcher: MicroBatcher[_SegmentRequest, str] | None = None
+        if settings.translation_micro_batch_enabled:
+            self.micro_batcher = MicroBatcher(
+                self._translate_segment_batch,
+                window_s=settings.translation_micro_batch_window_ms / 1000,
+                max_batch=settings.translation_micro_batch_max,
+            )
 
-    async def translate_en_to_ko(self, text: str) -> str:
-        prompt = (
-            "Translate the following English text to natural Korean.\n"
-            f"\"{text}\"\n"
-            "Return only the Korean translation. Do not ask questions or add explanations."
+    async def translate_en_to_ko(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> str:
+        """Fast-model translation for Composing; context and glossary are optional."""
+        if recent_context or glossary:
+            prompt = self._build_history_prompt(text, recent_context, glossary=glossary)
+            system = _HISTORY_SYSTEM_PROMPT
+        else:
+            prompt, system = text, _EN_KO_SYSTEM_PROMPT
+        response = await self._invoke_model(
+            self.settings.bedrock_translation_fast_model_id,
+            prompt,
+            system=system,
+            call_site="translation.partial",
         )
-        response = await self._invoke_model(self.settings.bedrock_translation_fast_model_id, prompt)
         return response.strip()
 
     async def translate_en_to_ko_history(
         self,
         text: str,
         recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
     ) -> str:
         model_id = self.settings.bedrock_translation_high_model_id or self.settings.bedrock_translation_fast_model_id
-        prompt = self._build_history_prompt(text, recent_context)
-        response = await self._invoke_model(model_id, prompt)
+        batched = await self._submit_segment(model_id, text, recent_context, references, glossary)
+        if batched:
+            return batched
+        prompt = self._build_history_prompt(text, recent_context, references, glossary)
+        response = await self._invoke_hedged(
+            "history", model_id, prompt, system=_HISTORY_SYSTEM_PROMPT, call_site="translation.history"
+        )
         return response.strip()
 
-    async def translate_for_display(
+    async def translate_en_to_ko_draft(
         self,
         text: str,
-        confirmed_texts: list[str],
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
     ) -> str:
-        """Translate for Live display with confirmed context."""
-        prompt_lines = [
-            "You are a real-time meeting translator. Translate English to natural Korean.",
-            "Use the confirmed context below for coherence and consistency.",
-            "Translate only the current sentence, maintaining flow with previous translations.",
-            "Identify key terms (technical terms, proper nouns, important concepts) and wrap them with **word**.",
-            "Never ask questions or add explanations. Respond in Korean only.",
-        ]
-        if confirmed_texts:
-            prompt_lines.append("\nConfirmed context (most recent first):")
-            prompt_lines.extend(f"- {ctx}" for ctx in confirmed_texts[:4])
-        prompt_lines.append(f"\nCurrent sentence: \"{text}\"")
-        prompt_lines.append("Return only the Korean translation.")
-        
-        prompt = "\n".join(prompt_lines)
-        model_id = self.settings.bedrock_translation_high_model_id or self.settings.bedrock_translation_fast_model_id
-        response = await self._invoke_model(model_id, prompt)
+        model_id = self.settings.bedrock_translation_fast_model_id
+        batched = await self._submit_segment(model_id, text, recent_context, references, glossary)
+        if batched:
+            return batched
+        response = await self._invoke_model(
+            model_id,
+            self._build_history_prompt(text, recent_context, references, glossary),
+            system=_HISTORY_SYSTEM_PROMPT,
+            call_site="translation.draft",
+        )
         return response.strip()
 
-    async def translate_ko_to_en(self, text: str) -> str:
-        prompt = (
-            "Translate the following Korean text to natural English:\n"
-            f"\"{text}\"\n"
-            "Return only the translation, no explanation."
+    async def stream_en_to_ko_history(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> AsyncIterator[str]:
+        model_id = self.settings.bedrock_translation_high_model_id or self.settings.bedrock_translation_fast_model_id
+        prompt = self._build_history_prompt(text, recent_context, references, glossary)
+        fast_model_id = self.settings.bedrock_translation_fast_model_id
+        budget_ms = self.settings.translation_hedge_final_ms
+        if budget_ms <= 0 or model_id == fast_model_id:
+            async for delta in self._stream_model(
+                model_id, prompt, system=_HISTORY_SYSTEM_PROMPT, call_site="translation.final"
+            ):
+                yield delta
+            return
+        stats = self.hedge_stats["final"]
+        hedged_before, wins_before = stats.hedged, stats.hedge_wins
+        try:
+            async for delta in hedged_stream(
+                lambda: self._stream_model(
+                    model_id, prompt, system=_HISTORY_SYSTEM_PROMPT, call_site="translation.final"
+                ),
+                lambda: self._stream_model(
+                    fast_model_id, prompt, system=_HISTORY_SYSTEM_PROMPT, call_site="translation.final"
+                ),
+                budget_s=budget_ms / 1000,
+                stats=stats,
+                allow_hedge=lambda: not self.gateway.saturated,
+            ):
+                yield delta
+        finally:
+            self._log_hedge("final", hedged_before, wins_before)
+
+    async def stream_en_to_ko_draft(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> AsyncIterator[str]:
+        prompt = self._build_history_prompt(text, recent_context, references, glossary)
+        async for delta in self._stream_model(
+            self.settings.bedrock_translation_fast_model_id,
+            prompt,
+            system=_HISTORY_SYSTEM_PROMPT,
+            call_site="translation.draft",
+        ):
+            yield delta
+
+    async def correct_en_to_ko_batch(self, items: list[CorrectionItem]) -> list[str | None]:
+        if not items:
+            return []
+        model_id = self.settings.bedrock_translation_high_model_id or self.settings.bedrock_translation_fast_model_id
+        response = await self._invoke_model(
+            model_id,
+            self._build_correction_prompt(items),
+            system=_CORRECTION_SYSTEM_PROMPT,
+            call_site="translation.correction",
+            priority=LLMPriority.BACKGROUND,
+            max_tokens=256 * len(items) + 256,
+        )
+        return self._parse_indexed_translations(response, len(items))
+
+    def hedge_snapshot(self) -> dict[str, dict[str, Any]]:
+        return {call_class: stats.snapshot() for call_class, stats in self.hedge_stats.items()}
+
+    async def revise_en_to_ko(
+        self,
+        text: str,
+        draft_source: str,
+        draft_translation: str,
+    ) -> str:
+        prompt = self._build_revision_prompt(text, draft_source, draft_translation)
+        response = await self._invoke_model(
+            self.settings.bedrock_translation_fast_model_id,
+            prompt,
+            system=_REVISION_SYSTEM_PROMPT,
+            call_site="translation.revise",
         )
-        response = await self._invoke_model(self.settings.bedrock_quick_translate_model_id, prompt)
         return response.strip()
 
-    async def _invoke_model(self, model_id: str, prompt: str) -> str:
-        response = await asyncio.to_thread(
-            self.client.converse,
-            modelId=model_id,
-            messages=[
-                {
-                    "role": "user",
-                    "content": [{"text": prompt}],
-                }
-            ],
-            inferenceConfig={
-                "maxTokens": 512,
-                "temperature": 0.2,
-            },
+    async def translate_ko_to_en(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> str:
+        response = await self._invoke_model(
+            self.settings.bedrock_quick_translate_model_id,
+            self._build_quick_prompt(text, recent_context, glossary),
+            system=_KO_EN_SYSTEM_PROMPT,
+            call_site="translation.quick",
+            role="quick",
         )
+        return response.strip()
+
+    async def _invoke_model(
+        self,
+        model_id: str,
+        prompt: str,
+        *,
+        system: str | Sequence[str] | None = None,
+        call_site: str = "bedrock",
+        priority: LLMPriority = LLMPriority.INTERACTIVE,
+        max_tokens: int = 512,
+        role: str | None = None,
+    ) -> str:
+        model_id = self.router.resolve(model_id, role)
+        async with self.gateway.acquire(priority=priority):
+            started = time.perf_counter()
+            try:
+                response = await self.client.converse(
+                    modelId=model_id,
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": [{"text": prompt}],
+                        }
+                    ],
+                    system=self._system_blocks(system),
+                    inferenceConfig={
+                        "maxTokens": max_tokens,
+                        "temperature": 0.2,
+                    },
+                )
+            except Exception:
+                self.router.record(model_id, (time.perf_counter() - started) * 1000, ok=False)
+                raise
+            self.router.record(model_id, (time.perf_counter() - started) * 1000, ok=True)
+        self.accounting.record_bedrock(call_site, response.get("usage"))
         return self._extract_text(response)
 
     @staticmethod
-    def _build_history_prompt(text: str, recent_context: list[str] | None) -> str:
-        lines = [
-            "You are a translator. Translate English to natural Korean.",
-            "Use context for coherence but translate only the current line.",
-            "If the line is unclear or incomplete, make the best possible inference.",
-            "Never ask questions, request more context, or mention language selection.",
-            "Respond in Korean only, without quotes or extra text.",
-        ]
+    def _system_blocks(system: str | Sequence[str] | None) -> list[dict[str, Any]] | None:
+        if not system:
+            return None
+        parts = [system] if isinstance(system, str) else [part for part in system if part]
+        return [{"text": part} for part in parts]
+
+    async def _submit_segment(
+        self,
+        model_id: str,
+        text: str,
+        recent_context: list[str] | None,
+        references: list[tuple[str, str]] | None,
+        glossary: list[tuple[str, str]] | None,
+    ) -> str | None:
+        if self.micro_batcher is None:
+            return None
+        request = _SegmentRequest(
+            text, list(recent_context or []), list(references or []), list(glossary or [])
+        )
+        return await self.micro_batcher.submit(model_id, request)
+
+    async def _translate_segment_batch(self, model_id: str, items: list[_SegmentRequest]) -> list[str | None]:
+        if len(items) == 1:
+            item = items[0]
+            response = await self._invoke_model(
+                model_id,
+                self._build_history_prompt(
+                    item.text, item.recent_context, item.references, item.glossary
+                ),
+                system=_HISTORY_SYSTEM_PROMPT,
+                call_site="translation.micro_batch",
+            )
+            return [response.strip()]
+        response = await self._invoke_model(
+            model_id,
+            self._build_batch_prompt(items),
+            system=_BATCH_SYSTEM_PROMPT,
+            call_site="translation.micro_batch",
+            max_tokens=256 * len(items) + 256,
+        )
+        return self._parse_indexed_translations(response, len(items))
+
+    async def _invoke_hedged(
+        self,
+        call_class: str,
+        model_id: str,
+        prompt: str,
+        *,
+        system: str,
+        call_site: str,
+    ) -> str:
+        """Invoke `model_id`, hedging to the fast model once the class's latency budget is spent.
+
+        A call already on the fast model is never hedged: racing a model
+        against itself only doubles the calls.
+        """
+        budget_ms = getattr(self.settings, f"translation_hedge_{call_class}_ms")
+        fast_model_id = self.settings.bedrock_translation_fast_model_id
+        if budget_ms <= 0 or model_id == fast_model_id:
+            return await self._invoke_model(model_id, prompt, system=system, call_site=call_site)
+        stats = self.hedge_stats[call_class]
+        hedged_before, wins_before = stats.hedged, stats.hedge_wins
+        try:
+            return await hedged_call(
+                lambda: self._invoke_model(model_id, prompt, system=system, call_site=call_site),
+                lambda: self._invoke_model(fast_model_id, prompt, system=system, call_site=call_site),
+                budget_s=budget_ms / 1000,
+                stats=stats,
+                allow_hedge=lambda: not self.gateway.saturated,
+            )
+        finally:
+            self._log_hedge(call_class, hedged_before, wins_before)
+
+    def _log_hedge(self, call_class: str, hedged_before: int, wins_before: int) -> None:
+        stats = self.hedge_stats[call_class]
+        if stats.hedged == hedged_before:
+            return
+        log_event(
+            logger,
+            "translation.hedge",
+            call_class=call_class,
+            winner="backup" if stats.hedge_wins > wins_before else "primary",
+            **stats.snapshot(),
+        )
+
+    async def _stream_model(
+        self,
+        model_id: str,
+        prompt: str,
+        *,
+        system: str | Sequence[str] | None = None,
+        call_site: str = "bedrock",
+        priority: LLMPriority = LLMPriority.INTERACTIVE,
+        role: str | None = None,
+    ) -> AsyncIterator[str]:
+        model_id = self.router.resolve(model_id, role)
+        async with self.gateway.acquire(priority=priority):
+            started = time.perf_counter()
+            events = self.client.converse_stream(
+                modelId=model_id,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": [{"text": prompt}],
+                    }
+                ],
+                system=self._system_blocks(system),
+                inferenceConfig={
+                    "maxTokens": 512,
+                    "temperature": 0.2,
+                },
+            )
+            try:
+                async for event in events:
+                    if "metadata" in event:
+                        self.accounting.record_bedrock(call_site, event["metadata"].get("usage"))
+                        continue
+                    delta = (event.get("contentBlockDelta") or {}).get("delta") or {}
+                    if delta.get("text"):
+                        yield str(delta["text"])
+            except Exception:
+                self.router.record(model_id, (time.perf_counter() - started) * 1000, ok=False)
+                raise
+            self.router.record(model_id, (time.perf_counter() - started) * 1000, ok=True)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    @staticmethod
+    def _build_history_prompt(
+        text: str,
+        recent_context: list[str] | None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> str:
+        lines: list[str] = []
+        if glossary:
+            lines.append("Glossary: " + "; ".join(f"{source}={target}" for source, target in glossary))
+        if references:
+            lines.append("Reference translations:")
+            lines.extend(f"- \"{source}\" => \"{translated}\"" for source, translated in references)
         if recent_context:
             lines.append("Recent context:")
             lines.extend(f"- {entry}" for entry in recent_context)
         lines.append(f"Current line: \"{text}\"")
-        lines.append("Return only the translation.")
         return "\n".join(lines)
 
+    @staticmethod
+    def _build_quick_prompt(
+        text: str,
+        recent_context: list[str] | None,
+        glossary: list[tuple[str, str]] | None,
+    ) -> str:
+        if not recent_context and not glossary:
+            return text
+        lines: list[str] = []
+        if glossary:
+            lines.append("Glossary: " + "; ".join(f"{target}={source}" for source, target in glossary))
+        if recent_context:
+            lines.append("Meeting context:")
+            lines.extend(f"- {entry}" for entry in recent_context)
+        lines.append(f"Text: \"{text}\"")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _build_revision_prompt(text: str, draft_source: str, draft_translation: str) -> str:
+        return "\n".join(
+            [
+                f"Earlier English: \"{draft_source}\"",
+                f"Korean draft: \"{draft_translation}\"",
+                f"Final English: \"{text}\"",
+            ]
+        )
+
+    @staticmethod
+    def _build_batch_prompt(items: list[_SegmentRequest]) -> str:
+        entries = []
+        for index, item in enumerate(items):
+            entry: dict[str, Any] = {"id": index, "en": item.text}
+            if item.recent_context:
+                entry["context"] = item.recent_context
+            if item.references:
+                entry["references"] = [{"en": source, "ko": translated} for source, translated in item.references]
+            if item.glossary:
+                entry["glossary"] = dict(item.glossary)
+            entries.append(entry)
+        return "Items:\n" + json.dumps(entries, ensure_ascii=False)
+
+    @staticmethod
+    def _build_correction_prompt(items: list[CorrectionItem]) -> str:
+        lines: list[str] = []
+        glossary = dict(term for item in items for term in item.glossary)
+        if glossary:
+            lines.append("Glossary: " + "; ".join(f"{source}={target}" for source, target in glossary.items()))
+        context = items[0].recent_context
+        if context:
+            lines.append("Recent context:")
+            lines.extend(f"- {entry}" for entry in context)
+        lines.append("Items:")
+        lines.append(
+            json.dumps(
+                [
+                    {"id": index, "en": item.source_text, "draft": item.draft_translation}
+                    for index, item in enumerate(items)
+                ],
+                ensure_ascii=False,
+            )
+        )
+        return "\n".join(lines)
+
+    @staticmethod
+    def _parse_indexed_translations(response: str, count: int) -> list[str | None]:
+        results: list[str | None] = [None] * count
+        match = re.search(r"\[.*\]", response, re.DOTALL)
+        if not match:
+            return results
+        try:
+            data = json.loads(match.group(0))
+        except json.JSONDecodeError:
+            return results
+        if not isinstance(data, list):
+            return results
+        for entry in data:
+            if not isinstance(entry, dict):
+                continue
+            index = entry.get("id")
+            text = str(entry.get("ko") or "").strip()
+            if isinstance(index, int) and 0 <= index < count and text:
+                results[index] = text
+        return results
+
     @staticmethod
     def _extract_text(response: dict[str, Any]) -> str:
         if "output" in response:
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Hashable
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Generic, TypeVar
+
+from app.core.logging import log_event
+
+logger = logging.getLogger(__name__)
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+
+@dataclass(slots=True)
+class _PendingBatch(Generic[ItemT, ResultT]):
+    items: list[ItemT] = field(default_factory=list)
+    futures: list[asyncio.Future[ResultT | None]] = field(default_factory=list)
+    timer: asyncio.TimerHandle | None = None
+
+
+@dataclass(slots=True)
+class MicroBatchStats:
+    batches: int = 0
+    items: int = 0
+    max_size: int = 0
+
+    @property
+    def avg_size(self) -> float:
+        return self.items / self.batches if self.batches else 0.0
+
+
+class MicroBatcher(Generic[ItemT, ResultT]):
+    """Merges calls that arrive within `window_s` of each other into one batch per key.
+
+    `run_batch` returns one result per item, in order; None means the item has
+    to be retried on its own. A batch is sent early once it holds `max_batch`
+    items, so the added latency never exceeds the window.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[Hashable, list[ItemT]], Awaitable[list[ResultT | None]]],
+        *,
+        window_s: float,
+        max_batch: int,
+        name: str = "micro_batch",
+    ) -> None:
+        self._run_batch = run_batch
+        self.window_s = window_s
+        self.max_batch = max(1, max_batch)
+        self.name = name
+        self.stats = MicroBatchStats()
+        self._pending: dict[Hashable, _PendingBatch[ItemT, ResultT]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, key: Hashable, item: ItemT) -> ResultT | None:
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _PendingBatch()
+            batch.timer = loop.call_later(self.window_s, self._flush, key)
+        future: asyncio.Future[ResultT | None] = loop.create_future()
+        batch.items.append(item)
+        batch.futures.append(future)
+        if len(batch.items) >= self.max_batch:
+            self._flush(key)
+        return await future
+
+    def _flush(self, key: Hashable) -> None:
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        # Callers that gave up while waiting do not need a slot in the request.
+        live = [(item, future) for item, future in zip(batch.items, batch.futures) if not future.done()]
+        if not live:
+            return
+        task = asyncio.ensure_future(self._execute(key, live))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _execute(
+        self,
+        key: Hashable,
+        live: list[tuple[ItemT, asyncio.Future[ResultT | None]]],
+    ) -> None:
+        items = [item for item, _ in live]
+        self.stats.batches += 1
+        self.stats.items += len(items)
+        self.stats.max_size = max(self.stats.max_size, len(items))
+        try:
+            results = await self._run_batch(key, items)
+        except Exception as exc:
+            for _, future in live:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        if len(items) > 1:
+            log_event(
+                logger,
+                f"translation.{self.name}",
+                key=str(key),
+                batch_size=len(items),
+                calls_saved=len(items) - 1,
+                avg_batch_size=round(self.stats.avg_size, 2),
+            )
+        for index, (_, future) in enumerate(live):
+            if not future.done():
+                future.set_result(results[index] if index < len(results) else None)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Generic, Literal, TypeVar
+
+ResultT = TypeVar("ResultT")
+CacheStatus = Literal["HIT", "MISS", "COALESCED"]
+
+
+@dataclass(slots=True)
+class CoalescingStats:
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        total = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "upstream_saved_ratio": round((self.hits + self.coalesced) / total, 3) if total else 0.0,
+        }
+
+
+class CoalescingCache(Generic[ResultT]):
+    """Single-flight plus a short-lived result cache.
+
+    Concurrent callers with the same key share one upstream call; its result
+    is then served from memory for `ttl_s`. Failures are shared with the
+    callers already waiting but never cached. The upstream call runs in its own
+    task, so a caller that disconnects does not cancel it for the others.
+    """
+
+    def __init__(self, *, ttl_s: float, max_entries: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self.ttl_s = ttl_s
+        self.max_entries = max(1, max_entries)
+        self.stats = CoalescingStats()
+        self._clock = clock
+        self._results: OrderedDict[Hashable, tuple[float, ResultT]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task[ResultT]] = {}
+
+    def get(self, key: Hashable) -> ResultT | None:
+        """The fresh cached value for `key` (counted as a hit), or None."""
+        cached = self._results.get(key)
+        if cached is None:
+            return None
+        expires_at, value = cached
+        if expires_at <= self._clock():
+            del self._results[key]
+            return None
+        self._results.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: ResultT) -> None:
+        if self.ttl_s <= 0:
+            return
+        self._results[key] = (self._clock() + self.ttl_s, value)
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def get_or_run(
+        self, key: Hashable, run: Callable[[], Awaitable[ResultT]]
+    ) -> tuple[ResultT, CacheStatus]:
+        cached = self.get(key)
+        if cached is not None:
+            return cached, "HIT"
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats.coalesced += 1
+            return await asyncio.shield(task), "COALESCED"
+        self.stats.misses += 1
+        task = asyncio.ensure_future(run())
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._on_done(key, done))
+        return await asyncio.shield(task), "MISS"
+
+    def _on_done(self, key: Hashable, task: asyncio.Task[ResultT]) -> None:
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self.put(key, task.result())
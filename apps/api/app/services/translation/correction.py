@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class CorrectionItem:
+    segment_id: int
+    source_ts: int
+    speaker: str
+    source_text: str
+    draft_translation: str
+    recent_context: list[str] = field(default_factory=list)
+    glossary: list[tuple[str, str]] = field(default_factory=list)
+
+
+class CorrectionBatcher:
+    """Collects drafted finals and sends them to the high model together.
+
+    A batch is flushed `window_s` after its first item or as soon as it holds
+    `max_batch` items. `correct` returns one entry per item (None when the
+    model had nothing to offer); `on_corrected` is called for each result.
+    """
+
+    def __init__(
+        self,
+        correct: Callable[[list[CorrectionItem]], Awaitable[list[str | None]]],
+        on_corrected: Callable[[CorrectionItem, str], Awaitable[None]],
+        *,
+        window_s: float,
+        max_batch: int,
+    ) -> None:
+        self._correct = correct
+        self._on_corrected = on_corrected
+        self.window_s = window_s
+        self.max_batch = max(1, max_batch)
+        self._pending: list[CorrectionItem] = []
+        self._timer: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def add(self, item: CorrectionItem) -> None:
+        self._pending.append(item)
+        if len(self._pending) >= self.max_batch:
+            self._flush_now()
+        elif self._timer is None:
+            self._timer = self._spawn(self._flush_after_window())
+
+    async def aclose(self) -> None:
+        self._pending.clear()
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+
+    async def _flush_after_window(self) -> None:
+        await asyncio.sleep(self.window_s)
+        self._timer = None
+        await self._run(self._take())
+
+    def _flush_now(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._spawn(self._run(self._take()))
+
+    def _take(self) -> list[CorrectionItem]:
+        batch, self._pending = self._pending[: self.max_batch], self._pending[self.max_batch :]
+        if self._pending and self._timer is None:
+            self._timer = self._spawn(self._flush_after_window())
+        return batch
+
+    async def _run(self, batch: list[CorrectionItem]) -> None:
+        if not batch:
+            return
+        try:
+            results = await self._correct(batch)
+        except Exception:
+            logger.exception("Translation correction batch failed")
+            return
+        for item, corrected in zip(batch, results):
+            if corrected:
+                await self._on_corrected(item, corrected)
+
+    def _spawn(self, coro: Awaitable[None]) -> asyncio.Task:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import multiprocessing
+import time
+from collections.abc import Hashable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Literal
+
+from app.core.config import Settings
+from app.core.logging import log_event
+
+from . import TranslationServiceProtocol
+from .batching import MicroBatcher
+from .correction import CorrectionItem
+
+logger = logging.getLogger(__name__)
+
+Direction = Literal["en-ko", "ko-en"]
+LOCAL_CALL_CLASSES = ("quick", "partial", "draft", "final")
+_MAX_DECODING_LENGTH = 256
+
+# Loaded once per worker process by `_init_worker`.
+_WORKER_MODELS: dict[str, tuple[Any, Any, Any, list[str]]] = {}
+
+
+def _init_worker(model_specs: dict[str, tuple[str, str]], threads: int) -> None:
+    import ctranslate2
+    import sentencepiece
+
+    for direction, (path, source_prefix) in model_specs.items():
+        model_dir = Path(path)
+        translator = ctranslate2.Translator(
+            str(model_dir),
+            device="cpu",
+            compute_type="int8",
+            inter_threads=1,
+            intra_threads=threads,
+        )
+        source = sentencepiece.SentencePieceProcessor(model_file=str(model_dir / "source.spm"))
+        target = sentencepiece.SentencePieceProcessor(model_file=str(model_dir / "target.spm"))
+        _WORKER_MODELS[direction] = (translator, source, target, source_prefix.split())
+
+
+def _warm_worker() -> int:
+    return len(_WORKER_MODELS)
+
+
+def _translate_in_worker(direction: str, texts: list[str], beam_size: int) -> list[str]:
+    translator, source, target, prefix = _WORKER_MODELS[direction]
+    tokens = [[*prefix, *source.encode(text, out_type=str), "</s>"] for text in texts]
+    results = translator.translate_batch(
+        tokens,
+        beam_size=beam_size,
+        max_batch_size=len(tokens),
+        max_decoding_length=_MAX_DECODING_LENGTH,
+    )
+    return [target.decode(result.hypotheses[0]).strip() for result in results]
+
+
+class LocalTranslationService:
+    """CPU-only machine translation with CTranslate2-converted Marian models.
+
+    Inference runs in a process pool so decoding never blocks the event loop;
+    requests that arrive within `LOCAL_MT_BATCH_WINDOW_MS` of each other are
+    decoded as one batch per direction. Context, references and glossary are
+    accepted for protocol compatibility but not used by the model.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        executor: Executor | None = None,
+        translate_batch: Callable[[str, list[str], int], list[str]] = _translate_in_worker,
+    ) -> None:
+        self.settings = settings
+        model_specs = {
+            direction: (path, prefix)
+            for direction, path, prefix in (
+                ("en-ko", settings.local_mt_en_ko_model_path, settings.local_mt_en_ko_source_prefix),
+                ("ko-en", settings.local_mt_ko_en_model_path, ""),
+            )
+            if path
+        }
+        self.directions = set(model_specs)
+        if executor is None:
+            missing = [name for name in ("ctranslate2", "sentencepiece") if importlib.util.find_spec(name) is None]
+            if missing:
+                raise RuntimeError(
+                    f"Local MT needs {', '.join(missing)}; install the api package with the local-mt extra"
+                )
+            # Spawned (not forked) workers: the API process already runs threads.
+            executor = ProcessPoolExecutor(
+                max_workers=settings.local_mt_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(model_specs, settings.local_mt_threads_per_worker),
+            )
+            # Load the models now rather than on the first request.
+            for _ in range(settings.local_mt_workers):
+                executor.submit(_warm_worker)
+        self.executor = executor
+        self._translate_batch = translate_batch
+        self.batcher: MicroBatcher[str, str] = MicroBatcher(
+            self._run_batch,
+            window_s=settings.local_mt_batch_window_ms / 1000,
+            max_batch=settings.local_mt_max_batch,
+            name="local_batch",
+        )
+
+    async def translate(self, text: str, direction: Direction) -> str:
+        if direction not in self.directions:
+            raise RuntimeError(f"No local MT model configured for {direction}")
+        result = await self.batcher.submit(direction, text)
+        return result or ""
+
+    async def translate_en_to_ko(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> str:
+        return await self.translate(text, "en-ko")
+
+    async def translate_en_to_ko_history(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> str:
+        return await self.translate(text, "en-ko")
+
+    async def stream_en_to_ko_history(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> AsyncIterator[str]:
+        yield await self.translate(text, "en-ko")
+
+    async def translate_en_to_ko_draft(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> str:
+        return await self.translate(text, "en-ko")
+
+    async def stream_en_to_ko_draft(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> AsyncIterator[str]:
+        yield await self.translate(text, "en-ko")
+
+    async def correct_en_to_ko_batch(self, items: list[CorrectionItem]) -> list[str | None]:
+        return [None] * len(items)
+
+    async def revise_en_to_ko(self, text: str, draft_source: str, draft_translation: str) -> str:
+        return await self.translate(text, "en-ko")
+
+    async def translate_ko_to_en(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> str:
+        return await self.translate(text, "ko-en")
+
+    async def aclose(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run_batch(self, direction: Hashable, texts: list[str]) -> list[str | None]:
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        results = await loop.run_in_executor(
+            self.executor,
+            self._translate_batch,
+            str(direction),
+            texts,
+            self.settings.local_mt_beam_size,
+        )
+        log_event(
+            logger,
+            "translation.local_mt",
+            direction=str(direction),
+            batch_size=len(texts),
+            latency_ms=int((time.perf_counter() - started) * 1000),
+            sample_rate=0.1,
+        )
+        return list(results)
+
+
+class HybridTranslationService:
+    """Sends the selected call classes to local MT and everything else to the primary provider.
+
+    Call classes: "quick" (KO→EN quick translate), "partial" (all Composing
+    translations: closed sentences and the open remainder), "draft" (fast
+    final drafts) and "final" (history-aware finals and revisions).
+    Background corrections always use the primary.
+    """
+
+    def __init__(
+        self,
+        primary: TranslationServiceProtocol,
+        local: LocalTranslationService,
+        call_classes: set[str],
+    ) -> None:
+        needed = {"ko-en" if call_class == "quick" else "en-ko" for call_class in call_classes}
+        if needed - local.directions:
+            raise ValueError(
+                f"LOCAL_MT_CALL_CLASSES needs local models for: {', '.join(sorted(needed - local.directions))}"
+            )
+        self.primary = primary
+        self.local = local
+        self.call_classes = call_classes
+
+    def _pick(self, call_class: str) -> TranslationServiceProtocol:
+        return self.local if call_class in self.call_classes else self.primary
+
+    async def translate_en_to_ko(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> str:
+        return await self._pick("partial").translate_en_to_ko(text, recent_context, glossary)
+
+    async def translate_en_to_ko_history(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> str:
+        return await self._pick("final").translate_en_to_ko_history(text, recent_context, references, glossary)
+
+    async def stream_en_to_ko_history(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> AsyncIterator[str]:
+        async for delta in self._pick("final").stream_en_to_ko_history(text, recent_context, references, glossary):
+            yield delta
+
+    async def translate_en_to_ko_draft(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> str:
+        return await self._pick("draft").translate_en_to_ko_draft(text, recent_context, references, glossary)
+
+    async def stream_en_to_ko_draft(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> AsyncIterator[str]:
+        async for delta in self._pick("draft").stream_en_to_ko_draft(text, recent_context, references, glossary):
+            yield delta
+
+    async def correct_en_to_ko_batch(self, items: list[CorrectionItem]) -> list[str | None]:
+        return await self.primary.correct_en_to_ko_batch(items)
+
+    async def revise_en_to_ko(self, text: str, draft_source: str, draft_translation: str) -> str:
+        return await self._pick("final").revise_en_to_ko(text, draft_source, draft_translation)
+
+    async def translate_ko_to_en(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> str:
+        return await self._pick("quick").translate_ko_to_en(text, recent_context, glossary)
+
+    async def aclose(self) -> None:
+        await self.local.aclose()
+        aclose = getattr(self.primary, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "primary":
+            raise AttributeError(name)
+        # Provider extras (hedge_snapshot, micro_batcher, ...) come from the primary.
+        return getattr(self.primary, name)
+
+
+def parse_call_classes(value: str) -> set[str]:
+    classes = {item.strip().lower() for item in value.split(",") if item.strip()}
+    unknown = classes - set(LOCAL_CALL_CLASSES)
+    if unknown:
+        raise ValueError(f"Unknown LOCAL_MT_CALL_CLASSES: {', '.join(sorted(unknown))}")
+    return classes
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import random
+import re
+import sqlite3
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Literal
+
+from app.core.config import Settings
+
+# "?" and "!" stay: "Is it deployed?" and "It is deployed." need different translations.
+_NORMALIZE_STRIP_RE = re.compile(r"[^\w\s'?!]+")
+_DIGITS_RE = re.compile(r"\d+")
+_TERMINAL_PUNCT_RE = re.compile(r"[?!]")
+_SHINGLE_SIZE = 3
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    source_norm TEXT NOT NULL UNIQUE,
+    source_text TEXT NOT NULL,
+    translated_text TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bands (
+    band INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    entry_id INTEGER NOT NULL REFERENCES entries(id) ON DELETE CASCADE,
+    PRIMARY KEY (band, bucket, entry_id)
+) WITHOUT ROWID;
+"""
+
+
+@dataclass(slots=True)
+class MemoryMatch:
+    kind: Literal["exact", "fuzzy", "reference"]
+    similarity: float
+    source_text: str
+    translated_text: str
+
+
+class MinHasher:
+    """MinHash signatures over character shingles, split into LSH bands."""
+
+    def __init__(self, num_perm: int = 48, bands: int = 16, seed: int = 1) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        rng = random.Random(seed)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(num_perm)
+        ]
+
+    def signature(self, normalized: str) -> list[int]:
+        hashes = [_stable_hash(shingle) for shingle in _shingles(normalized)]
+        return [
+            min(((a * value + b) % _MERSENNE_PRIME) & _MAX_HASH for value in hashes)
+            for a, b in self._perms
+        ]
+
+    def band_buckets(self, signature: list[int]) -> list[int]:
+        buckets = []
+        for band in range(self.bands):
+            rows = signature[band * self.rows : (band + 1) * self.rows]
+            digest = hashlib.blake2b(struct.pack(f"<{len(rows)}I", *rows), digest_size=8).digest()
+            buckets.append(int.from_bytes(digest, "little", signed=True))
+        return buckets
+
+
+class TranslationMemory:
+    """Disk-backed EN→KO translation memory with MinHash/LSH near-duplicate lookup.
+
+    Exact matches and near-identical matches (same numbers and "?"/"!",
+    similarity at or above `serve_similarity`) can be served without an LLM call; weaker
+    matches down to `reference_similarity` are returned as references for the
+    prompt.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        serve_similarity: float = 0.95,
+        reference_similarity: float = 0.6,
+        max_candidates: int = 20,
+        hasher: MinHasher | None = None,
+    ) -> None:
+        self.path = str(path)
+        self.serve_similarity = serve_similarity
+        self.reference_similarity = reference_similarity
+        self.max_candidates = max_candidates
+        self.hasher = hasher or MinHasher()
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_SCHEMA)
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "TranslationMemory | None":
+        if not settings.translation_memory_path:
+            return None
+        return cls(
+            settings.translation_memory_path,
+            serve_similarity=settings.translation_memory_serve_similarity,
+            reference_similarity=settings.translation_memory_reference_similarity,
+        )
+
+    def lookup(self, source_text: str, *, references: int = 3) -> list[MemoryMatch]:
+        """Return the best matches, best first; the first may be servable as-is."""
+        normalized = _normalize(source_text)
+        if not normalized:
+            return []
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT source_text, translated_text FROM entries WHERE source_norm = ?",
+                (normalized,),
+            ).fetchone()
+            if row is not None:
+                return [MemoryMatch("exact", 1.0, row[0], row[1])]
+            candidates = self._candidates(normalized)
+        scored = []
+        for source_norm, candidate_source, translated in candidates:
+            similarity = SequenceMatcher(None, normalized, source_norm).ratio()
+            if similarity >= self.reference_similarity:
+                scored.append((similarity, source_norm, candidate_source, translated))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        matches = []
+        for similarity, source_norm, candidate_source, translated in scored[:references]:
+            servable = (
+                not matches
+                and similarity >= self.serve_similarity
+                and _DIGITS_RE.findall(source_norm) == _DIGITS_RE.findall(normalized)
+                and _TERMINAL_PUNCT_RE.findall(source_norm) == _TERMINAL_PUNCT_RE.findall(normalized)
+            )
+            matches.append(MemoryMatch("fuzzy" if servable else "reference", similarity, candidate_source, translated))
+        return matches
+
+    def record(self, source_text: str, translated_text: str) -> None:
+        normalized = _normalize(source_text)
+        translated_text = translated_text.strip()
+        if not normalized or not translated_text:
+            return
+        buckets = self.hasher.band_buckets(self.hasher.signature(normalized))
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO entries (source_norm, source_text, translated_text, updated_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(source_norm) DO UPDATE SET translated_text = excluded.translated_text, "
+                "source_text = excluded.source_text, updated_at = excluded.updated_at "
+                "RETURNING id",
+                (normalized, source_text.strip(), translated_text, time.time()),
+            )
+            entry_id = cursor.fetchone()[0]
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO bands (band, bucket, entry_id) VALUES (?, ?, ?)",
+                [(band, bucket, entry_id) for band, bucket in enumerate(buckets)],
+            )
+            self._conn.commit()
+
+    async def alookup(self, source_text: str, *, references: int = 3) -> list[MemoryMatch]:
+        return await asyncio.to_thread(self.lookup, source_text, references=references)
+
+    async def arecord(self, source_text: str, translated_text: str) -> None:
+        await asyncio.to_thread(self.record, source_text, translated_text)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0])
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _candidates(self, normalized: str) -> list[tuple[str, str, str]]:
+        buckets = self.hasher.band_buckets(self.hasher.signature(normalized))
+        clauses = " OR ".join("(band = ? AND bucket = ?)" for _ in buckets)
+        params: list[int] = [value for pair in enumerate(buckets) for value in pair]
+        return self._conn.execute(
+            "SELECT e.source_norm, e.source_text, e.translated_text FROM entries e "
+            f"JOIN (SELECT entry_id, COUNT(*) AS shared FROM bands WHERE {clauses} GROUP BY entry_id "
+            "ORDER BY shared DESC LIMIT ?) b ON b.entry_id = e.id",
+            (*params, self.max_candidates),
+        ).fetchall()
+
+
+def _normalize(text: str) -> str:
+    return " ".join(_NORMALIZE_STRIP_RE.sub(" ", text.lower()).split())
+
+
+def _shingles(normalized: str) -> set[str]:
+    padded = f" {normalized} "
+    if len(padded) <= _SHINGLE_SIZE:
+        return {padded}
+    return {padded[index : index + _SHINGLE_SIZE] for index in range(len(padded) - _SHINGLE_SIZE + 1)}
+
+
+def _stable_hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "little")
@@ -1,17 +1,45 @@
 from __future__ import annotations
 
+from typing import Any, AsyncIterator
+
 from openai import AsyncOpenAI
 
 from app.core.config import Settings
+from app.services.llm import LLMGateway, get_llm_gateway
+from app.services.llm.usage import TokenAccounting, get_token_accounting
+
+from .correction import CorrectionItem
 
 
 class OpenAITranslationService:
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        gateway: LLMGateway | None = None,
+        accounting: TokenAccounting | None = None,
+    ) -> None:
         self.settings = settings
         self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self.gateway = gateway or get_llm_gateway(settings)
+        self.accounting = accounting or get_token_accounting()
 
-    async def translate_en_to_ko(self, text: str) -> str:
-        response = await self.client.chat.completions.create(
+    async def translate_en_to_ko(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> str:
+        if recent_context or glossary:
+            response = await self._complete(
+                "translation.partial",
+                model=self.settings.openai_translation_model,
+                messages=self._build_history_messages(text, recent_context, None, glossary),
+                temperature=0.2,
+                max_tokens=512,
+            )
+            return response.choices[0].message.content.strip()
+        response = await self._complete(
+            "translation.partial",
             model=self.settings.openai_translation_model,
             messages=[
                 {
@@ -33,41 +61,167 @@ class OpenAITranslationService:
         self,
         text: str,
         recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
     ) -> str:
-        system_prompt = (
-            "You are a translator. Translate English to natural Korean. "
-            "Use context for coherence but translate only the current line. "
-            "If the line is unclear or incomplete, make the best possible inference. "
-            "Never ask questions, request more context, or mention language selection. "
-            "Respond in Korean only, without quotes or extra text. Return only the translation."
+        response = await self._complete(
+            "translation.history",
+            model=self.settings.openai_translation_model,
+            messages=self._build_history_messages(text, recent_context, references, glossary),
+            temperature=0.2,
+            max_tokens=512,
         )
-        user_lines: list[str] = []
-        if recent_context:
-            user_lines.append("Recent context:")
-            user_lines.extend(f"- {entry}" for entry in recent_context)
-        user_lines.append(f"Current line: \"{text}\"")
-        response = await self.client.chat.completions.create(
+        return response.choices[0].message.content.strip()
+
+    async def stream_en_to_ko_history(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> AsyncIterator[str]:
+        async with self.gateway.acquire():
+            stream = await self.client.chat.completions.create(
+                model=self.settings.openai_translation_model,
+                messages=self._build_history_messages(text, recent_context, references, glossary),
+                temperature=0.2,
+                max_tokens=512,
+                stream=True,
+                stream_options={"include_usage": True},
+                extra_body={"prompt_cache_key": "translation.final"},
+            )
+            async for chunk in stream:
+                if getattr(chunk, "usage", None) is not None:
+                    self.accounting.record_openai("translation.final", chunk.usage)
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+    async def translate_en_to_ko_draft(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> str:
+        return await self.translate_en_to_ko_history(text, recent_context, references, glossary)
+
+    async def stream_en_to_ko_draft(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> AsyncIterator[str]:
+        async for delta in self.stream_en_to_ko_history(text, recent_context, references, glossary):
+            yield delta
+
+    async def correct_en_to_ko_batch(self, items: list[CorrectionItem]) -> list[str | None]:
+        # A single model backs both tiers, so a second pass would only repeat the draft.
+        return [None] * len(items)
+
+    async def revise_en_to_ko(
+        self,
+        text: str,
+        draft_source: str,
+        draft_translation: str,
+    ) -> str:
+        response = await self._complete(
+            "translation.revise",
             model=self.settings.openai_translation_model,
             messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": "\n".join(user_lines)},
+                {
+                    "role": "system",
+                    "content": (
+                        "You are a translator. A Korean draft was made from an earlier version of an English line. "
+                        "Minimally edit the draft so it matches the final English line. "
+                        "Respond in Korean only, without quotes or extra text."
+                    ),
+                },
+                {
+                    "role": "user",
+                    "content": (
+                        f"Earlier English: \"{draft_source}\"\n"
+                        f"Korean draft: \"{draft_translation}\"\n"
+                        f"Final English: \"{text}\""
+                    ),
+                },
             ],
             temperature=0.2,
             max_tokens=512,
         )
         return response.choices[0].message.content.strip()
 
-    async def translate_ko_to_en(self, text: str) -> str:
-        response = await self.client.chat.completions.create(
+    async def translate_ko_to_en(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> str:
+        user_lines: list[str] = []
+        if glossary:
+            user_lines.append("Glossary: " + "; ".join(f"{target}={source}" for source, target in glossary))
+        if recent_context:
+            user_lines.append("Meeting context:")
+            user_lines.extend(f"- {entry}" for entry in recent_context)
+        response = await self._complete(
+            "translation.quick",
             model=self.settings.openai_translation_model,
             messages=[
                 {
                     "role": "system",
-                    "content": "You are a translator. Translate Korean to natural English. Return only the translation.",
+                    "content": (
+                        "You are a translator. Translate Korean to natural English. "
+                        "When the message also has meeting context or a glossary, translate only the \"Text\" line; "
+                        "use the context for tone and the glossary's English terms for its Korean terms. "
+                        "Return only the translation."
+                    ),
                 },
-                {"role": "user", "content": text},
+                {"role": "user", "content": "\n".join([*user_lines, f"Text: \"{text}\""]) if user_lines else text},
             ],
             temperature=0.2,
             max_tokens=512,
         )
         return response.choices[0].message.content.strip()
+
+    async def _complete(self, call_site: str, **kwargs: Any) -> Any:
+        # The static system message leads every request, so OpenAI's automatic
+        # prefix caching applies; the cache key keeps a call site on one shard.
+        async with self.gateway.acquire():
+            response = await self.client.chat.completions.create(
+                **kwargs,
+                extra_body={"prompt_cache_key": call_site},
+            )
+        self.accounting.record_openai(call_site, getattr(response, "usage", None))
+        return response
+
+    @staticmethod
+    def _build_history_messages(
+        text: str,
+        recent_context: list[str] | None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> list[dict[str, str]]:
+        system_prompt = (
+            "You are a translator. Translate English to natural Korean. "
+            "Use context for coherence but translate only the current line. "
+            "When reference translations are given, reuse their wording and terminology where they fit. "
+            "Translate glossary terms exactly as the glossary gives them. "
+            "If the line is unclear or incomplete, make the best possible inference. "
+            "Wrap key terms (technical terms, proper nouns, important concepts) with **word**. "
+            "Never ask questions, request more context, or mention language selection. "
+            "Respond in Korean only, without quotes or extra text. Return only the translation."
+        )
+        user_lines: list[str] = []
+        if glossary:
+            user_lines.append("Glossary: " + "; ".join(f"{source}={target}" for source, target in glossary))
+        if references:
+            user_lines.append("Reference translations:")
+            user_lines.extend(f"- \"{source}\" => \"{translated}\"" for source, translated in references)
+        if recent_context:
+            user_lines.append("Recent context:")
+            user_lines.extend(f"- {entry}" for entry in recent_context)
+        user_lines.append(f"Current line: \"{text}\"")
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": "\n".join(user_lines)},
+        ]
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, AsyncIterator, Coroutine, Hashable
+
+
+class TranslationPriority(IntEnum):
+    FINAL_DISPLAY = 0
+    PARTIAL = 1
+
+
+@dataclass(slots=True)
+class QueueWaitStats:
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    cancelled: int = 0
+
+    def record(self, wait_ms: float) -> None:
+        self.count += 1
+        self.total_ms += wait_ms
+        self.max_ms = max(self.max_ms, wait_ms)
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+
+@dataclass(slots=True)
+class _Job:
+    priority: TranslationPriority
+    group: Hashable | None
+    task: asyncio.Task
+
+
+class TranslationScheduler:
+    """Per-session translation slots granted by priority, FIFO within a priority.
+
+    Jobs submitted with a `group` (the segment id) can be cancelled as a whole
+    once the segment is superseded, whether they are still queued or running.
+    """
+
+    def __init__(self, max_concurrency: int = 2) -> None:
+        self.max_concurrency = max_concurrency
+        self.wait_stats = {priority: QueueWaitStats() for priority in TranslationPriority}
+        self._active = 0
+        self._seq = itertools.count()
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._jobs: dict[Hashable, _Job] = {}
+
+    @property
+    def saturated(self) -> bool:
+        return self._active >= self.max_concurrency
+
+    def submit(
+        self,
+        priority: TranslationPriority,
+        coro: Coroutine[Any, Any, None],
+        *,
+        key: Hashable,
+        group: Hashable | None = None,
+        replace: bool = False,
+    ) -> asyncio.Task | None:
+        """Start a job unless one with the same key is pending; `replace` cancels the old one instead."""
+        existing = self._jobs.get(key)
+        if existing is not None and not existing.task.done():
+            if not replace:
+                coro.close()
+                return None
+            existing.task.cancel()
+        task = asyncio.create_task(coro)
+        self._jobs[key] = _Job(priority=priority, group=group, task=task)
+        task.add_done_callback(lambda done, key=key: self._forget(key, done))
+        return task
+
+    def cancel_group(
+        self,
+        group: Hashable,
+        *,
+        min_priority: TranslationPriority = TranslationPriority.PARTIAL,
+    ) -> int:
+        cancelled = 0
+        for job in list(self._jobs.values()):
+            if job.group == group and job.priority >= min_priority and not job.task.done():
+                job.task.cancel()
+                self.wait_stats[job.priority].cancelled += 1
+                cancelled += 1
+        return cancelled
+
+    @asynccontextmanager
+    async def slot(self, priority: TranslationPriority) -> AsyncIterator[float]:
+        """Hold one translation slot; yields the queue wait in milliseconds."""
+        started = time.perf_counter()
+        await self._acquire(priority)
+        wait_ms = (time.perf_counter() - started) * 1000
+        self.wait_stats[priority].record(wait_ms)
+        try:
+            yield wait_ms
+        finally:
+            self._release()
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        return {
+            priority.name.lower(): {
+                "count": stats.count,
+                "avg_wait_ms": round(stats.avg_ms, 1),
+                "max_wait_ms": round(stats.max_ms, 1),
+                "cancelled": stats.cancelled,
+            }
+            for priority, stats in self.wait_stats.items()
+        }
+
+    async def _acquire(self, priority: TranslationPriority) -> None:
+        if self._active < self.max_concurrency and not self._waiters:
+            self._active += 1
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        entry = (int(priority), next(self._seq), future)
+        heapq.heappush(self._waiters, entry)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before cancellation; pass it on.
+                self._release()
+            elif entry in self._waiters:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            raise
+
+    def _release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._active -= 1
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        job = self._jobs.get(key)
+        if job is not None and job.task is task:
+            del self._jobs[key]
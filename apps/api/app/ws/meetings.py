@@ -4,6 +4,7 @@ import asyncio
 import contextlib
 import json
 import logging
+import re
 import time
 from typing import Any, AsyncIterator
 
@@ -16,27 +17,42 @@ from app.domain.models.events import (
     ErrorEvent,
     SessionStopEvent,
     SubtitleSegmentEvent,
+    SuggestionItem,
+    SuggestionsDeltaEvent,
     SuggestionsUpdateEvent,
+    SummaryDeltaEvent,
     SummaryUpdateEvent,
     TranscriptFinalEvent,
     TranscriptPartialEvent,
+    TranslationCorrectedEvent,
+    TranslationDeltaEvent,
     TranslationFinalEvent,
+    TranslateResultEvent,
 )
-from app.domain.models.session import MeetingSession
+from app.domain.models.session import MeetingSession, TranscriptEntry
+from app.domain.models.topic import SuggestionTrigger
 from app.domain.models.base import epoch_ms
 from app.domain.models.provider import TranscriptResult
 from app.domain.models.subtitle import SubtitleSegment
+from app.services.llm import current_llm_session, get_llm_gateway
 from app.services.stt import STTServiceProtocol, create_stt_service
 from app.services.suggestion import SuggestionService
-from app.services.summary import SummaryService
+from app.services.summary import RollingSummary, SummaryService
 from app.services.translation import TranslationServiceProtocol, create_translation_service
 from app.services.translation.aws import AWSTranslationService
+from app.services.translation.correction import CorrectionBatcher, CorrectionItem
+from app.services.translation.memory import MemoryMatch, TranslationMemory
+from app.services.translation.scheduler import TranslationPriority, TranslationScheduler
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 _HISTORY_CONTEXT_SENTENCES = 5
 _LOG_SAMPLE_PARTIAL = 0.05
 _LOG_SAMPLE_PING = 0.1
+_PARTIAL_REMAINDER_DEBOUNCE_S = 1.2
+_PARTIAL_REMAINDER_MIN_CHARS = 12
+_SUMMARY_REFRESH_MAX_WAITS = 5
+_KEY_TERM_RE = re.compile(r"\*\*(.+?)\*\*")
 
 @router.websocket("/ws/v1/meetings/{session_id}")
 async def meeting_ws(websocket: WebSocket, session_id: str) -> None:
@@ -71,15 +87,33 @@ async def meeting_ws(websocket: WebSocket, session_id: str) -> None:
     if summary_service is None:
         summary_service = SummaryService(bedrock_service, settings)
         websocket.app.state.summary_service = summary_service
-    session = MeetingSession(session_id)
+    if not hasattr(websocket.app.state, "translation_memory"):
+        websocket.app.state.translation_memory = TranslationMemory.from_settings(settings)
+    translation_memory: TranslationMemory | None = websocket.app.state.translation_memory
+    session = MeetingSession(
+        session_id,
+        SuggestionTrigger(
+            min_interval_s=settings.suggestions_min_interval_s,
+            novelty_threshold=settings.suggestions_novelty_threshold,
+        ),
+    )
+    # Tasks spawned below inherit this, so their LLM calls share one fair-queuing flow.
+    current_llm_session.set(session_id)
     transcribe_service = create_stt_service(settings)
     send_lock = asyncio.Lock()
     is_closing = False
     background_tasks: set[asyncio.Task] = set()
-    translation_semaphore = asyncio.Semaphore(2)
+    translation_scheduler = TranslationScheduler(max_concurrency=2)
     suggestion_semaphore = asyncio.Semaphore(1)
     summary_semaphore = asyncio.Semaphore(1)
-    partial_translation_tasks: dict[int, asyncio.Task] = {}
+    rolling_summary = RollingSummary(
+        summary_service,
+        window_chars=settings.summary_window_chars,
+        max_chunks=settings.summary_max_chunks,
+    )
+    summary_refresh: dict[str, asyncio.Task] = {}
+    quick_translations: dict[str, asyncio.Task] = {}
+    speculative_suggestions: dict[int, tuple[asyncio.Task, asyncio.Event]] = {}
 
     async def send_payload(payload: dict[str, Any]) -> None:
         if is_closing:
@@ -161,45 +195,93 @@ async def meeting_ws(websocket: WebSocket, session_id: str) -> None:
         source_text: str,
         segment_id: int,
         speaker: str,
+        *,
+        is_remainder: bool,
+        context: list[str] | None = None,
     ) -> None:
-        """Translate partial text for Composing area (async, non-blocking)."""
+        """Translate one closed sentence (once) or the open remainder (debounced) for Composing."""
         try:
             if is_closing:
                 return
-            
-            # Minimum length check to reduce noise
-            if len(source_text) < 30:
-                return
-            
-            # Debounce: wait 1.2s before translating
-            await asyncio.sleep(1.2)
-            
-            async with translation_semaphore:
+
+            if is_remainder:
+                # Debounce: the open remainder keeps changing while the speaker talks
+                await asyncio.sleep(_PARTIAL_REMAINDER_DEBOUNCE_S)
+
+            local = session.glossary.render(source_text)
+            async with translation_scheduler.slot(TranslationPriority.PARTIAL) as queue_wait_ms:
                 started = time.perf_counter()
                 try:
-                    translated = await translation_service.translate_en_to_ko(source_text)
+                    if local is not None:
+                        translated = local
+                    elif is_remainder:
+                        translated = await translation_service.translate_en_to_ko(source_text)
+                    else:
+                        # Fast model only: the final is translated again by the final-tier model.
+                        translated = await translation_service.translate_en_to_ko(
+                            source_text,
+                            context,
+                            glossary=session.glossary.relevant(source_text),
+                        )
                 except Exception:
                     logger.exception("Partial display translation failed")
                     return
-                
-                # Update display buffer with translation
-                display_buffer = session.get_display_buffer()
-                if display_buffer.current and display_buffer.current.segment_id == segment_id:
-                    display_buffer.current.translation = translated
+
+            if not session.record_sentence_translation(
+                segment_id, source_text, translated, is_remainder=is_remainder
+            ):
+                return
+            # Update display buffer with the composed translation
+            display_buffer = session.get_display_buffer()
+            current = display_buffer.current
+            if current and current.segment_id == segment_id:
+                composed = session.compose_partial_translation(segment_id, current.text)
+                if composed:
+                    current.translation = composed
                     await send_display_update()
-                    log_event(
-                        logger,
-                        "translation.partial_display",
-                        session_id=session_id,
-                        segment_id=segment_id,
-                        text_len=len(source_text),
-                        latency_ms=int((time.perf_counter() - started) * 1000),
-                    )
+            log_event(
+                logger,
+                "translation.partial_display",
+                session_id=session_id,
+                segment_id=segment_id,
+                unit="remainder" if is_remainder else "sentence",
+                text_len=len(source_text),
+                queue_wait_ms=int(queue_wait_ms),
+                latency_ms=int((time.perf_counter() - started) * 1000),
+            )
         except asyncio.CancelledError:
             pass
-        finally:
-            # Clean up task reference
-            partial_translation_tasks.pop(segment_id, None)
+
+    def schedule_partial_translations(caption_text: str, segment_id: int, speaker: str) -> None:
+        missing, remainder = session.plan_partial_translation(segment_id, caption_text)
+        for sentence in missing:
+            task = translation_scheduler.submit(
+                TranslationPriority.PARTIAL,
+                translate_partial_for_display(
+                    sentence,
+                    segment_id,
+                    speaker,
+                    is_remainder=False,
+                    context=session.closed_sentences_before(segment_id, caption_text, sentence),
+                ),
+                key=(segment_id, sentence),
+                group=segment_id,
+            )
+            if task is not None:
+                track_task(task)
+
+        if len(remainder) < _PARTIAL_REMAINDER_MIN_CHARS:
+            return
+        # Replacing the previous remainder job cancels it (debouncing)
+        task = translation_scheduler.submit(
+            TranslationPriority.PARTIAL,
+            translate_partial_for_display(remainder, segment_id, speaker, is_remainder=True),
+            key=(segment_id, None),
+            group=segment_id,
+            replace=True,
+        )
+        if task is not None:
+            track_task(task)
 
     async def translate_final_text(
         source_text: str,
@@ -208,15 +290,106 @@ async def meeting_ws(websocket: WebSocket, session_id: str) -> None:
         recent_context: list[str] | None = None,
         segment_id: int | None = None,
     ) -> None:
+        """Translate a final once and feed both display.update and translation.final."""
         if is_closing:
             return
-        async with translation_semaphore:
+        reuse = (
+            session.match_partial_translation(segment_id, source_text)
+            if segment_id is not None
+            else None
+        )
+        log_event(
+            logger,
+            "translation.partial_reuse",
+            session_id=session_id,
+            segment_id=segment_id,
+            outcome=reuse.kind if reuse else "miss",
+            similarity=round(reuse.similarity, 3) if reuse else None,
+            hit_rate=round(session.partial_reuse_stats.hit_rate, 3),
+        )
+        if reuse and reuse.kind == "exact":
+            await publish_final_translation(
+                source_text, ts, speaker, segment_id, reuse.translated_text, source="partial_reuse"
+            )
+            schedule_correction(source_text, ts, speaker, segment_id, reuse.translated_text, recent_context)
+            return
+        local = session.glossary.render(source_text)
+        if local is not None:
+            # Glossary-only utterances ("Kubernetes?") are rendered without an LLM call.
+            await publish_final_translation(source_text, ts, speaker, segment_id, local, source="glossary")
+            return
+        glossary = session.glossary.relevant(source_text)
+        references: list[tuple[str, str]] = []
+        if not reuse:
+            matches = await lookup_translation_memory(source_text, segment_id)
+            if matches and matches[0].kind != "reference":
+                await publish_final_translation(
+                    source_text,
+                    ts,
+                    speaker,
+                    segment_id,
+                    matches[0].translated_text,
+                    source="translation_memory",
+                )
+                return
+            references = [(match.source_text, match.translated_text) for match in matches]
+        two_tier = settings.translation_two_tier
+        if settings.translation_micro_batch_enabled and not reuse and translation_scheduler.saturated:
+            # Under load, skip the stream and join the provider's micro-batch instead of queueing.
+            translate = (
+                translation_service.translate_en_to_ko_draft
+                if two_tier
+                else translation_service.translate_en_to_ko_history
+            )
             started = time.perf_counter()
             try:
-                translated = await translation_service.translate_en_to_ko_history(
-                    source_text,
-                    recent_context,
+                translated = (await translate(source_text, recent_context, references, glossary)).strip()
+            except Exception:
+                logger.exception("Translation failed")
+                await send_event(
+                    ErrorEvent(code="BEDROCK_ERROR", message="Translation failed")
                 )
+                return
+            await publish_final_translation(
+                source_text,
+                ts,
+                speaker,
+                segment_id,
+                translated,
+                source="micro_batch",
+                latency_ms=int((time.perf_counter() - started) * 1000),
+            )
+            schedule_correction(source_text, ts, speaker, segment_id, translated, recent_context)
+            return
+        stream_translation = (
+            translation_service.stream_en_to_ko_draft if two_tier else translation_service.stream_en_to_ko_history
+        )
+        async with translation_scheduler.slot(TranslationPriority.FINAL_DISPLAY) as queue_wait_ms:
+            started = time.perf_counter()
+            first_delta_ms: int | None = None
+            parts: list[str] = []
+            try:
+                if reuse:
+                    parts.append(
+                        await translation_service.revise_en_to_ko(
+                            source_text,
+                            reuse.source_text,
+                            reuse.translated_text,
+                        )
+                    )
+                else:
+                    async for delta in stream_translation(source_text, recent_context, references, glossary):
+                        if first_delta_ms is None:
+                            first_delta_ms = int((time.perf_counter() - started) * 1000)
+                        parts.append(delta)
+                        await send_event(
+                            TranslationDeltaEvent(
+                                session_id=session_id,
+                                source_ts=ts,
+                                segment_id=segment_id,
+                                delta=delta.replace("*", ""),
+                            )
+                        )
             except Exception:
                 logger.exception("Translation failed")
                 await send_event(
@@ -224,25 +397,171 @@ async def meeting_ws(websocket: WebSocket, session_id: str) -> None:
                 )
                 return
 
-            session.add_translation(speaker, ts, source_text, translated)
+            translated = "".join(parts).strip()
+            await publish_final_translation(
+                source_text,
+                ts,
+                speaker,
+                segment_id,
+                translated,
+                source="partial_revise" if reuse else ("draft" if two_tier else "llm"),
+                first_delta_ms=first_delta_ms,
+                queue_wait_ms=int(queue_wait_ms),
+                latency_ms=int((time.perf_counter() - started) * 1000),
+            )
+        schedule_correction(source_text, ts, speaker, segment_id, translated, recent_context)
+
+    async def publish_final_translation(
+        source_text: str,
+        ts: int,
+        speaker: str,
+        segment_id: int | None,
+        display_translation: str,
+        *,
+        source: str,
+        first_delta_ms: int | None = None,
+        queue_wait_ms: int = 0,
+        latency_ms: int = 0,
+    ) -> None:
+        translated = _strip_key_term_markup(display_translation)
+        session.add_translation(speaker, ts, source_text, translated)
+        if segment_id is not None and session.set_display_translation(segment_id, display_translation):
+            await send_display_update()
+        log_event(
+            logger,
+            "translation.final",
+            session_id=session_id,
+            segment_id=segment_id,
+            text_len=len(source_text),
+            source=source,
+            first_delta_ms=first_delta_ms,
+            queue_wait_ms=queue_wait_ms,
+            latency_ms=latency_ms,
+        )
+        await send_event(
+            TranslationFinalEvent(
+                session_id=session_id,
+                source_ts=ts,
+                segment_id=segment_id,
+                speaker=speaker,
+                source_text=source_text,
+                translated_text=translated,
+            )
+        )
+        if source == "glossary":
+            return
+        learn_glossary_terms(source_text, display_translation)
+        # Only final-tier output is remembered; in two-tier mode drafts are
+        # remembered once the correction pass has checked them.
+        if not settings.translation_two_tier and source in {"llm", "micro_batch"}:
+            remember_translation(source_text, display_translation)
+
+    def learn_glossary_terms(source_text: str, translation: str) -> None:
+        learned = session.glossary.learn(source_text, translation)
+        if learned:
             log_event(
                 logger,
-                "translation.final",
+                "glossary.learned",
                 session_id=session_id,
+                terms=len(learned),
+                glossary_size=len(session.glossary),
+            )
+
+    async def lookup_translation_memory(source_text: str, segment_id: int | None) -> list[MemoryMatch]:
+        if translation_memory is None:
+            return []
+        started = time.perf_counter()
+        try:
+            matches = await translation_memory.alookup(source_text)
+        except Exception:
+            logger.exception("Translation memory lookup failed")
+            return []
+        log_event(
+            logger,
+            "translation.memory",
+            session_id=session_id,
+            segment_id=segment_id,
+            outcome=matches[0].kind if matches else "miss",
+            similarity=round(matches[0].similarity, 3) if matches else None,
+            references=sum(1 for match in matches if match.kind == "reference"),
+            lookup_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
+        return matches
+
+    def remember_translation(source_text: str, translation: str) -> None:
+        if translation_memory is None or not translation or is_closing:
+            return
+        track_task(asyncio.create_task(translation_memory.arecord(source_text, translation)))
+
+    def schedule_correction(
+        source_text: str,
+        ts: int,
+        speaker: str,
+        segment_id: int | None,
+        draft_translation: str,
+        recent_context: list[str] | None,
+    ) -> None:
+        if not settings.translation_two_tier or segment_id is None or not draft_translation or is_closing:
+            return
+        correction_batcher.add(
+            CorrectionItem(
                 segment_id=segment_id,
-                text_len=len(source_text),
-                latency_ms=int((time.perf_counter() - started) * 1000),
+                source_ts=ts,
+                speaker=speaker,
+                source_text=source_text,
+                draft_translation=draft_translation,
+                recent_context=list(recent_context or []),
+                glossary=session.glossary.relevant(source_text),
             )
-            await send_event(
-                TranslationFinalEvent(
-                    session_id=session_id,
-                    source_ts=ts,
-                    segment_id=segment_id,
-                    speaker=speaker,
-                    source_text=source_text,
-                    translated_text=translated,
-                )
+        )
+
+    async def correct_translation_batch(items: list[CorrectionItem]) -> list[str | None]:
+        # No session slot: corrections wait for admission at background priority in the
+        # LLM gateway, and holding a slot meanwhile would starve new finals behind them.
+        started = time.perf_counter()
+        results = await translation_service.correct_en_to_ko_batch(items)
+        log_event(
+            logger,
+            "translation.correction_batch",
+            session_id=session_id,
+            batch_size=len(items),
+            corrected=sum(
+                1
+                for item, result in zip(items, results)
+                if result and not _same_translation(result, item.draft_translation)
+            ),
+            latency_ms=int((time.perf_counter() - started) * 1000),
+        )
+        return results
+
+    async def apply_translation_correction(item: CorrectionItem, corrected: str) -> None:
+        if is_closing:
+            return
+        # Kept drafts are remembered too: the final-tier model has now checked them.
+        remember_translation(item.source_text, corrected)
+        if _same_translation(corrected, item.draft_translation):
+            return
+        translated = _strip_key_term_markup(corrected)
+        session.correct_translation(item.source_ts, translated)
+        learn_glossary_terms(item.source_text, corrected)
+        if session.set_display_translation(item.segment_id, corrected, llm_corrected=True):
+            await send_display_update()
+        await send_event(
+            TranslationCorrectedEvent(
+                session_id=session_id,
+                segment_id=item.segment_id,
+                speaker=item.speaker,
+                source_text=item.source_text,
+                translated_text=translated,
             )
+        )
+
+    correction_batcher = CorrectionBatcher(
+        correct_translation_batch,
+        apply_translation_correction,
+        window_s=settings.translation_correction_window_ms / 1000,
+        max_batch=settings.translation_correction_max_batch,
+    )
 
     async def generate_and_send_suggestions(
         transcripts: list[Any], prompt: str | None
@@ -252,34 +571,174 @@ async def meeting_ws(websocket: WebSocket, session_id: str) -> None:
         if suggestion_semaphore.locked():
             return
         async with suggestion_semaphore:
-            started = time.perf_counter()
-            try:
-                suggestions = await suggestion_service.generate_suggestions(
-                    transcripts,
-                    prompt,
-                )
-            except Exception:
-                logger.exception("Suggestion generation failed")
+            await stream_and_send_suggestions(transcripts, prompt)
+
+    async def stream_and_send_suggestions(transcripts: list[Any], prompt: str | None) -> None:
+        """Stream suggestions to the client; the caller holds `suggestion_semaphore`."""
+        started = time.perf_counter()
+        first_item_ms: int | None = None
+        suggestions: list[dict[str, str]] = []
+        try:
+            async for item in suggestion_service.stream_suggestions(
+                transcripts,
+                prompt,
+            ):
+                if first_item_ms is None:
+                    first_item_ms = int((time.perf_counter() - started) * 1000)
+                await send_suggestion_delta(len(suggestions), item)
+                suggestions.append(item)
+        except Exception:
+            logger.exception("Suggestion generation failed")
+            if not suggestions:
                 await send_event(
                     ErrorEvent(code="SUGGESTION_ERROR", message="Suggestions failed")
                 )
                 return
+        if not suggestions:
+            return
+        log_event(
+            logger,
+            "suggestions.update",
+            session_id=session_id,
+            item_count=len(suggestions),
+            first_item_ms=first_item_ms,
+            latency_ms=int((time.perf_counter() - started) * 1000),
+        )
+        await send_suggestions_update(suggestions, transcripts)
+
+    async def send_suggestion_delta(index: int, item: dict[str, str]) -> None:
+        await send_event(
+            SuggestionsDeltaEvent(
+                session_id=session_id,
+                index=index,
+                item=SuggestionItem(**item),
+            )
+        )
+
+    async def send_suggestions_update(suggestions: list[dict[str, str]], context: list[Any]) -> None:
+        # The settled list; clients that ignore deltas only need this one.
+        await send_event(
+            SuggestionsUpdateEvent(
+                session_id=session_id,
+                items=suggestions,
+            )
+        )
+        session.mark_suggestions_updated(context)
+
+    def start_speculative_suggestions(segment_id: int, speaker: str, ts: int, caption_text: str) -> None:
+        """Start suggestions for a partial that looks like it will end the turn."""
+        if is_closing or suggestion_semaphore.locked():
+            return
+        speculation = session.start_speculative_suggestions(segment_id, speaker, ts, caption_text)
+        if speculation is None:
+            return
+        committed = asyncio.Event()
+        task = asyncio.create_task(
+            run_speculative_suggestions(speculation.context, session.suggestions_prompt, committed)
+        )
+        speculative_suggestions[segment_id] = (task, committed)
+        track_task(task)
+
+    async def run_speculative_suggestions(
+        context: list[TranscriptEntry], prompt: str | None, committed: asyncio.Event
+    ) -> None:
+        """Generate suggestions ahead of the final; nothing is sent until `committed` is set.
+
+        Runs under `suggestion_semaphore` like a regular generation, so the two
+        never interleave; a discarded speculation is cancelled and frees it.
+        """
+        async with suggestion_semaphore:
+            started = time.perf_counter()
+            suggestions: list[dict[str, str]] = []
+            sent = 0
+            try:
+                async for item in suggestion_service.stream_suggestions(context, prompt):
+                    suggestions.append(item)
+                    while committed.is_set() and sent < len(suggestions):
+                        await send_suggestion_delta(sent, suggestions[sent])
+                        sent += 1
+            except Exception:
+                logger.exception("Speculative suggestion generation failed")
+            await committed.wait()
             if not suggestions:
+                await stream_and_send_suggestions(session.recent_transcripts(), session.suggestions_prompt)
                 return
+            for index in range(sent, len(suggestions)):
+                await send_suggestion_delta(index, suggestions[index])
             log_event(
                 logger,
                 "suggestions.update",
                 session_id=session_id,
                 item_count=len(suggestions),
+                speculative=True,
                 latency_ms=int((time.perf_counter() - started) * 1000),
             )
-            await send_event(
-                SuggestionsUpdateEvent(
-                    session_id=session_id,
-                    items=suggestions,
+            await send_suggestions_update(suggestions, context)
+
+    def dispatch_suggestions(segment_id: int, text: str, trigger: str | None) -> None:
+        """Commit a matching speculation for this final, or generate fresh suggestions if triggered."""
+        pending = dict(speculative_suggestions)
+        speculative_suggestions.clear()
+        speculation = session.resolve_speculative_suggestions(segment_id, text, bool(trigger))
+        committed = pending.pop(speculation.segment_id, None) if speculation else None
+        discarded = [task for task, _ in pending.values()]
+        for task in discarded:
+            task.cancel()
+        if committed is not None or pending:
+            stats = session.speculation_stats
+            log_event(
+                logger,
+                "suggestions.speculation",
+                session_id=session_id,
+                segment_id=segment_id,
+                outcome="commit" if committed is not None else "discard",
+                started=stats.started,
+                hit_rate=round(stats.hit_rate, 3),
+                waste_rate=round(stats.waste_rate, 3),
+            )
+        if committed is not None:
+            committed[1].set()
+        elif trigger:
+            track_task(
+                asyncio.create_task(
+                    generate_suggestions_after(
+                        discarded,
+                        session.recent_transcripts(),
+                        session.suggestions_prompt,
+                    )
                 )
             )
-            session.mark_suggestions_updated()
+
+    async def generate_suggestions_after(
+        cancelled: list[asyncio.Task], transcripts: list[Any], prompt: str | None
+    ) -> None:
+        # Let discarded speculations release the semaphore before checking it.
+        await asyncio.gather(*cancelled, return_exceptions=True)
+        await generate_and_send_suggestions(transcripts, prompt)
+
+    def schedule_summary_refresh() -> None:
+        if is_closing or "task" in summary_refresh:
+            return
+        if not rolling_summary.is_stale(session.transcripts, settings.summary_refresh_min_transcripts):
+            return
+        task = asyncio.create_task(refresh_summary_when_idle())
+        summary_refresh["task"] = task
+        track_task(task)
+
+    async def refresh_summary_when_idle() -> None:
+        """Precompute the summary in a pause so summary.request can answer from memory."""
+        try:
+            # Wait for a lull in finals, but not forever during a long monologue.
+            for _ in range(_SUMMARY_REFRESH_MAX_WAITS):
+                seen = len(session.transcripts)
+                await asyncio.sleep(settings.summary_refresh_idle_s)
+                if len(session.transcripts) == seen:
+                    break
+            await rolling_summary.refresh(session.transcripts, session_id)
+        except Exception:
+            logger.exception("Background summary refresh failed")
+        finally:
+            summary_refresh.pop("task", None)
 
     async def generate_and_send_summary() -> None:
         if is_closing:
@@ -297,8 +756,19 @@ async def meeting_ws(websocket: WebSocket, session_id: str) -> None:
                 )
                 return
             started = time.perf_counter()
+            first_delta_ms: int | None = None
+
+            async def send_summary_delta(delta: str) -> None:
+                nonlocal first_delta_ms
+                if first_delta_ms is None:
+                    first_delta_ms = int((time.perf_counter() - started) * 1000)
+                await send_event(SummaryDeltaEvent(session_id=session_id, delta=delta))
+
             try:
-                result = await summary_service.generate_summary(session.transcripts)
+                result, cache_status = await rolling_summary.summarize(
+                    session.transcripts,
+                    on_delta=send_summary_delta,
+                )
             except Exception as e:
                 logger.exception("Summary generation failed")
                 error_msg = f"Failed to generate summary: {str(e)[:100]}"
@@ -330,6 +800,10 @@ async def meeting_ws(websocket: WebSocket, session_id: str) -> None:
                 "summary.update",
                 session_id=session_id,
                 length=len(result),
+                chunks=len(rolling_summary.chunks),
+                tail_transcripts=len(session.transcripts) - rolling_summary.covered,
+                cache=cache_status,
+                first_delta_ms=first_delta_ms,
                 latency_ms=int((time.perf_counter() - started) * 1000),
             )
 
@@ -353,20 +827,18 @@ async def meeting_ws(websocket: WebSocket, session_id: str) -> None:
                         session.update_display_buffer(segment)
                         await send_display_update()
                         
-                        # Cancel previous translation task for this segment (debouncing)
-                        if partial_emit.segment_id in partial_translation_tasks:
-                            partial_translation_tasks[partial_emit.segment_id].cancel()
-                        
-                        # Start new async translation for Composing area
-                        task = asyncio.create_task(
-                            translate_partial_for_display(
-                                partial_emit.caption_text,
-                                partial_emit.segment_id,
-                                speaker,
-                            )
+                        # Translate newly closed sentences once and the open remainder (debounced)
+                        schedule_partial_translations(
+                            partial_emit.caption_text,
+                            partial_emit.segment_id,
+                            speaker,
+                        )
+                        start_speculative_suggestions(
+                            partial_emit.segment_id,
+                            speaker,
+                            ts,
+                            partial_emit.caption_text,
                         )
-                        partial_translation_tasks[partial_emit.segment_id] = task
-                        track_task(task)
                         
                         log_event(
                             logger,
@@ -389,21 +861,17 @@ async def meeting_ws(websocket: WebSocket, session_id: str) -> None:
 
                     # Process final transcript as single segment (no chunking)
                     text, segment_id = session.add_final_transcript(speaker, result.text, ts)
+                    # Partial jobs for this segment are superseded by the final
+                    translation_scheduler.cancel_group(segment_id)
                     
-                    # Get start time from current partial if exists
+                    # Get start time and interim translation from current partial if exists
                     display_buffer = session.get_display_buffer()
                     current = display_buffer.current
-                    start_time = current.start_time if current and current.segment_id == segment_id else ts
-                    
-                    # Translate for display with confirmed context
-                    confirmed_texts = [seg.text for seg in display_buffer.confirmed]
-                    try:
-                        translation = await translation_service.translate_for_display(text, confirmed_texts)
-                    except Exception:
-                        logger.exception("Display translation failed")
-                        translation = None
-                    
-                    # Create final segment with translation
+                    is_same_segment = current is not None and current.segment_id == segment_id
+                    start_time = current.start_time if is_same_segment else ts
+                    translation = current.translation if is_same_segment else None
+
+                    # Final translation arrives asynchronously via translate_final_text
                     segment = SubtitleSegment(
                         id=f"seg_{segment_id}",
                         text=text,
@@ -463,17 +931,24 @@ async def meeting_ws(websocket: WebSocket, session_id: str) -> None:
                     )
                     
                     # Update suggestions if needed
-                    should_update = session.should_update_suggestions(False)
-                    logger.info(f"[SUGGESTIONS] should_update={should_update} transcripts_count={len(session.transcripts)} since_last={session._since_last_suggestion}")
-                    if should_update:
-                        track_task(
-                            asyncio.create_task(
-                                generate_and_send_suggestions(
-                                    session.recent_transcripts(),
-                                    session.suggestions_prompt,
-                                )
-                            )
-                        )
+                    trigger = session.should_update_suggestions(False)
+                    trigger_stats = session.suggestion_trigger.stats
+                    log_event(
+                        logger,
+                        "suggestions.trigger",
+                        session_id=session_id,
+                        reason=trigger,
+                        novelty=(
+                            round(session.suggestion_trigger.last_novelty, 3)
+                            if session.suggestion_trigger.last_novelty is not None
+                            else None
+                        ),
+                        **trigger_stats.snapshot(),
+                    )
+                    dispatch_suggestions(segment_id, text, trigger)
+                    if rolling_summary.has_closed_window(session.transcripts):
+                        track_task(asyncio.create_task(rolling_summary.advance(session.transcripts, session_id)))
+                    schedule_summary_refresh()
                 except (WebSocketDisconnect, asyncio.CancelledError):
                     return
                 except Exception:
@@ -484,6 +959,66 @@ async def meeting_ws(websocket: WebSocket, session_id: str) -> None:
         except asyncio.CancelledError:
             return
 
+    async def run_quick_translation(request_id: str, text: str, direction: str) -> None:
+        """Quick translate over the meeting socket, using this meeting's context and glossary."""
+        started = time.perf_counter()
+        context_entries = session.recent_context(max_sentences=_HISTORY_CONTEXT_SENTENCES)
+        recent_context = [f"{entry.speaker}: {entry.text}" for entry in context_entries]
+        try:
+            if direction == "ko-en":
+                translated = await translation_service.translate_ko_to_en(
+                    text,
+                    recent_context=recent_context,
+                    glossary=session.glossary.relevant_to_target(text),
+                )
+            else:
+                translated = session.glossary.render(text) or ""
+                if not translated:
+                    translated = await translation_service.translate_en_to_ko_history(
+                        text,
+                        recent_context,
+                        glossary=session.glossary.relevant(text),
+                    )
+        except Exception:
+            logger.exception("Quick translation failed")
+            await send_event(TranslateResultEvent(request_id=request_id, error="Translation failed"))
+            return
+        await send_event(
+            TranslateResultEvent(
+                request_id=request_id,
+                translated_text=_strip_key_term_markup(translated).strip(),
+            )
+        )
+        log_event(
+            logger,
+            "translate.quick",
+            session_id=session_id,
+            transport="ws",
+            direction=direction,
+            text_len=len(text),
+            latency_ms=int((time.perf_counter() - started) * 1000),
+        )
+
+    async def start_quick_translation(request_id: str, text: str, direction: str) -> None:
+        if is_closing:
+            return
+        # Reusing a request id replaces the older request.
+        await cancel_quick_translation(request_id)
+        task = asyncio.create_task(run_quick_translation(request_id, text, direction))
+        quick_translations[request_id] = task
+        track_task(task)
+
+        def forget(done: asyncio.Task) -> None:
+            if quick_translations.get(request_id) is done:
+                del quick_translations[request_id]
+
+        task.add_done_callback(forget)
+
+    async def cancel_quick_translation(request_id: str) -> None:
+        task = quick_translations.pop(request_id, None)
+        if task is not None:
+            task.cancel()
+
     try:
         await transcribe_service.start_stream(session_id)
     except Exception:
@@ -506,6 +1041,8 @@ async def meeting_ws(websocket: WebSocket, session_id: str) -> None:
                     session,
                     transcribe_service,
                     generate_and_send_summary,
+                    start_quick_translation,
+                    cancel_quick_translation,
                 )
                 if _is_session_stop(message["text"]):
                     await send_event(SessionStopEvent())
@@ -522,7 +1059,10 @@ async def meeting_ws(websocket: WebSocket, session_id: str) -> None:
             logger,
             "ws.disconnected",
             session_id=session_id,
+            translation_queue=translation_scheduler.snapshot(),
+            llm_gateway=get_llm_gateway(settings).snapshot(),
         )
+        await correction_batcher.aclose()
         with contextlib.suppress(Exception):
             await transcribe_service.stop_stream()
         if background_tasks:
@@ -544,6 +1084,8 @@ async def _handle_control_message(
     session: MeetingSession,
     stt_service: STTServiceProtocol,
     on_summary_request,
+    on_translate_request,
+    on_translate_cancel,
 ) -> None:
     try:
         payload = json.loads(raw_text)
@@ -574,6 +1116,23 @@ async def _handle_control_message(
         )
         session.set_suggestions_prompt(prompt)
         return
+    if message_type == "glossary.seed":
+        terms = payload.get("terms")
+        if not isinstance(terms, list) or not all(
+            isinstance(term, dict) and isinstance(term.get("en"), str) and isinstance(term.get("ko"), str)
+            for term in terms
+        ):
+            await _send_invalid_message(send_payload, "Invalid glossary terms")
+            return
+        added = session.glossary.seed((term["en"], term["ko"]) for term in terms)
+        log_event(
+            logger,
+            "glossary.seed",
+            session_id=session.session_id,
+            terms=added,
+            glossary_size=len(session.glossary),
+        )
+        return
     if message_type == "summary.request":
         log_event(
             logger,
@@ -582,6 +1141,28 @@ async def _handle_control_message(
         )
         await on_summary_request()
         return
+    if message_type == "translate.request":
+        request_id = payload.get("requestId")
+        text = payload.get("text")
+        direction = payload.get("direction", "ko-en")
+        if (
+            not isinstance(request_id, str)
+            or not request_id
+            or not isinstance(text, str)
+            or not text.strip()
+            or direction not in ("ko-en", "en-ko")
+        ):
+            await _send_invalid_message(send_payload, "Invalid translate request")
+            return
+        await on_translate_request(request_id, text.strip(), direction)
+        return
+    if message_type == "translate.cancel":
+        request_id = payload.get("requestId")
+        if not isinstance(request_id, str):
+            await _send_invalid_message(send_payload, "Invalid translate cancel")
+            return
+        await on_translate_cancel(request_id)
+        return
     if message_type == "session.start":
         sample_rate = payload.get("sampleRate")
         if isinstance(sample_rate, int):
@@ -604,6 +1185,14 @@ async def _handle_control_message(
     await _send_invalid_message(send_payload, "Unknown control message type")
 
 
+def _strip_key_term_markup(text: str) -> str:
+    return _KEY_TERM_RE.sub(r"\1", text)
+
+
+def _same_translation(left: str, right: str) -> bool:
+    return " ".join(_strip_key_term_markup(left).split()) == " ".join(_strip_key_term_markup(right).split())
+
+
 def _is_session_stop(raw_text: str) -> bool:
     try:
         payload = json.loads(raw_text)
@@ -0,0 +1,128 @@
+"""Throughput/latency benchmark for the local MT provider.
+
+Runs a fixed, seeded workload of meeting-style sentences through
+`LocalTranslationService` at several concurrency levels and prints one JSON
+line per level, so runs on different machines or settings are comparable:
+
+    cd apps/api
+    python scripts/bench_local_mt.py --model-path models/opus-mt-en-ko-ct2 \
+        --direction en-ko --concurrency 1 4 16 --requests 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core.config import Settings  # noqa: E402
+from app.services.translation.local import LocalTranslationService  # noqa: E402
+
+_EN_CORPUS = [
+    "Let's start with the status update.",
+    "The deployment to staging finished this morning.",
+    "We are still waiting on the security review.",
+    "Can you share your screen?",
+    "I think we should push the launch by one week.",
+    "The latency dropped after we enabled caching.",
+    "Who owns the billing migration?",
+    "Let's take this offline and follow up by email.",
+    "The customer asked for a demo next Tuesday.",
+    "We need two more engineers on the data pipeline.",
+    "Does anyone have questions before we move on?",
+    "The error rate spiked around three in the afternoon.",
+    "I'll send the meeting notes after the call.",
+    "Our budget for the third quarter is already approved.",
+    "Thanks, everyone. See you next week.",
+]
+_KO_CORPUS = [
+    "현황 업데이트부터 시작하죠.",
+    "오늘 아침 스테이징 배포가 끝났습니다.",
+    "보안 검토를 아직 기다리고 있어요.",
+    "화면 공유 좀 해 주시겠어요?",
+    "출시를 일주일 미루는 게 좋겠습니다.",
+    "캐시를 켠 뒤로 지연 시간이 줄었어요.",
+    "결제 마이그레이션 담당자가 누구죠?",
+    "회의 끝나고 메일로 정리해서 보낼게요.",
+    "다음 주 화요일에 고객이 데모를 요청했어요.",
+    "질문 있으시면 지금 말씀해 주세요.",
+]
+
+
+async def _run_level(service: LocalTranslationService, texts: list[str], direction: str, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one(text: str) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await service.translate(text, direction)  # type: ignore[arg-type]
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    batches_before, items_before = service.batcher.stats.batches, service.batcher.stats.items
+    started = time.perf_counter()
+    await asyncio.gather(*(one(text) for text in texts))
+    elapsed = time.perf_counter() - started
+    batches = service.batcher.stats.batches - batches_before
+    latencies.sort()
+    return {
+        "direction": direction,
+        "concurrency": concurrency,
+        "requests": len(texts),
+        "sentences_per_s": round(len(texts) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies), 1),
+        "p95_ms": round(latencies[int(0.95 * (len(latencies) - 1))], 1),
+        "avg_batch_size": round((service.batcher.stats.items - items_before) / batches, 2) if batches else 0.0,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model-path", required=True, help="CTranslate2-converted Marian model directory")
+    parser.add_argument("--direction", choices=["en-ko", "ko-en"], default="en-ko")
+    parser.add_argument("--source-prefix", default="", help='Target-language token, e.g. ">>kor<<"')
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--threads", type=int, default=2)
+    parser.add_argument("--batch-window-ms", type=int, default=5)
+    parser.add_argument("--max-batch", type=int, default=16)
+    parser.add_argument("--beam-size", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    settings = Settings()
+    if args.direction == "en-ko":
+        settings.local_mt_en_ko_model_path = args.model_path
+        settings.local_mt_en_ko_source_prefix = args.source_prefix
+    else:
+        settings.local_mt_ko_en_model_path = args.model_path
+    settings.local_mt_workers = args.workers
+    settings.local_mt_threads_per_worker = args.threads
+    settings.local_mt_batch_window_ms = args.batch_window_ms
+    settings.local_mt_max_batch = args.max_batch
+    settings.local_mt_beam_size = args.beam_size
+
+    corpus = _EN_CORPUS if args.direction == "en-ko" else _KO_CORPUS
+    rng = random.Random(args.seed)
+    texts = [rng.choice(corpus) for _ in range(args.requests)]
+
+    service = LocalTranslationService(settings)
+    try:
+        # Warm every worker (model load, first-batch allocation) before measuring.
+        await asyncio.gather(*(service.translate(text, args.direction) for text in corpus))
+        for concurrency in args.concurrency:
+            print(json.dumps(await _run_level(service, texts, args.direction, concurrency)))
+    finally:
+        await service.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,185 @@
+import asyncio
+import binascii
+import json
+import struct
+
+import httpx
+import pytest
+from botocore.credentials import Credentials
+
+from app.core.config import Settings
+from app.services.llm.bedrock import BedrockRuntimeClient, BedrockRuntimeError
+
+
+class FakeSession:
+    def get_credentials(self) -> Credentials:
+        return Credentials("AKIDEXAMPLE", "secret", "token")
+
+
+def _client(handler) -> BedrockRuntimeClient:  # type: ignore[no-untyped-def]
+    settings = Settings()
+    settings.aws_region = "ap-northeast-2"
+    return BedrockRuntimeClient(settings, session=FakeSession(), transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_converse_signs_request_and_returns_json() -> None:
+    captured: dict[str, httpx.Request] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured["request"] = request
+        return httpx.Response(
+            200,
+            json={"output": {"message": {"role": "assistant", "content": [{"text": "안녕"}]}}},
+        )
+
+    client = _client(handler)
+    response = await client.converse(
+        modelId="apac.anthropic.claude-haiku-4-5-20251001-v1:0",
+        messages=[{"role": "user", "content": [{"text": "Hello"}]}],
+        inferenceConfig={"maxTokens": 16},
+    )
+    await client.aclose()
+
+    request = captured["request"]
+    assert request.url.host == "bedrock-runtime.ap-northeast-2.amazonaws.com"
+    assert request.url.raw_path.decode() == (
+        "/model/apac.anthropic.claude-haiku-4-5-20251001-v1%3A0/converse"
+    )
+    assert request.headers["Authorization"].startswith("AWS4-HMAC-SHA256")
+    assert "/ap-northeast-2/bedrock/aws4_request" in request.headers["Authorization"]
+    assert request.headers["X-Amz-Security-Token"] == "token"
+    assert json.loads(request.content) == {
+        "messages": [{"role": "user", "content": [{"text": "Hello"}]}],
+        "inferenceConfig": {"maxTokens": 16},
+    }
+    assert response["output"]["message"]["content"][0]["text"] == "안녕"
+
+
+class RefreshingCredentials(Credentials):
+    def __init__(self) -> None:
+        super().__init__("AKIDEXAMPLE", "secret", "token")
+        self.expired = False
+        self.loop_threads: list[bool] = []
+
+    def refresh_needed(self, refresh_in: int | None = None) -> bool:
+        return self.expired
+
+    def get_frozen_credentials(self):  # type: ignore[no-untyped-def]
+        try:
+            asyncio.get_running_loop()
+            self.loop_threads.append(True)
+        except RuntimeError:
+            self.loop_threads.append(False)
+        self.expired = False
+        return super().get_frozen_credentials()
+
+
+@pytest.mark.asyncio
+async def test_credentials_are_resolved_off_loop_and_reused_until_refresh() -> None:
+    credentials = RefreshingCredentials()
+    calls: list[int] = []
+
+    class CountingSession:
+        def get_credentials(self) -> Credentials:
+            calls.append(1)
+            return credentials
+
+    settings = Settings()
+    client = BedrockRuntimeClient(
+        settings,
+        session=CountingSession(),
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})),
+    )
+    await client.converse(modelId="model", messages=[])
+    await client.converse(modelId="model", messages=[])
+    credentials.expired = True
+    await client.converse(modelId="model", messages=[])
+    await client.aclose()
+
+    assert calls == [1]
+    assert credentials.loop_threads == [False, False]
+
+
+@pytest.mark.asyncio
+async def test_converse_maps_throttling_error() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            429,
+            headers={"x-amzn-ErrorType": "ThrottlingException:http://internal.amazon.com/"},
+            json={"message": "Too many requests"},
+        )
+
+    client = _client(handler)
+    with pytest.raises(BedrockRuntimeError) as exc_info:
+        await client.converse(modelId="model", messages=[])
+    await client.aclose()
+
+    assert exc_info.value.code == "ThrottlingException"
+    assert exc_info.value.is_throttling
+
+
+def _event_message(headers: dict[str, str], payload: dict) -> bytes:  # type: ignore[type-arg]
+    encoded_headers = b""
+    for name, value in headers.items():
+        raw_name = name.encode("utf-8")
+        raw_value = value.encode("utf-8")
+        encoded_headers += (
+            struct.pack("!B", len(raw_name)) + raw_name + b"\x07" + struct.pack("!H", len(raw_value)) + raw_value
+        )
+    body = json.dumps(payload).encode("utf-8")
+    total_length = 12 + len(encoded_headers) + len(body) + 4
+    prelude = struct.pack("!II", total_length, len(encoded_headers))
+    prelude += struct.pack("!I", binascii.crc32(prelude) & 0xFFFFFFFF)
+    message = prelude + encoded_headers + body
+    return message + struct.pack("!I", binascii.crc32(message) & 0xFFFFFFFF)
+
+
+@pytest.mark.asyncio
+async def test_converse_stream_decodes_event_stream() -> None:
+    stream = b"".join(
+        [
+            _event_message(
+                {":message-type": "event", ":event-type": "contentBlockDelta"},
+                {"contentBlockIndex": 0, "delta": {"text": "안녕"}},
+            ),
+            _event_message(
+                {":message-type": "event", ":event-type": "contentBlockDelta"},
+                {"contentBlockIndex": 0, "delta": {"text": "하세요"}},
+            ),
+            _event_message({":message-type": "event", ":event-type": "messageStop"}, {"stopReason": "end_turn"}),
+        ]
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path.endswith("/converse-stream")
+        return httpx.Response(200, content=stream)
+
+    client = _client(handler)
+    events = [event async for event in client.converse_stream(modelId="model", messages=[])]
+    await client.aclose()
+
+    assert events == [
+        {"contentBlockDelta": {"contentBlockIndex": 0, "delta": {"text": "안녕"}}},
+        {"contentBlockDelta": {"contentBlockIndex": 0, "delta": {"text": "하세요"}}},
+        {"messageStop": {"stopReason": "end_turn"}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_converse_stream_raises_in_stream_throttling() -> None:
+    stream = _event_message(
+        {":message-type": "exception", ":exception-type": "throttlingException"},
+        {"message": "slow down"},
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=stream)
+
+    client = _client(handler)
+    with pytest.raises(BedrockRuntimeError) as exc_info:
+        async for _ in client.converse_stream(modelId="model", messages=[]):
+            pass
+    await client.aclose()
+
+    assert exc_info.value.is_throttling
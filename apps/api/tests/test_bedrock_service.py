@@ -1,13 +1,14 @@
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from app.core.config import Settings
-from app.services.translation.aws import AWSTranslationService
+from app.services.translation.aws import _HISTORY_SYSTEM_PROMPT, AWSTranslationService
 
 
 @pytest.mark.asyncio
-@patch("app.services.translation.aws.boto3.client")
+@patch("app.services.translation.aws.BedrockRuntimeClient")
 async def test_translate_en_to_ko_uses_translation_model(mock_client: AsyncMock) -> None:
     settings = Settings()
     service = AWSTranslationService(settings)
@@ -17,12 +18,13 @@ async def test_translate_en_to_ko_uses_translation_model(mock_client: AsyncMock)
 
     service._invoke_model.assert_awaited_once()
     assert service._invoke_model.call_args.args[0] == settings.bedrock_translation_fast_model_id
-    assert "Translate the following English text" in service._invoke_model.call_args.args[1]
+    assert service._invoke_model.call_args.args[1] == "Hello"
+    assert "Translate the English text" in service._invoke_model.call_args.kwargs["system"]
     assert result == "translated"
 
 
 @pytest.mark.asyncio
-@patch("app.services.translation.aws.boto3.client")
+@patch("app.services.translation.aws.BedrockRuntimeClient")
 async def test_translate_ko_to_en_uses_quick_model(mock_client: AsyncMock) -> None:
     settings = Settings()
     service = AWSTranslationService(settings)
@@ -32,12 +34,13 @@ async def test_translate_ko_to_en_uses_quick_model(mock_client: AsyncMock) -> No
 
     service._invoke_model.assert_awaited_once()
     assert service._invoke_model.call_args.args[0] == settings.bedrock_quick_translate_model_id
-    assert "Translate the following Korean text" in service._invoke_model.call_args.args[1]
+    assert "Translate the Korean text" in service._invoke_model.call_args.kwargs["system"]
+    assert service._invoke_model.call_args.kwargs["role"] == "quick"
     assert result == "translated"
 
 
 @pytest.mark.asyncio
-@patch("app.services.translation.aws.boto3.client")
+@patch("app.services.translation.aws.BedrockRuntimeClient")
 async def test_translate_en_to_ko_history_uses_high_model(mock_client: AsyncMock) -> None:
     settings = Settings()
     settings.bedrock_translation_high_model_id = "high-model"
@@ -60,24 +63,66 @@ async def test_translate_en_to_ko_history_uses_high_model(mock_client: AsyncMock
     assert result == "translated_history"
 
 
+def test_history_prompt_requests_key_term_markup() -> None:
+    prompt = AWSTranslationService._build_history_prompt("We use Kubernetes.", ["Earlier line"])
+
+    assert "**word**" in _HISTORY_SYSTEM_PROMPT
+    assert "**word**" not in prompt
+    assert "Current line: \"We use Kubernetes.\"" in prompt
+
+
 @pytest.mark.asyncio
-@patch("app.services.translation.aws.boto3.client")
-async def test_translate_for_display_includes_confirmed_context(mock_client: AsyncMock) -> None:
+@patch("app.services.translation.aws.BedrockRuntimeClient")
+async def test_revise_en_to_ko_uses_fast_model_with_draft(mock_client: AsyncMock) -> None:
+    settings = Settings()
+    settings.bedrock_translation_fast_model_id = "fast-model"
+    service = AWSTranslationService(settings)
+    service._invoke_model = AsyncMock(return_value=" 수정됨 ")
+
+    result = await service.revise_en_to_ko("Hello there, team.", "Hello there", "안녕하세요")
+
+    assert service._invoke_model.call_args.args[0] == "fast-model"
+    prompt = service._invoke_model.call_args.args[1]
+    assert "Korean draft: \"안녕하세요\"" in prompt
+    assert "Final English: \"Hello there, team.\"" in prompt
+    assert result == "수정됨"
+
+
+@pytest.mark.asyncio
+@patch("app.services.translation.aws.BedrockRuntimeClient")
+async def test_translate_en_to_ko_with_context_stays_on_fast_model(mock_client: AsyncMock) -> None:
     settings = Settings()
     settings.bedrock_translation_high_model_id = "high-model"
+    settings.bedrock_translation_fast_model_id = "fast-model"
     service = AWSTranslationService(settings)
-    service._invoke_model = AsyncMock(return_value="display")
+    service._invoke_model = AsyncMock(return_value="번역")
 
-    result = await service.translate_for_display(
-        "We should proceed.",
-        confirmed_texts=["First confirmed", "Second confirmed"],
-    )
+    await service.translate_en_to_ko("We use Kubernetes.", ["Earlier line"], [("Kubernetes", "쿠버네티스")])
 
-    service._invoke_model.assert_awaited_once()
-    assert service._invoke_model.call_args.args[0] == "high-model"
+    assert service._invoke_model.call_args.args[0] == "fast-model"
     prompt = service._invoke_model.call_args.args[1]
-    assert "Confirmed context" in prompt
-    assert "- First confirmed" in prompt
-    assert "- Second confirmed" in prompt
-    assert "Current sentence" in prompt
-    assert result == "display"
+    assert "Glossary: Kubernetes=쿠버네티스" in prompt
+    assert "- Earlier line" in prompt
+    assert service._invoke_model.call_args.kwargs["call_site"] == "translation.partial"
+
+
+@pytest.mark.asyncio
+@patch("app.services.translation.aws.BedrockRuntimeClient")
+async def test_history_on_fast_model_is_not_hedged_against_itself(mock_client: AsyncMock) -> None:
+    settings = Settings()
+    settings.bedrock_translation_high_model_id = "fast-model"
+    settings.bedrock_translation_fast_model_id = "fast-model"
+    settings.translation_hedge_history_ms = 1
+    service = AWSTranslationService(settings)
+    calls: list[str] = []
+
+    async def slow_invoke(model_id: str, prompt: str, **kwargs: object) -> str:
+        calls.append(model_id)
+        await asyncio.sleep(0.02)
+        return "번역"
+
+    service._invoke_model = slow_invoke  # type: ignore[method-assign]
+
+    assert await service.translate_en_to_ko_history("Hello there") == "번역"
+    assert calls == ["fast-model"]
+    assert service.hedge_snapshot()["history"]["hedged"] == 0
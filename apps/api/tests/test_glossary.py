@@ -0,0 +1,79 @@
+from app.domain.models.glossary import MeetingGlossary
+from app.services.translation.aws import AWSTranslationService
+from app.services.translation.correction import CorrectionItem
+
+
+def test_seeded_terms_render_short_utterances_locally() -> None:
+    glossary = MeetingGlossary()
+    assert glossary.seed([("Kubernetes", "쿠버네티스"), ("Q3 roadmap", "3분기 로드맵"), ("", "x")]) == 2
+
+    assert glossary.render("Kubernetes?") == "**쿠버네티스**?"
+    assert glossary.render("q3 roadmap and Kubernetes.") == "**3분기 로드맵**, **쿠버네티스**."
+    assert glossary.render("Kubernetes is down") is None
+    assert glossary.render("Kubernetes and") is None
+
+
+def test_learns_only_terms_kept_in_english_and_keeps_first_rendering() -> None:
+    glossary = MeetingGlossary()
+
+    learned = glossary.learn("We should move billing to Kubernetes.", "결제를 **쿠버네티스**로 옮겨야 해요.")
+    glossary.learn("The API gateway is down.", "**API** 게이트웨이가 다운됐어요.")
+    glossary.learn("The api is back.", "**Api**가 돌아왔어요.")
+    glossary.learn("Ask Alice about the Payments Service.", "**앨리스**에게 **결제 서비스**에 대해 물어보세요.")
+
+    assert learned == []
+    assert glossary.relevant("Is the API on Kubernetes yet?") == [("API", "API")]
+    assert len(glossary) == 1
+
+
+def test_proper_noun_is_not_paired_with_a_neighbouring_bolded_term() -> None:
+    glossary = MeetingGlossary()
+
+    learned = glossary.learn("I talked to John about the deployment plan.", "John에게 **배포** 계획에 대해 이야기했어요.")
+
+    assert learned == []
+    assert glossary.render("John?") is None
+    assert glossary.relevant("John is here.") == []
+
+
+def test_seed_overrides_learned_terms_and_entries_are_capped() -> None:
+    glossary = MeetingGlossary(max_entries=2)
+    glossary.learn("We should move billing to Kubernetes.", "결제를 **쿠버네티스**로 옮겨야 해요.")
+    glossary.seed([("Kubernetes", "K8s"), ("Terraform", "테라폼"), ("Grafana", "그라파나")])
+
+    assert glossary.relevant("Kubernetes and Terraform and Grafana") == [
+        ("Kubernetes", "K8s"),
+        ("Terraform", "테라폼"),
+    ]
+
+
+def test_glossary_is_injected_compactly_into_prompts() -> None:
+    prompt = AWSTranslationService._build_history_prompt(
+        "Deploy it to Kubernetes.", ["spk_1: Hi"], glossary=[("Kubernetes", "쿠버네티스"), ("API", "API")]
+    )
+    correction = AWSTranslationService._build_correction_prompt(
+        [
+            CorrectionItem(1, 1, "spk_1", "Kubernetes?", "쿠버", glossary=[("Kubernetes", "쿠버네티스")]),
+            CorrectionItem(2, 2, "spk_1", "The API.", "API", glossary=[("API", "API")]),
+        ]
+    )
+
+    assert prompt.splitlines()[0] == "Glossary: Kubernetes=쿠버네티스; API=API"
+    assert correction.splitlines()[0] == "Glossary: Kubernetes=쿠버네티스; API=API"
+
+
+def test_korean_text_finds_entries_by_target_for_quick_translate() -> None:
+    glossary = MeetingGlossary()
+    glossary.seed([("Kubernetes", "쿠버네티스"), ("Q3 roadmap", "3분기 로드맵")])
+
+    matches = glossary.relevant_to_target("쿠버네티스 업그레이드는 3분기 로드맵에 있나요?")
+    prompt = AWSTranslationService._build_quick_prompt("쿠버네티스 준비됐나요?", ["spk_1: Hi"], matches[:1])
+
+    assert matches == [("Kubernetes", "쿠버네티스"), ("Q3 roadmap", "3분기 로드맵")]
+    assert prompt.splitlines() == [
+        "Glossary: 쿠버네티스=Kubernetes",
+        "Meeting context:",
+        "- spk_1: Hi",
+        'Text: "쿠버네티스 준비됐나요?"',
+    ]
+    assert AWSTranslationService._build_quick_prompt("안녕", None, None) == "안녕"
@@ -11,14 +11,46 @@ from app.domain.models.provider import TranscriptResult
 
 
 class FakeTranslationService:
-    async def translate_en_to_ko(self, text: str) -> str:
+    async def translate_en_to_ko(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> str:
         return "translated"
 
     async def translate_en_to_ko_history(
-        self, text: str, recent_context: list[str] | None = None
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
     ) -> str:
         return "translated_history"
 
+    async def stream_en_to_ko_history(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> AsyncIterator[str]:
+        yield "translated"
+        yield "_history"
+
+    async def stream_en_to_ko_draft(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> AsyncIterator[str]:
+        yield "translated"
+        yield "_history"
+
+    async def correct_en_to_ko_batch(self, items: list) -> list[str | None]:  # type: ignore[type-arg]
+        return [None] * len(items)
+
     async def translate_for_display(
         self, text: str, confirmed_texts: list[str]
     ) -> str:
@@ -36,6 +68,12 @@ class FakeSuggestionService:
             {"en": "Can you clarify the owner?", "ko": "담당자를 명확히 해주실 수 있나요?"}
         ]
 
+    async def stream_suggestions(  # type: ignore[no-untyped-def]
+        self, transcripts, system_prompt=None
+    ):
+        for item in await self.generate_suggestions(transcripts, system_prompt):
+            yield item
+
 
 def make_stt_service(events: Callable[[], AsyncIterator[TranscriptResult]]) -> type:
     class FakeSTTService:
@@ -92,14 +130,15 @@ def test_integration_ws_flow(monkeypatch) -> None:
             message = websocket.receive_json()
             if message.get("type") == "server.pong":
                 continue
-            if message.get("type") == "display.update":
+            if message.get("type") in {"display.update", "translation.delta"}:
                 continue
             types.append(message["type"])
-            if message["type"] == "suggestions.update":
+            if "suggestions.update" in types and "translation.final" in types:
                 break
         assert "transcript.final" in types
         assert "translation.final" in types
         assert "suggestions.update" in types
+        assert types.index("suggestions.delta") < types.index("suggestions.update")
 
 
 def test_integration_translate_api() -> None:
@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+
+from app.services.llm.gateway import LLMGateway, LLMPriority, current_llm_session
+
+
+class ThrottlingError(Exception):
+    status_code = 429
+
+
+def _gateway(**overrides: float) -> LLMGateway:
+    options = {"initial_limit": 1, "min_limit": 1, "max_limit": 8, "latency_target_ms": 1000}
+    options.update(overrides)
+    return LLMGateway(**options)
+
+
+@pytest.mark.asyncio
+async def test_quiet_session_is_not_starved_by_chatty_session() -> None:
+    gateway = _gateway()
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def call(name: str, hold: bool = False) -> None:
+        order.append(name)
+        if hold:
+            await release.wait()
+
+    blocker = asyncio.create_task(gateway.run(lambda: call("a0", hold=True), session_id="a"))
+    await asyncio.sleep(0)
+    chatty = [asyncio.create_task(gateway.run(lambda i=i: call(f"a{i}"), session_id="a")) for i in range(1, 4)]
+    await asyncio.sleep(0)
+    quiet = [asyncio.create_task(gateway.run(lambda i=i: call(f"b{i}"), session_id="b")) for i in range(2)]
+    await asyncio.sleep(0)
+
+    release.set()
+    await asyncio.gather(blocker, *chatty, *quiet)
+
+    assert order[:4] == ["a0", "b0", "a1", "b1"]
+    assert gateway.snapshot()["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_background_calls_wait_for_interactive_calls() -> None:
+    gateway = _gateway()
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def call(name: str, hold: bool = False) -> None:
+        order.append(name)
+        if hold:
+            await release.wait()
+
+    blocker = asyncio.create_task(gateway.run(lambda: call("blocker", hold=True), session_id="a"))
+    await asyncio.sleep(0)
+    summary = asyncio.create_task(
+        gateway.run(lambda: call("summary"), session_id="b", priority=LLMPriority.BACKGROUND)
+    )
+    await asyncio.sleep(0)
+    translation = asyncio.create_task(gateway.run(lambda: call("translation"), session_id="a"))
+    await asyncio.sleep(0)
+
+    release.set()
+    await asyncio.gather(blocker, summary, translation)
+
+    assert order == ["blocker", "translation", "summary"]
+
+
+@pytest.mark.asyncio
+async def test_throttling_halves_limit_and_fast_calls_grow_it() -> None:
+    gateway = _gateway(initial_limit=8)
+
+    async def throttled() -> None:
+        raise ThrottlingError("slow down")
+
+    with pytest.raises(ThrottlingError):
+        await gateway.run(throttled)
+    assert gateway.limit.limit == 4
+
+    async def fast() -> str:
+        return "ok"
+
+    for _ in range(4):
+        assert await gateway.run(fast) == "ok"
+
+    assert gateway.limit.limit > 4.9
+    assert gateway.snapshot()["throttled"] == 1
+    assert gateway.snapshot()["completed"] == 4
+
+
+@pytest.mark.asyncio
+async def test_slow_calls_shrink_limit_and_session_comes_from_context() -> None:
+    gateway = _gateway(initial_limit=4, latency_target_ms=1)
+
+    async def slow() -> None:
+        await asyncio.sleep(0.01)
+
+    current_llm_session.set("session-1")
+    await gateway.run(slow)
+
+    assert gateway.limit.limit == pytest.approx(3.6)
+    assert gateway.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_closing_a_stream_early_is_not_counted_as_failure() -> None:
+    gateway = _gateway()
+
+    async def stream():  # type: ignore[no-untyped-def]
+        async with gateway.acquire():
+            yield "first"
+            yield "second"
+
+    events = stream()
+    assert await events.__anext__() == "first"
+    await events.aclose()
+
+    snapshot = gateway.snapshot()
+    assert snapshot["failed"] == 0
+    assert snapshot["in_flight"] == 0
@@ -0,0 +1,110 @@
+import asyncio
+from typing import AsyncIterator
+
+import pytest
+
+from app.services.llm.hedging import HedgeStats, hedged_call, hedged_stream
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged() -> None:
+    stats = HedgeStats()
+    backup_calls = 0
+
+    async def primary() -> str:
+        return "primary"
+
+    async def backup() -> str:
+        nonlocal backup_calls
+        backup_calls += 1
+        return "backup"
+
+    assert await hedged_call(primary, backup, budget_s=0.05, stats=stats) == "primary"
+    assert backup_calls == 0
+    assert stats.hedge_rate == 0.0
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_cancelled() -> None:
+    stats = HedgeStats()
+    primary_cancelled = asyncio.Event()
+
+    async def primary() -> str:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            primary_cancelled.set()
+            raise
+        return "primary"
+
+    async def backup() -> str:
+        return "backup"
+
+    assert await hedged_call(primary, backup, budget_s=0.01, stats=stats) == "backup"
+    assert primary_cancelled.is_set()
+    assert stats.snapshot()["hedged"] == 1
+    assert stats.win_rate == 1.0
+
+
+@pytest.mark.asyncio
+async def test_failed_primary_falls_back_and_saturation_suppresses_hedge() -> None:
+    stats = HedgeStats()
+
+    async def failing() -> str:
+        raise RuntimeError("boom")
+
+    async def slow() -> str:
+        await asyncio.sleep(0.03)
+        return "slow"
+
+    async def backup() -> str:
+        return "backup"
+
+    assert await hedged_call(failing, backup, budget_s=1, stats=stats) == "backup"
+    assert await hedged_call(slow, backup, budget_s=0.01, stats=stats, allow_hedge=lambda: False) == "slow"
+    assert stats.fallbacks == 1
+    assert stats.suppressed == 1
+    assert stats.hedged == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_hedges_on_time_to_first_chunk() -> None:
+    stats = HedgeStats()
+    primary_closed = asyncio.Event()
+
+    async def primary() -> AsyncIterator[str]:
+        try:
+            await asyncio.sleep(10)
+            yield "느린"
+        finally:
+            primary_closed.set()
+
+    async def backup() -> AsyncIterator[str]:
+        yield "빠른 "
+        yield "번역"
+
+    chunks = [chunk async for chunk in hedged_stream(primary, backup, budget_s=0.01, stats=stats)]
+
+    assert chunks == ["빠른 ", "번역"]
+    assert primary_closed.is_set()
+    assert stats.hedge_wins == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_keeps_primary_when_first_chunk_is_on_time() -> None:
+    stats = HedgeStats()
+
+    async def primary() -> AsyncIterator[str]:
+        yield "안녕"
+        await asyncio.sleep(0.03)
+        yield "하세요"
+
+    async def backup() -> AsyncIterator[str]:
+        raise AssertionError("backup should not start")
+        yield ""
+
+    chunks = [chunk async for chunk in hedged_stream(primary, backup, budget_s=0.01, stats=stats)]
+
+    assert chunks == ["안녕", "하세요"]
+    assert stats.requests == 1
+    assert stats.hedged == 0
@@ -0,0 +1,100 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.config import Settings
+from app.services.translation import create_translation_service
+from app.services.translation.local import (
+    HybridTranslationService,
+    LocalTranslationService,
+    parse_call_classes,
+)
+
+
+def _settings() -> Settings:
+    settings = Settings()
+    settings.local_mt_en_ko_model_path = "models/en-ko"
+    settings.local_mt_ko_en_model_path = "models/ko-en"
+    settings.local_mt_batch_window_ms = 10
+    return settings
+
+
+def _local_service(batches: list[tuple[str, list[str]]]) -> LocalTranslationService:
+    def translate_batch(direction: str, texts: list[str], beam_size: int) -> list[str]:
+        batches.append((direction, texts))
+        return [f"{direction}:{text}" for text in texts]
+
+    return LocalTranslationService(_settings(), executor=ThreadPoolExecutor(1), translate_batch=translate_batch)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_decoded_in_one_batch_per_direction() -> None:
+    batches: list[tuple[str, list[str]]] = []
+    service = _local_service(batches)
+
+    results = await asyncio.gather(
+        service.translate_en_to_ko("Hello."),
+        service.translate_en_to_ko_history("Next item.", ["spk_1: Hi"], glossary=[("item", "항목")]),
+        service.translate_ko_to_en("안녕하세요"),
+    )
+    await service.aclose()
+
+    assert results == ["en-ko:Hello.", "en-ko:Next item.", "ko-en:안녕하세요"]
+    assert sorted(batches) == [("en-ko", ["Hello.", "Next item."]), ("ko-en", ["안녕하세요"])]
+
+
+@pytest.mark.asyncio
+async def test_hybrid_routes_selected_call_classes_to_local_mt() -> None:
+    batches: list[tuple[str, list[str]]] = []
+    local = _local_service(batches)
+    primary = AsyncMock()
+    primary.translate_en_to_ko_history.return_value = "llm"
+    primary.correct_en_to_ko_batch.return_value = [None]
+    service = HybridTranslationService(primary, local, {"quick", "draft"})
+
+    assert await service.translate_ko_to_en("안녕") == "ko-en:안녕"
+    assert [delta async for delta in service.stream_en_to_ko_draft("Hi.")] == ["en-ko:Hi."]
+    assert await service.translate_en_to_ko_history("Hi.") == "llm"
+    assert await service.correct_en_to_ko_batch([]) == [None]
+    await service.aclose()
+
+    primary.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_partial_class_covers_closed_composing_sentences() -> None:
+    batches: list[tuple[str, list[str]]] = []
+    local = _local_service(batches)
+    primary = AsyncMock()
+    primary.translate_en_to_ko_history.return_value = "llm"
+    service = HybridTranslationService(primary, local, {"partial"})
+
+    assert await service.translate_en_to_ko("Next item.", ["spk_1: Hi"], [("item", "항목")]) == "en-ko:Next item."
+    assert await service.translate_en_to_ko("And then") == "en-ko:And then"
+    assert await service.translate_en_to_ko_history("Next item.") == "llm"
+    await service.aclose()
+
+    primary.translate_en_to_ko.assert_not_called()
+
+
+def test_call_classes_are_validated() -> None:
+    assert parse_call_classes(" Quick, draft ") == {"quick", "draft"}
+    with pytest.raises(ValueError):
+        parse_call_classes("quick,summary")
+
+    settings = Settings()
+    settings.local_mt_en_ko_model_path = "models/en-ko"
+    local = LocalTranslationService(settings, executor=ThreadPoolExecutor(1))
+    with pytest.raises(ValueError, match="ko-en"):
+        HybridTranslationService(AsyncMock(), local, {"quick"})
+
+
+def test_factory_requires_the_optional_dependencies(monkeypatch) -> None:
+    monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+    settings = _settings()
+    settings.local_mt_call_classes = "partial"
+
+    with pytest.raises(RuntimeError, match="local-mt extra"):
+        create_translation_service(settings)
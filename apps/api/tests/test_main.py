@@ -1,3 +1,5 @@
+from typing import AsyncIterator
+
 from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
 import pytest
@@ -18,14 +20,46 @@ async def test_health() -> None:
 
 
 class FakeTranslationService:
-    async def translate_en_to_ko(self, text: str) -> str:
+    async def translate_en_to_ko(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> str:
         return "translated"
 
     async def translate_en_to_ko_history(
-        self, text: str, recent_context: list[str] | None = None
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
     ) -> str:
         return "translated_history"
 
+    async def stream_en_to_ko_history(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> AsyncIterator[str]:
+        yield "translated"
+        yield "_history"
+
+    async def stream_en_to_ko_draft(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> AsyncIterator[str]:
+        yield "translated"
+        yield "_history"
+
+    async def correct_en_to_ko_batch(self, items: list) -> list[str | None]:  # type: ignore[type-arg]
+        return [None] * len(items)
+
     async def translate_for_display(
         self, text: str, confirmed_texts: list[str]
     ) -> str:
@@ -41,6 +75,12 @@ class FakeSuggestionService:
     ):
         return []
 
+    async def stream_suggestions(  # type: ignore[no-untyped-def]
+        self, transcripts, system_prompt=None
+    ):
+        for item in await self.generate_suggestions(transcripts, system_prompt):
+            yield item
+
 
 def test_ws_meetings_ping_pong(monkeypatch) -> None:
     async def empty_stream():
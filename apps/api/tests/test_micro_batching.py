@@ -0,0 +1,67 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.config import Settings
+from app.services.translation.aws import AWSTranslationService
+from app.services.translation.batching import MicroBatcher
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submits_share_one_batch_per_key() -> None:
+    batches: list[tuple[str, list[str]]] = []
+
+    async def run_batch(key, items: list[str]) -> list[str | None]:  # type: ignore[no-untyped-def]
+        batches.append((key, items))
+        return [item.upper() for item in items]
+
+    batcher: MicroBatcher[str, str] = MicroBatcher(run_batch, window_s=0.01, max_batch=8)
+    results = await asyncio.gather(
+        batcher.submit("fast", "a"),
+        batcher.submit("fast", "b"),
+        batcher.submit("high", "c"),
+    )
+
+    assert results == ["A", "B", "C"]
+    assert sorted(batches) == [("fast", ["a", "b"]), ("high", ["c"])]
+    assert batcher.stats.max_size == 2
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_before_the_window_ends() -> None:
+    async def run_batch(key, items: list[int]) -> list[int | None]:  # type: ignore[no-untyped-def]
+        return [item * 2 for item in items]
+
+    batcher: MicroBatcher[int, int] = MicroBatcher(run_batch, window_s=10, max_batch=2)
+    results = await asyncio.wait_for(
+        asyncio.gather(batcher.submit("k", 1), batcher.submit("k", 2)),
+        timeout=1,
+    )
+
+    assert results == [2, 4]
+
+
+@pytest.mark.asyncio
+async def test_service_merges_history_translations_and_retries_missing_items() -> None:
+    settings = Settings()
+    settings.translation_micro_batch_enabled = True
+    settings.translation_micro_batch_window_ms = 10
+    settings.bedrock_translation_high_model_id = "high-model"
+    service = AWSTranslationService(settings)
+    batch_response = json.dumps([{"id": 0, "ko": "첫째"}, {"id": 2, "ko": "셋째"}], ensure_ascii=False)
+    service._invoke_model = AsyncMock(side_effect=[batch_response, "둘째"])
+
+    results = await asyncio.gather(
+        service.translate_en_to_ko_history("First.", ["spk_1: Hi"]),
+        service.translate_en_to_ko_history("Second."),
+        service.translate_en_to_ko_history("Third."),
+    )
+
+    assert results == ["첫째", "둘째", "셋째"]
+    assert service._invoke_model.await_count == 2
+    batch_call, retry_call = service._invoke_model.call_args_list
+    assert batch_call.args[0] == "high-model"
+    assert '"context": ["spk_1: Hi"]' in batch_call.args[1]
+    assert 'Current line: "Second."' in retry_call.args[1]
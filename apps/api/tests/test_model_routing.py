@@ -0,0 +1,107 @@
+from fastapi.testclient import TestClient
+
+from app.core.config import Settings
+from app.core.deps import get_settings
+from app.main import app
+from app.services.llm.routing import ModelRouter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _router(clock: FakeClock) -> ModelRouter:
+    return ModelRouter(
+        {"high": ["global.model", "apac.model"], "fast": ["fast.model"]},
+        explore_interval_s=30,
+        clock=clock,
+    )
+
+
+def test_single_candidate_and_unknown_ids_pass_through() -> None:
+    router = _router(FakeClock())
+
+    assert router.resolve("fast.model") == "fast.model"
+    assert router.resolve("other.model") == "other.model"
+
+
+def test_routes_to_lower_latency_candidate() -> None:
+    clock = FakeClock()
+    router = _router(clock)
+
+    assert router.resolve("global.model") == "global.model"
+    router.record("global.model", 1800, ok=True)
+    assert router.resolve("global.model") == "apac.model"
+    router.record("apac.model", 600, ok=True)
+
+    for _ in range(5):
+        clock.now += 1
+        assert router.resolve("global.model") == "apac.model"
+        router.record("apac.model", 650, ok=True)
+
+    snapshot = router.snapshot()["high"]
+    assert snapshot["selected"] == "apac.model"
+    apac = next(item for item in snapshot["candidates"] if item["model_id"] == "apac.model")
+    assert apac["requests"] == 6
+    assert apac["p95_ms"] == 650
+
+
+def test_errors_shift_traffic_and_stale_candidate_is_probed() -> None:
+    clock = FakeClock()
+    router = _router(clock)
+    router.record("global.model", 500, ok=True)
+    router.record("apac.model", 700, ok=True)
+    for _ in range(5):
+        router.record("global.model", 500, ok=False)
+
+    assert router.resolve("global.model") == "apac.model"
+
+    clock.now += 31
+    assert router.resolve("global.model") == "global.model"
+    assert router.resolve("global.model") == "apac.model"
+
+
+def test_roles_sharing_a_primary_keep_their_own_candidates() -> None:
+    router = ModelRouter(
+        {"fast": ["shared.model", "fast.backup"], "quick": ["shared.model", "quick.backup"]},
+        clock=FakeClock(),
+    )
+    router.record("shared.model", 2000, ok=True)
+    router.record("fast.backup", 100, ok=True)
+    router.record("quick.backup", 300, ok=True)
+
+    assert router.resolve("shared.model") == "fast.backup"
+    assert router.resolve("shared.model", "fast") == "fast.backup"
+    assert router.resolve("shared.model", "quick") == "quick.backup"
+
+
+def test_admin_routing_endpoint_is_closed_without_token() -> None:
+    settings = Settings()
+    settings.admin_token = None
+    app.dependency_overrides[get_settings] = lambda: settings
+    client = TestClient(app)
+
+    response = client.get("/api/v1/admin/llm/routing")
+    app.dependency_overrides.clear()
+
+    assert response.status_code == 403
+
+
+def test_admin_routing_endpoint_requires_token_when_configured() -> None:
+    settings = Settings()
+    settings.admin_token = "secret"
+    app.dependency_overrides[get_settings] = lambda: settings
+    client = TestClient(app)
+
+    assert client.get("/api/v1/admin/llm/routing").status_code == 403
+    response = client.get("/api/v1/admin/llm/routing", headers={"X-Admin-Token": "secret"})
+    app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body["routes"]) == {"fast", "high", "quick"}
+    assert "limit" in body["gateway"]
@@ -0,0 +1,130 @@
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from botocore.credentials import Credentials
+
+from app.core.config import Settings
+from app.domain.models.session import TranscriptEntry
+from app.services.llm.bedrock import BedrockRuntimeClient
+from app.services.llm.gateway import LLMGateway
+from app.services.llm.routing import ModelRouter
+from app.services.llm.usage import TokenAccounting
+from app.services.suggestion import SuggestionService
+from app.services.translation.aws import AWSTranslationService
+
+
+class FakeSession:
+    def get_credentials(self) -> Credentials:
+        return Credentials("AKIDEXAMPLE", "secret")
+
+
+class FakeBedrock:
+    """Records converse request bodies and caches system prefixes the way Bedrock does.
+
+    A prefix is cached only when it ends in a cache point and reaches the
+    model minimum; shorter prefixes are billed as plain input.
+    """
+
+    def __init__(self, reply: str, min_tokens: int = 2048) -> None:
+        self.reply = reply
+        self.min_tokens = min_tokens
+        self.bodies: list[dict] = []  # type: ignore[type-arg]
+        self.cached: set[str] = set()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.bodies.append(body)
+        system = body.get("system") or []
+        prefix = "".join(block.get("text", "") for block in system)
+        prefix_tokens = len(prefix) // 4
+        cacheable = bool(system) and "cachePoint" in system[-1] and prefix_tokens >= self.min_tokens
+        warm = cacheable and prefix in self.cached
+        if cacheable:
+            self.cached.add(prefix)
+        return httpx.Response(
+            200,
+            json={
+                "output": {"message": {"role": "assistant", "content": [{"text": self.reply}]}},
+                "usage": {
+                    "inputTokens": 20 + (0 if cacheable else prefix_tokens),
+                    "outputTokens": 10,
+                    "cacheReadInputTokens": prefix_tokens if warm else 0,
+                    "cacheWriteInputTokens": prefix_tokens if cacheable and not warm else 0,
+                },
+            },
+        )
+
+
+def _service(fake: FakeBedrock, accounting: TokenAccounting) -> AWSTranslationService:
+    settings = Settings()
+    settings.translation_hedge_history_ms = 0
+    service = AWSTranslationService(
+        settings,
+        gateway=LLMGateway(initial_limit=4, min_limit=1, max_limit=4, latency_target_ms=10000),
+        router=ModelRouter({}),
+        accounting=accounting,
+    )
+    service.client = BedrockRuntimeClient(settings, session=FakeSession(), transport=httpx.MockTransport(fake))
+    return service
+
+
+@pytest.mark.asyncio
+async def test_short_history_prompt_is_sent_without_an_ignored_cache_point() -> None:
+    fake = FakeBedrock("안녕하세요")
+    accounting = TokenAccounting()
+    service = _service(fake, accounting)
+
+    await service.translate_en_to_ko_history("Hello team.", ["spk_1: Morning"])
+    await service.translate_en_to_ko_history("Next item.", ["spk_1: Hello team."])
+    await service.aclose()
+
+    first, second = fake.bodies
+    assert first["system"] == second["system"]
+    assert [list(block) for block in first["system"]] == [["text"]]
+    assert "Translate English to natural Korean" in first["system"][0]["text"]
+    user_text = first["messages"][0]["content"][0]["text"]
+    assert "Current line: \"Hello team.\"" in user_text
+    assert "Translate" not in user_text
+
+    usage = accounting.snapshot()["translation.history"]
+    assert usage["calls"] == 2
+    assert usage["cache_read_tokens"] == 0
+    assert usage["cache_write_tokens"] == 0
+
+
+@pytest.mark.asyncio
+async def test_custom_suggestion_prompt_is_sent_as_a_static_system_block() -> None:
+    fake = FakeBedrock("[]")
+    accounting = TokenAccounting()
+    service = _service(fake, accounting)
+    suggestions = SuggestionService(service, service.settings)
+    custom_prompt = "Prefer short, polite replies that fit a product review meeting."
+    transcripts = [TranscriptEntry(speaker="spk_1", ts=1, text="Any updates?")]
+
+    prompt, system = suggestions._build_request(transcripts, custom_prompt)
+    await service._invoke_model("fast-model", prompt, system=system, call_site="suggestions")
+    await service.aclose()
+
+    system = fake.bodies[0]["system"]
+    assert [list(block) for block in system] == [["text"], ["text"]]
+    assert "Suggest 10 natural English sentences" in system[0]["text"]
+    assert custom_prompt in system[1]["text"]
+    assert fake.bodies[0]["messages"][0]["content"][0]["text"] == "Context:\n- spk_1: Any updates?"
+    assert accounting.snapshot()["suggestions"]["calls"] == 1
+
+
+def test_openai_usage_is_normalized() -> None:
+    accounting = TokenAccounting()
+    usage = SimpleNamespace(
+        prompt_tokens=1500,
+        completion_tokens=30,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=1280),
+    )
+    accounting.record_openai("translation.quick", usage)
+
+    snapshot = accounting.snapshot()["translation.quick"]
+    assert snapshot["input_tokens"] == 220
+    assert snapshot["cache_read_tokens"] == 1280
+    assert snapshot["saved_input_tokens"] == 640
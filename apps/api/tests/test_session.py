@@ -87,13 +87,6 @@ class TestExtractPartialEmit:
         result2 = session.extract_partial_emit("spk_1", 200, text)
         assert result2 is None
 
-    def test_translation_text_on_complete_sentence(self) -> None:
-        session = MeetingSession("sess")
-        text = "Hello world. This is"
-        result = session.extract_partial_emit("spk_1", 100, text)
-        assert result is not None
-        assert result.translation_text == "Hello world."
-
     def test_final_transcript_assigns_segment_id_after_short_partial(self) -> None:
         session = MeetingSession("sess")
         short_text = "Short"
@@ -172,39 +165,6 @@ class TestLongSentenceSplitting:
         assert buffer.confirmed[0].text == text
 
 
-class TestIsPartialTranslationCurrent:
-    """is_partial_translation_current() 상태 매칭 테스트"""
-
-    def test_no_state_returns_false(self) -> None:
-        session = MeetingSession("sess")
-        result = session.is_partial_translation_current("spk_1", 100, "text", 1)
-        assert result is False
-
-    def test_matching_state_returns_true(self) -> None:
-        session = MeetingSession("sess")
-        text = "First sentence. Second part"
-        emit = session.extract_partial_emit("spk_1", 100, text)
-        assert emit is not None
-        assert emit.translation_text is not None
-
-        result = session.is_partial_translation_current(
-            "spk_1", 100, emit.translation_text, emit.segment_id
-        )
-        assert result is True
-
-    def test_mismatched_ts_returns_false(self) -> None:
-        session = MeetingSession("sess")
-        text = "First sentence. Second part"
-        emit = session.extract_partial_emit("spk_1", 100, text)
-        assert emit is not None
-        assert emit.translation_text is not None
-
-        result = session.is_partial_translation_current(
-            "spk_1", 999, emit.translation_text, emit.segment_id
-        )
-        assert result is False
-
-
 class TestBuildPartialCaption:
     """_build_partial_caption() 테스트"""
 
@@ -332,3 +292,95 @@ class TestDisplayBufferTransitions:
         buffer1 = session.get_display_buffer()
         buffer2 = session.get_display_buffer()
         assert buffer1 is buffer2
+
+
+class TestPartialTranslationReuse:
+    """Composing 번역 재사용 테스트"""
+
+    def test_exact_match_after_normalization(self) -> None:
+        session = MeetingSession("sess")
+        session.record_partial_translation(1, "Let's review the roadmap", "로드맵을 검토합시다")
+
+        match = session.match_partial_translation(1, "Let's review the roadmap.")
+
+        assert match is not None
+        assert match.kind == "exact"
+        assert match.translated_text == "로드맵을 검토합시다"
+        assert session.partial_reuse_stats.exact == 1
+
+    def test_similar_text_returns_draft_for_revision(self) -> None:
+        session = MeetingSession("sess")
+        session.record_partial_translation(1, "We should ship the release on Friday", "금요일에 릴리스를 배포해야 합니다")
+
+        match = session.match_partial_translation(1, "We should ship the release on Friday morning.")
+
+        assert match is not None
+        assert match.kind == "similar"
+        assert match.source_text == "We should ship the release on Friday"
+        assert session.partial_reuse_stats.similar == 1
+
+    def test_divergent_text_is_miss_and_entry_is_consumed(self) -> None:
+        session = MeetingSession("sess")
+        session.record_partial_translation(1, "Hello there", "안녕하세요")
+
+        assert session.match_partial_translation(1, "Completely different sentence.") is None
+        assert session.match_partial_translation(1, "Hello there") is None
+        assert session.partial_reuse_stats.miss == 2
+        assert session.partial_reuse_stats.hit_rate == 0.0
+
+
+class TestSentenceGranularPartialTranslation:
+    """문장 단위 Composing 번역 테스트"""
+
+    def test_plan_returns_only_untranslated_sentences(self) -> None:
+        session = MeetingSession("sess")
+        caption = "We reviewed the rollout plan first. Then we went over the budget again. Still talking"
+        emit = session.extract_partial_emit("spk_1", 100, caption)
+        assert emit is not None
+
+        missing, remainder = session.plan_partial_translation(emit.segment_id, caption)
+        assert missing == ["We reviewed the rollout plan first.", "Then we went over the budget again."]
+        assert remainder == "Still talking"
+
+        session.record_sentence_translation(emit.segment_id, "We reviewed the rollout plan first.", "첫 문장.")
+        missing, _ = session.plan_partial_translation(emit.segment_id, caption)
+        assert missing == ["Then we went over the budget again."]
+
+    def test_plan_merges_short_sentences_into_the_next_one(self) -> None:
+        session = MeetingSession("sess")
+        caption = "OK. Yes. We reviewed the rollout plan first. Right. Sure"
+        emit = session.extract_partial_emit("spk_1", 100, caption)
+        assert emit is not None
+
+        missing, remainder = session.plan_partial_translation(emit.segment_id, caption)
+        assert missing == ["OK. Yes. We reviewed the rollout plan first."]
+        assert remainder == "Right. Sure"
+
+    def test_compose_joins_sentences_and_records_complete_translation(self) -> None:
+        session = MeetingSession("sess")
+        caption = "We reviewed the rollout plan first. Still talking"
+        emit = session.extract_partial_emit("spk_1", 100, caption)
+        assert emit is not None
+        segment_id = emit.segment_id
+
+        session.record_sentence_translation(segment_id, "We reviewed the rollout plan first.", "첫 문장.")
+        assert session.compose_partial_translation(segment_id, caption) == "첫 문장."
+
+        session.record_sentence_translation(segment_id, "Still talking", "계속 말하는 중", is_remainder=True)
+        assert session.compose_partial_translation(segment_id, caption) == "첫 문장. 계속 말하는 중"
+
+        session.add_final_transcript("spk_1", caption, 200)
+        match = session.match_partial_translation(segment_id, caption)
+        assert match is not None
+        assert match.kind == "exact"
+        assert match.translated_text == "첫 문장. 계속 말하는 중"
+
+    def test_stale_segment_translation_is_ignored(self) -> None:
+        session = MeetingSession("sess")
+        caption = "We reviewed the rollout plan first. Still talking"
+        emit = session.extract_partial_emit("spk_1", 100, caption)
+        assert emit is not None
+
+        sentence = "We reviewed the rollout plan first."
+        assert not session.record_sentence_translation(emit.segment_id + 1, sentence, "첫 문장.")
+        assert session.compose_partial_translation(emit.segment_id, caption) is None
@@ -1,32 +1,211 @@
+import asyncio
 import json
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
 
 import pytest
 
 from app.core.config import Settings
 from app.domain.models.session import TranscriptEntry
-from app.services.suggestion import SuggestionService
+from app.services.suggestion import JsonArrayStreamParser, SuggestionService
 
 
 @pytest.mark.asyncio
 async def test_suggestion_generation_threshold() -> None:
-    bedrock = SimpleNamespace(_invoke_model=AsyncMock(return_value="[]"))
-    service = SuggestionService(bedrock, Settings())
+    calls = 0
+
+    async def stream_model(model_id, prompt, **kwargs):  # type: ignore[no-untyped-def]
+        nonlocal calls
+        calls += 1
+        yield json.dumps(
+            [
+                {"en": "Can you clarify the timeline?", "ko": "일정을 명확히 해주실 수 있나요?"},
+                {"en": "Who owns the next action?", "ko": "다음 액션의 담당자는 누구인가요?"},
+            ]
+        )
+
+    service = SuggestionService(SimpleNamespace(_stream_model=stream_model), Settings())
 
     # Empty transcripts should return empty
-    result = await service.generate_suggestions([])
-    assert result == []
-    bedrock._invoke_model.assert_not_called()
-
-    response = json.dumps(
-        [
-            {"en": "Can you clarify the timeline?", "ko": "일정을 명확히 해주실 수 있나요?"},
-            {"en": "Who owns the next action?", "ko": "다음 액션의 담당자는 누구인가요?"},
-        ]
-    )
-    bedrock._invoke_model = AsyncMock(return_value=response)
-    transcripts = [TranscriptEntry(speaker="spk", ts=1, text="Hello.")]
+    assert [item async for item in service.stream_suggestions([])] == []
+    assert calls == 0
 
-    result = await service.generate_suggestions(transcripts)
+    transcripts = [TranscriptEntry(speaker="spk", ts=1, text="Hello.")]
+    result = [item async for item in service.stream_suggestions(transcripts)]
     assert 2 <= len(result) <= 5
+
+
+def test_json_array_stream_parser_emits_objects_as_they_close() -> None:
+    parser = JsonArrayStreamParser()
+    chunks = ['```json\n[{"en": "Sounds', ' good.", "ko": "좋아', '요."}, {"en": "Say \\"', 'hi\\" [now]", "ko": "안녕"}', "]\n```"]
+
+    emitted = [parser.feed(chunk) for chunk in chunks]
+
+    assert emitted == [
+        [],
+        [],
+        [{"en": "Sounds good.", "ko": "좋아요."}],
+        [{"en": 'Say "hi" [now]', "ko": "안녕"}],
+        [],
+    ]
+    assert parser.feed('{"en": "late", "ko": "늦음"}') == []
+
+
+@pytest.mark.asyncio
+async def test_stream_suggestions_yields_items_incrementally() -> None:
+    sent: list[str] = []
+    chunks = ['[{"en": "Any blockers?", "ko": "막힌 부분 있나요?"},', ' {"en": "", "ko": "빈"},', ' {"en": "Next step?", "ko": "다음 단계는요?"}]']
+
+    async def stream_model(model_id, prompt, **kwargs):  # type: ignore[no-untyped-def]
+        assert kwargs["call_site"] == "suggestions"
+        for chunk in chunks:
+            await asyncio.sleep(0)
+            sent.append(chunk)
+            yield chunk
+
+    service = SuggestionService(SimpleNamespace(_stream_model=stream_model), Settings())
+    transcripts = [TranscriptEntry(speaker="spk", ts=1, text="Let's review.")]
+
+    items = []
+    chunks_sent_at_yield = []
+    async for item in service.stream_suggestions(transcripts):
+        items.append(item)
+        chunks_sent_at_yield.append(len(sent))
+
+    assert items == [
+        {"en": "Any blockers?", "ko": "막힌 부분 있나요?"},
+        {"en": "Next step?", "ko": "다음 단계는요?"},
+    ]
+    assert chunks_sent_at_yield == [1, 3]
+
+
+@pytest.mark.asyncio
+async def test_model_stream_is_closed_once_enough_suggestions_arrived() -> None:
+    closed = asyncio.Event()
+
+    async def stream_model(model_id, prompt, **kwargs):  # type: ignore[no-untyped-def]
+        try:
+            yield "["
+            for index in range(20):
+                yield json.dumps({"en": f"Option {index}?", "ko": f"선택 {index}?"}) + ","
+            await asyncio.Event().wait()
+        finally:
+            closed.set()
+
+    service = SuggestionService(SimpleNamespace(_stream_model=stream_model), Settings())
+    transcripts = [TranscriptEntry(speaker="spk", ts=1, text="Let's review.")]
+
+    items = [item async for item in service.stream_suggestions(transcripts)]
+
+    assert len(items) == 10
+    assert closed.is_set()
+
+
+@pytest.mark.asyncio
+async def test_stream_suggestions_falls_back_to_line_format() -> None:
+    async def stream_model(model_id, prompt, **kwargs):  # type: ignore[no-untyped-def]
+        yield "- Could you repeat that? | 다시 말씀해 주시겠어요?\n"
+
+    service = SuggestionService(SimpleNamespace(_stream_model=stream_model), Settings())
+    transcripts = [TranscriptEntry(speaker="spk", ts=1, text="Hello.")]
+
+    items = [item async for item in service.stream_suggestions(transcripts)]
+
+    assert items == [{"en": "Could you repeat that?", "ko": "다시 말씀해 주시겠어요?"}]
+
+
+@pytest.mark.asyncio
+async def test_stream_suggestions_serves_repeated_context_from_cache() -> None:
+    calls = 0
+
+    async def stream_model(model_id, prompt, **kwargs):  # type: ignore[no-untyped-def]
+        nonlocal calls
+        calls += 1
+        yield '[{"en": "Good point.", "ko": "좋은 지적이에요."}]'
+
+    settings = Settings()
+    settings.suggestions_cache_max_entries = 1
+    service = SuggestionService(SimpleNamespace(_stream_model=stream_model), settings)
+    first = [TranscriptEntry(speaker="spk", ts=1, text="Let's review the budget.")]
+    reconnected = [TranscriptEntry(speaker="spk", ts=9, text="let's review  the budget")]
+
+    assert [item async for item in service.stream_suggestions(first, "Be brief")] == [
+        {"en": "Good point.", "ko": "좋은 지적이에요."}
+    ]
+    assert [item async for item in service.stream_suggestions(reconnected, " be brief ")] == [
+        {"en": "Good point.", "ko": "좋은 지적이에요."}
+    ]
+    assert calls == 1
+
+    [item async for item in service.stream_suggestions(first, "Be formal")]
+    [item async for item in service.stream_suggestions(first, "Be brief")]
+    assert calls == 3
+    assert service.cache.stats.snapshot()["evictions"] == 2
+    assert service.cache.stats.hits == 1
+
+
+def test_context_fingerprint_only_looks_at_the_prompt_window() -> None:
+    older = [TranscriptEntry(speaker="spk", ts=index, text=f"Line {index}.") for index in range(7)]
+
+    assert SuggestionService.context_fingerprint(older, None) == SuggestionService.context_fingerprint(older[2:], "")
+    assert SuggestionService.context_fingerprint(older, None) != SuggestionService.context_fingerprint(older[1:6], None)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_model_stream() -> None:
+    calls = 0
+    release = asyncio.Event()
+
+    async def stream_model(model_id, prompt, **kwargs):  # type: ignore[no-untyped-def]
+        nonlocal calls
+        calls += 1
+        yield '[{"en": "Sounds good.", "ko": "좋아요."},'
+        await release.wait()
+        yield ' {"en": "Let\'s do it.", "ko": "그렇게 해요."}]'
+
+    service = SuggestionService(SimpleNamespace(_stream_model=stream_model), Settings())
+    transcripts = [TranscriptEntry(speaker="spk", ts=1, text="Shall we start?")]
+
+    async def collect() -> list[dict[str, str]]:
+        return [item async for item in service.stream_suggestions(transcripts)]
+
+    first = asyncio.create_task(collect())
+    await asyncio.sleep(0.01)
+    second = asyncio.create_task(collect())
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(first, second)
+
+    assert calls == 1
+    assert results[0] == results[1]
+    assert len(results[0]) == 2
+    assert service.cache.stats.coalesced == 1
+    assert [item async for item in service.stream_suggestions(transcripts)] == results[0]
+    assert service.cache.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_stream_error_reaches_every_reader() -> None:
+    async def stream_model(model_id, prompt, **kwargs):  # type: ignore[no-untyped-def]
+        await asyncio.sleep(0.01)
+        raise RuntimeError("model down")
+        yield ""
+
+    service = SuggestionService(SimpleNamespace(_stream_model=stream_model), Settings())
+    transcripts = [TranscriptEntry(speaker="spk", ts=1, text="Shall we start?")]
+
+    async def collect() -> list[dict[str, str]]:
+        return [item async for item in service.stream_suggestions(transcripts)]
+
+    results = await asyncio.gather(collect(), collect(), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert service.cache.get(SuggestionService.context_fingerprint(transcripts, None)) is None
+
+
+def test_context_fingerprint_tells_questions_from_statements() -> None:
+    question = [TranscriptEntry(speaker="spk", ts=1, text="Is it ready?")]
+    statement = [TranscriptEntry(speaker="spk", ts=1, text="Is it ready.")]
+    spaced = [TranscriptEntry(speaker="spk", ts=1, text="is it  READY?")]
+
+    assert SuggestionService.context_fingerprint(question, None) != SuggestionService.context_fingerprint(statement, None)
+    assert SuggestionService.context_fingerprint(question, None) == SuggestionService.context_fingerprint(spaced, None)
@@ -0,0 +1,114 @@
+from app.domain.models.session import MeetingSession
+from app.domain.models.topic import SuggestionTrigger, topic_novelty, topic_vector
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _session(clock: FakeClock) -> MeetingSession:
+    return MeetingSession("s1", SuggestionTrigger(min_interval_s=5.0, novelty_threshold=0.7, clock=clock))
+
+
+def _say(session: MeetingSession, clock: FakeClock, text: str) -> str | None:
+    clock.now += 6.0
+    session.add_final_transcript("spk_1", text, int(clock.now * 1000))
+    reason = session.should_update_suggestions(False)
+    if reason:
+        session.mark_suggestions_updated()
+    return reason
+
+
+def test_novelty_is_low_for_the_same_topic_and_high_for_a_new_one() -> None:
+    baseline = topic_vector(["The database migration is scheduled for Friday night."])
+
+    same = topic_novelty(topic_vector(["We need a rollback plan for the database migration."]), baseline)
+    shifted = topic_novelty(topic_vector(["Marketing wants new banner designs for spring."]), baseline)
+
+    assert same < 0.8 <= shifted
+    assert topic_novelty(topic_vector(["Okay, yeah."]), baseline) == 0.0
+
+
+def test_suggestions_follow_topic_shifts_and_questions_not_every_second_final() -> None:
+    clock = FakeClock()
+    session = _session(clock)
+
+    reasons = [
+        _say(session, clock, "The database migration is scheduled for Friday night."),
+        _say(session, clock, "The migration touches the billing database tables."),
+        _say(session, clock, "Billing tables need a rollback plan for the migration."),
+        _say(session, clock, "The rollback plan for billing migration is drafted."),
+        _say(session, clock, "Did anyone review the rollback plan"),
+        _say(session, clock, "Separately, marketing wants spring campaign banner designs."),
+    ]
+
+    assert reasons[0] == "first"
+    assert reasons[1:4] == [None, None, None]
+    assert reasons[4] == "question"
+    assert reasons[5] == "topic_shift"
+    stats = session.suggestion_trigger.stats.snapshot()
+    assert stats == {"triggered": 3, "saved": 1}
+
+
+def test_statements_and_imperatives_starting_with_an_auxiliary_are_not_questions() -> None:
+    clock = FakeClock()
+    session = _session(clock)
+
+    reasons = [
+        _say(session, clock, "The database migration is scheduled for Friday night."),
+        _say(session, clock, "Do the database migration first."),
+        _say(session, clock, "Is what I said about the migration earlier, basically."),
+        _say(session, clock, "Can you check the migration rollback"),
+    ]
+
+    assert reasons == ["first", None, None, "question"]
+
+
+def test_min_interval_holds_back_even_questions() -> None:
+    clock = FakeClock()
+    trigger = SuggestionTrigger(min_interval_s=10.0, clock=clock)
+
+    assert trigger.evaluate(["Kickoff for the mobile release."]) == "first"
+    trigger.mark_generated(["Kickoff for the mobile release."])
+    clock.now = 4.0
+    assert trigger.evaluate(["Kickoff for the mobile release.", "Any questions?"]) is None
+    clock.now = 11.0
+    assert trigger.evaluate(["Kickoff for the mobile release.", "Any questions?"]) == "question"
+
+
+def test_speculation_commits_when_the_final_matches_the_partial() -> None:
+    clock = FakeClock()
+    session = _session(clock)
+    _say(session, clock, "Let's go over the release checklist.")
+    clock.now += 6.0
+
+    assert session.start_speculative_suggestions(2, "spk_1", 100, "Let's keep going and") is None
+    speculation = session.start_speculative_suggestions(2, "spk_1", 100, "Can we ship by Friday?")
+    assert speculation is not None
+    assert [entry.text for entry in speculation.context][-1] == "Can we ship by Friday?"
+    assert session.start_speculative_suggestions(2, "spk_1", 120, "Can we ship by Friday?") is None
+
+    session.add_final_transcript("spk_1", "Can we ship by Friday?", 130)
+    trigger = session.should_update_suggestions(False)
+    assert trigger == "question"
+    assert session.resolve_speculative_suggestions(2, "Can we ship by Friday?", bool(trigger)) is speculation
+    assert session.speculation_stats.hit_rate == 1.0
+
+
+def test_speculation_is_discarded_when_the_final_diverges() -> None:
+    clock = FakeClock()
+    session = _session(clock)
+    _say(session, clock, "Let's go over the release checklist.")
+    clock.now += 6.0
+
+    assert session.start_speculative_suggestions(2, "spk_1", 100, "Should we delay the launch?") is not None
+    final = "Should we delay the launch of the mobile app until the security review is finished?"
+
+    assert session.resolve_speculative_suggestions(2, final, True) is None
+    assert session.speculation_stats.waste_rate == 1.0
+    assert session.resolve_speculative_suggestions(3, "Anything else?", True) is None
+    assert session.speculation_stats.discarded == 1
@@ -1,3 +1,4 @@
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, ANY
 
@@ -5,7 +6,8 @@ import pytest
 
 from app.core.config import Settings
 from app.domain.models.session import TranscriptEntry
-from app.services.summary import SummaryService
+from app.services.llm.gateway import LLMPriority
+from app.services.summary import RollingSummary, SummaryService
 
 
 @pytest.mark.asyncio
@@ -91,7 +93,9 @@ async def test_model_selection_fallback() -> None:
     service = SummaryService(bedrock, settings)
     
     await service.generate_summary([TranscriptEntry(speaker="spk", ts=1, text="text")])
-    bedrock._invoke_model.assert_called_with("high-model", ANY)
+    bedrock._invoke_model.assert_called_with(
+        "high-model", ANY, system=ANY, call_site="summary", priority=LLMPriority.INTERACTIVE
+    )
 
     # Case 2: High model ID is missing (fallback)
     bedrock._invoke_model.reset_mock()
@@ -102,4 +106,138 @@ async def test_model_selection_fallback() -> None:
     service = SummaryService(bedrock, settings)
     
     await service.generate_summary([TranscriptEntry(speaker="spk", ts=1, text="text")])
-    bedrock._invoke_model.assert_called_with("fast-model", ANY)
+    bedrock._invoke_model.assert_called_with(
+        "fast-model", ANY, system=ANY, call_site="summary", priority=LLMPriority.INTERACTIVE
+    )
+
+
+@pytest.mark.asyncio
+async def test_rolling_summary_condenses_closed_windows_once_and_reduces_with_tail() -> None:
+    async def invoke(model_id, prompt, **kwargs):  # type: ignore[no-untyped-def]
+        if kwargs["call_site"] == "summary.map":
+            return f"- notes({prompt.count(chr(10)) + 1} lines)"
+        return "## 5줄 요약\n- ok"
+
+    bedrock = SimpleNamespace(_invoke_model=AsyncMock(side_effect=invoke))
+    service = SummaryService(bedrock, Settings())
+    rolling = RollingSummary(service, window_chars=30, max_chunks=2)
+    transcripts = [TranscriptEntry(speaker="spk_1", ts=index, text=f"Sentence number {index:02d}.") for index in range(3)]
+
+    assert not rolling.has_closed_window(transcripts[:2])
+    assert rolling.has_closed_window(transcripts)
+    assert await rolling.advance(transcripts) == 1
+    assert rolling.covered == 2
+    assert rolling.chunks == ["- notes(2 lines)"]
+    assert await rolling.advance(transcripts) == 0
+
+    await rolling.summarize(transcripts)
+    reduce_call = bedrock._invoke_model.call_args
+    assert reduce_call.kwargs == {"system": ANY, "call_site": "summary", "priority": LLMPriority.INTERACTIVE}
+    prompt = reduce_call.args[1]
+    assert "- notes(2 lines)" in prompt
+    assert "spk_1: Sentence number 02." in prompt
+    assert "Sentence number 00." not in prompt
+
+
+@pytest.mark.asyncio
+async def test_rolling_summary_merges_old_notes_to_stay_bounded() -> None:
+    bedrock = SimpleNamespace(_invoke_model=AsyncMock(return_value="- merged"))
+    service = SummaryService(bedrock, Settings())
+    rolling = RollingSummary(service, window_chars=10, max_chunks=2)
+    transcripts = [TranscriptEntry(speaker="spk_1", ts=index, text=f"Line {index} here.") for index in range(6)]
+
+    assert await rolling.advance(transcripts) == 5
+
+    assert rolling.covered == 5
+    assert len(rolling.chunks) <= 2
+    map_calls = [call for call in bedrock._invoke_model.call_args_list if call.kwargs["call_site"] == "summary.map"]
+    assert all(call.kwargs["priority"] == LLMPriority.BACKGROUND for call in map_calls)
+
+
+@pytest.mark.asyncio
+async def test_rolling_summary_serves_unchanged_transcripts_from_cache() -> None:
+    release = asyncio.Event()
+
+    async def invoke(model_id, prompt, **kwargs):  # type: ignore[no-untyped-def]
+        await release.wait()
+        return f"## 5줄 요약\n- {prompt.count('spk_1')} lines"
+
+    bedrock = SimpleNamespace(_invoke_model=AsyncMock(side_effect=invoke))
+    rolling = RollingSummary(SummaryService(bedrock, Settings()))
+    transcripts = [TranscriptEntry(speaker="spk_1", ts=1, text="We agreed on the scope.")]
+
+    assert rolling.is_stale(transcripts, min_new=1)
+    first = asyncio.create_task(rolling.refresh(transcripts))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(rolling.summarize(transcripts, priority=LLMPriority.BACKGROUND))
+    await asyncio.sleep(0)
+    release.set()
+    await first
+
+    assert await second == ("## 5줄 요약\n- 1 lines", "COALESCED")
+    assert bedrock._invoke_model.call_count == 1
+    assert bedrock._invoke_model.call_args.kwargs["priority"] == LLMPriority.BACKGROUND
+    assert await rolling.summarize(transcripts) == ("## 5줄 요약\n- 1 lines", "HIT")
+    assert not rolling.is_stale(transcripts, min_new=1)
+
+    transcripts.append(TranscriptEntry(speaker="spk_1", ts=2, text="Launch moves to May."))
+    assert await rolling.summarize(transcripts) == ("## 5줄 요약\n- 2 lines", "MISS")
+    assert bedrock._invoke_model.call_args.kwargs["priority"] == LLMPriority.INTERACTIVE
+
+
+@pytest.mark.asyncio
+async def test_interactive_request_supersedes_background_refresh() -> None:
+    release = asyncio.Event()
+    background_started = asyncio.Event()
+
+    async def invoke(model_id, prompt, **kwargs):  # type: ignore[no-untyped-def]
+        background_started.set()
+        await release.wait()
+        return "## 5줄 요약\n- background"
+
+    async def stream_model(model_id, prompt, **kwargs):  # type: ignore[no-untyped-def]
+        assert kwargs["priority"] == LLMPriority.INTERACTIVE
+        yield "## 5줄 요약\n"
+        yield "- interactive"
+
+    bedrock = SimpleNamespace(_invoke_model=AsyncMock(side_effect=invoke), _stream_model=stream_model)
+    rolling = RollingSummary(SummaryService(bedrock, Settings()))
+    transcripts = [TranscriptEntry(speaker="spk_1", ts=1, text="We agreed on the scope.")]
+    deltas: list[str] = []
+
+    async def on_delta(delta: str) -> None:
+        deltas.append(delta)
+
+    refresh = asyncio.create_task(rolling.refresh(transcripts))
+    await background_started.wait()
+    markdown, status = await rolling.summarize(transcripts, on_delta=on_delta)
+    await refresh
+
+    assert (markdown, status) == ("## 5줄 요약\n- interactive", "MISS")
+    assert deltas == ["## 5줄 요약\n", "- interactive"]
+    assert rolling.cached == (1, "## 5줄 요약\n- interactive")
+    assert not release.is_set()
+
+
+@pytest.mark.asyncio
+async def test_rolling_summary_streams_fresh_summaries_and_caches_the_result() -> None:
+    async def stream_model(model_id, prompt, **kwargs):  # type: ignore[no-untyped-def]
+        assert kwargs["call_site"] == "summary"
+        for chunk in ["## 5줄 요약\n- 범위 합의\n", "## 핵심 내용\n", "- 일정 유지\n"]:
+            yield chunk
+
+    bedrock = SimpleNamespace(_stream_model=stream_model)
+    rolling = RollingSummary(SummaryService(bedrock, Settings()))
+    transcripts = [TranscriptEntry(speaker="spk_1", ts=1, text="We agreed on the scope.")]
+    deltas: list[str] = []
+
+    async def on_delta(delta: str) -> None:
+        deltas.append(delta)
+
+    markdown, status = await rolling.summarize(transcripts, on_delta=on_delta)
+
+    assert status == "MISS"
+    assert deltas[0] == "## 5줄 요약\n- 범위 합의\n"
+    assert markdown == "".join(deltas).strip()
+    assert await rolling.summarize(transcripts, on_delta=on_delta) == (markdown, "HIT")
+    assert len(deltas) == 3
@@ -1,7 +1,13 @@
+import asyncio
+from collections import Counter
+
+import httpx
+import pytest
 from fastapi.testclient import TestClient
 
-from app.core.deps import get_translation_service
+from app.core.deps import get_quick_translate_cache, get_translation_service
 from app.main import app
+from app.services.translation.coalescing import CoalescingCache
 
 
 class FakeTranslationService:
@@ -24,3 +30,120 @@ def test_translate_success() -> None:
     assert response.status_code == 200
     assert response.json()["translatedText"] == "translated"
     app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_upstream_call() -> None:
+    class SlowTranslationService:
+        calls: list[str] = []
+
+        async def translate_ko_to_en(self, text: str) -> str:
+            SlowTranslationService.calls.append(text)
+            await asyncio.sleep(0.05)
+            return f"en({text})"
+
+    cache: CoalescingCache[str] = CoalescingCache(ttl_s=30, max_entries=16)
+    app.dependency_overrides[get_translation_service] = lambda: SlowTranslationService()
+    app.dependency_overrides[get_quick_translate_cache] = lambda: cache
+    texts = ["안녕하세요"] * 40 + ["감사합니다", " 감사합니다  "] * 5 + ["회의 시작할게요"] * 5
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            responses = await asyncio.gather(
+                *(client.post("/api/v1/translate/ko-en", json={"text": text}) for text in texts)
+            )
+            repeat = await client.post("/api/v1/translate/ko-en", json={"text": "안녕하세요"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert all(response.status_code == 200 for response in responses)
+    assert [response.json()["translatedText"] for response in responses[:2]] == ["en(안녕하세요)"] * 2
+    assert sorted(SlowTranslationService.calls) == sorted(["안녕하세요", "감사합니다", "회의 시작할게요"])
+    statuses = Counter(response.headers["X-Cache"] for response in responses)
+    assert statuses == {"MISS": 3, "COALESCED": len(texts) - 3}
+    assert repeat.headers["X-Cache"] == "HIT"
+    assert cache.stats.snapshot()["upstream_saved_ratio"] == pytest.approx(1 - 3 / (len(texts) + 1), abs=1e-3)
+
+
+@pytest.mark.asyncio
+async def test_failures_are_shared_but_not_cached_and_results_expire() -> None:
+    now = [0.0]
+    cache: CoalescingCache[str] = CoalescingCache(ttl_s=10, max_entries=1, clock=lambda: now[0])
+    gate = asyncio.Event()
+
+    async def failing() -> str:
+        await gate.wait()
+        raise RuntimeError("upstream down")
+
+    first = asyncio.ensure_future(cache.get_or_run("k", failing))
+    second = asyncio.ensure_future(cache.get_or_run("k", failing))
+    await asyncio.sleep(0)
+    gate.set()
+    results = await asyncio.gather(first, second, return_exceptions=True)
+    assert [str(result) for result in results] == ["upstream down", "upstream down"]
+
+    async def ok() -> str:
+        return "fine"
+
+    assert await cache.get_or_run("k", ok) == ("fine", "MISS")
+    assert await cache.get_or_run("k", ok) == ("fine", "HIT")
+    now[0] = 11
+    assert await cache.get_or_run("k", ok) == ("fine", "MISS")
+    await cache.get_or_run("other", ok)
+    assert await cache.get_or_run("k", ok) == ("fine", "MISS")
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_the_shared_call() -> None:
+    cache: CoalescingCache[str] = CoalescingCache(ttl_s=10, max_entries=4)
+
+    async def slow() -> str:
+        await asyncio.sleep(0.02)
+        return "done"
+
+    leader = asyncio.ensure_future(cache.get_or_run("k", slow))
+    follower = asyncio.ensure_future(cache.get_or_run("k", slow))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == ("done", "COALESCED")
+
+
+def test_batch_translate_dedupes_and_returns_per_item_results_in_order() -> None:
+    class BatchTranslationService:
+        calls: list[str] = []
+
+        async def translate_ko_to_en(self, text: str) -> str:
+            BatchTranslationService.calls.append(text)
+            if text == "실패":
+                raise RuntimeError("upstream down")
+            return f"en({text})"
+
+        async def translate_en_to_ko(self, text: str) -> str:
+            return f"ko({text})"
+
+    cache: CoalescingCache[str] = CoalescingCache(ttl_s=30, max_entries=16)
+    app.dependency_overrides[get_translation_service] = lambda: BatchTranslationService()
+    app.dependency_overrides[get_quick_translate_cache] = lambda: cache
+    client = TestClient(app)
+    try:
+        client.post("/api/v1/translate/ko-en", json={"text": "안녕하세요"})
+        response = client.post(
+            "/api/v1/translate/batch",
+            json={"texts": ["감사합니다", "안녕하세요", "  ", "실패", "감사합니다 "]},
+        )
+        en_ko = client.post("/api/v1/translate/batch", json={"texts": ["Hi."], "direction": "en-ko"})
+        too_many = client.post("/api/v1/translate/batch", json={"texts": ["a"] * 33})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.json()["results"] == [
+        {"translatedText": "en(감사합니다)", "error": None, "cache": "MISS"},
+        {"translatedText": "en(안녕하세요)", "error": None, "cache": "HIT"},
+        {"translatedText": None, "error": "text is required", "cache": None},
+        {"translatedText": None, "error": "translation failed", "cache": None},
+        {"translatedText": "en(감사합니다)", "error": None, "cache": "MISS"},
+    ]
+    assert BatchTranslationService.calls == ["안녕하세요", "감사합니다", "실패"]
+    assert en_ko.json()["results"][0]["translatedText"] == "ko(Hi.)"
+    assert too_many.status_code == 400
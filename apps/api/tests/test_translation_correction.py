@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from app.services.translation.aws import AWSTranslationService
+from app.services.translation.correction import CorrectionBatcher, CorrectionItem
+
+
+def _item(segment_id: int) -> CorrectionItem:
+    return CorrectionItem(
+        segment_id=segment_id,
+        source_ts=segment_id,
+        speaker="spk_1",
+        source_text=f"line {segment_id}",
+        draft_translation=f"초안 {segment_id}",
+    )
+
+
+@pytest.mark.asyncio
+async def test_batcher_flushes_after_window_and_skips_empty_results() -> None:
+    batches: list[list[int]] = []
+    corrected: list[tuple[int, str]] = []
+
+    async def correct(items: list[CorrectionItem]) -> list[str | None]:
+        batches.append([item.segment_id for item in items])
+        return [f"교정 {item.segment_id}" if item.segment_id != 2 else None for item in items]
+
+    async def on_corrected(item: CorrectionItem, text: str) -> None:
+        corrected.append((item.segment_id, text))
+
+    batcher = CorrectionBatcher(correct, on_corrected, window_s=0.02, max_batch=4)
+    batcher.add(_item(1))
+    batcher.add(_item(2))
+    await asyncio.sleep(0.05)
+
+    assert batches == [[1, 2]]
+    assert corrected == [(1, "교정 1")]
+    await batcher.aclose()
+
+
+@pytest.mark.asyncio
+async def test_batcher_flushes_immediately_when_full() -> None:
+    batches: list[list[int]] = []
+
+    async def correct(items: list[CorrectionItem]) -> list[str | None]:
+        batches.append([item.segment_id for item in items])
+        return [None] * len(items)
+
+    async def on_corrected(item: CorrectionItem, text: str) -> None:
+        return None
+
+    batcher = CorrectionBatcher(correct, on_corrected, window_s=10, max_batch=2)
+    batcher.add(_item(1))
+    batcher.add(_item(2))
+    await asyncio.sleep(0)
+    batcher.add(_item(3))
+    await asyncio.sleep(0)
+
+    assert batches == [[1, 2]]
+    assert batcher.pending == 1
+    await batcher.aclose()
+
+
+def test_parse_indexed_translations_maps_results_by_id() -> None:
+    response = 'Here you go: [{"id": 1, "ko": "둘"}, {"id": 0, "ko": "하나"}, {"id": 7, "ko": "x"}]'
+
+    assert AWSTranslationService._parse_indexed_translations(response, 3) == ["하나", "둘", None]
+    assert AWSTranslationService._parse_indexed_translations("not json", 2) == [None, None]
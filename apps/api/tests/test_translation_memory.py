@@ -0,0 +1,90 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.config import Settings
+from app.services.translation.aws import AWSTranslationService
+from app.services.translation.memory import MinHasher, TranslationMemory
+
+
+def test_exact_match_ignores_case_and_punctuation(tmp_path) -> None:
+    memory = TranslationMemory(tmp_path / "memory.sqlite3")
+    memory.record("Let's start with the status update.", "**현황** 업데이트부터 시작하죠.")
+
+    matches = memory.lookup("let's start with the status update")
+
+    assert [(match.kind, match.similarity) for match in matches] == [("exact", 1.0)]
+    assert matches[0].translated_text == "**현황** 업데이트부터 시작하죠."
+    memory.close()
+
+
+def test_near_identical_line_is_served_but_changed_numbers_are_only_references(tmp_path) -> None:
+    memory = TranslationMemory(tmp_path / "memory.sqlite3")
+    memory.record("We shipped the release to 20 customers yesterday.", "어제 고객 20곳에 릴리스를 배포했습니다.")
+    memory.record("Let's start with the status update.", "현황 업데이트부터 시작하죠.")
+
+    served = memory.lookup("We shipped the releases to 20 customers yesterday.")
+    changed = memory.lookup("We shipped the release to 30 customers yesterday.")
+    related = memory.lookup("Let's begin with a quick status update.")
+
+    assert served[0].kind == "fuzzy"
+    assert served[0].similarity >= memory.serve_similarity
+    assert changed[0].kind == "reference"
+    assert [(match.kind, match.source_text) for match in related] == [
+        ("reference", "Let's start with the status update.")
+    ]
+    assert memory.lookup("Completely unrelated sentence about lunch.") == []
+    memory.close()
+
+
+def test_questions_and_statements_do_not_share_translations(tmp_path) -> None:
+    memory = TranslationMemory(tmp_path / "memory.sqlite3")
+    memory.record("Is it deployed?", "배포됐나요?")
+    memory.record("We ship it tomorrow.", "내일 배포합니다.")
+
+    statement = memory.lookup("Is it deployed.")
+    question = memory.lookup("We ship it tomorrow?")
+
+    assert [match.kind for match in statement] == ["reference"]
+    assert [match.kind for match in question] == ["reference"]
+    assert memory.lookup("is it deployed?")[0].kind == "exact"
+    memory.close()
+
+
+def test_entries_persist_across_reopen_and_rerecord_updates(tmp_path) -> None:
+    path = tmp_path / "nested" / "memory.sqlite3"
+    memory = TranslationMemory(path)
+    memory.record("Any questions?", "질문 있나요?")
+    memory.record("Any questions?", "질문 있으신가요?")
+    memory.close()
+
+    reopened = TranslationMemory(path)
+    assert len(reopened) == 1
+    assert reopened.lookup("Any questions?")[0].translated_text == "질문 있으신가요?"
+    reopened.close()
+
+
+def test_memory_is_disabled_without_a_path() -> None:
+    assert TranslationMemory.from_settings(Settings()) is None
+    with pytest.raises(ValueError):
+        MinHasher(num_perm=50, bands=16)
+
+
+@pytest.mark.asyncio
+async def test_references_are_rendered_in_the_user_turn() -> None:
+    settings = Settings()
+    settings.translation_hedge_history_ms = 0
+    service = AWSTranslationService(settings)
+    service._invoke_model = AsyncMock(return_value="현황 업데이트부터 빠르게 시작하죠.")
+
+    await service.translate_en_to_ko_history(
+        "Let's begin with a quick status update.",
+        references=[("Let's start with the status update.", "현황 업데이트부터 시작하죠.")],
+    )
+
+    prompt = service._invoke_model.call_args.args[1]
+    assert prompt.splitlines()[:2] == [
+        "Reference translations:",
+        '- "Let\'s start with the status update." => "현황 업데이트부터 시작하죠."',
+    ]
+    assert "reference translations" in service._invoke_model.call_args.kwargs["system"]
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from app.services.translation.scheduler import TranslationPriority, TranslationScheduler
+
+
+@pytest.mark.asyncio
+async def test_queued_final_runs_before_queued_partial() -> None:
+    scheduler = TranslationScheduler(max_concurrency=1)
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def job(name: str, priority: TranslationPriority, hold: bool = False) -> None:
+        async with scheduler.slot(priority):
+            order.append(name)
+            if hold:
+                await release.wait()
+
+    blocker = asyncio.create_task(job("blocker", TranslationPriority.PARTIAL, hold=True))
+    await asyncio.sleep(0)
+    partial = asyncio.create_task(job("partial", TranslationPriority.PARTIAL))
+    await asyncio.sleep(0)
+    final = asyncio.create_task(job("final", TranslationPriority.FINAL_DISPLAY))
+    await asyncio.sleep(0)
+
+    release.set()
+    await asyncio.gather(blocker, partial, final)
+
+    assert order == ["blocker", "final", "partial"]
+    assert scheduler.wait_stats[TranslationPriority.FINAL_DISPLAY].count == 1
+    assert scheduler.wait_stats[TranslationPriority.PARTIAL].max_ms > 0
+
+
+@pytest.mark.asyncio
+async def test_cancel_group_drops_superseded_partial_jobs() -> None:
+    scheduler = TranslationScheduler(max_concurrency=1)
+    release = asyncio.Event()
+    ran: list[str] = []
+
+    async def job(name: str) -> None:
+        async with scheduler.slot(TranslationPriority.PARTIAL):
+            ran.append(name)
+            await release.wait()
+
+    running = scheduler.submit(TranslationPriority.PARTIAL, job("running"), key=(1, "a"), group=1)
+    queued = scheduler.submit(TranslationPriority.PARTIAL, job("queued"), key=(1, "b"), group=1)
+    other = scheduler.submit(TranslationPriority.PARTIAL, job("other"), key=(2, "a"), group=2)
+    await asyncio.sleep(0)
+
+    assert scheduler.cancel_group(1) == 2
+    release.set()
+    await asyncio.gather(running, queued, other, return_exceptions=True)
+
+    assert ran == ["running", "other"]
+    assert scheduler.wait_stats[TranslationPriority.PARTIAL].cancelled == 2
+
+
+@pytest.mark.asyncio
+async def test_submit_deduplicates_or_replaces_by_key() -> None:
+    scheduler = TranslationScheduler(max_concurrency=2)
+    started: list[str] = []
+
+    async def job(name: str) -> None:
+        started.append(name)
+        await asyncio.sleep(0.01)
+
+    first = scheduler.submit(TranslationPriority.PARTIAL, job("first"), key="k")
+    duplicate = scheduler.submit(TranslationPriority.PARTIAL, job("duplicate"), key="k")
+    replacement = scheduler.submit(TranslationPriority.PARTIAL, job("replacement"), key="k", replace=True)
+    await asyncio.gather(first, replacement, return_exceptions=True)
+
+    assert duplicate is None
+    assert first is not None and first.cancelled()
+    assert started == ["replacement"]
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from typing import AsyncIterator, Callable
 
 from fastapi.testclient import TestClient
@@ -8,23 +11,62 @@ from app.core.config import Settings
 from app.main import app
 from app.ws import meetings as meetings_module
 from app.domain.models.provider import TranscriptResult
+from app.services.llm.gateway import LLMPriority
+from app.services.translation.memory import TranslationMemory
 
 
 class FakeTranslationService:
-    async def translate_en_to_ko(self, text: str) -> str:
+    async def translate_en_to_ko(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> str:
         return "translated"
 
     async def translate_en_to_ko_history(
-        self, text: str, recent_context: list[str] | None = None
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
     ) -> str:
         return "translated_history"
 
+    async def stream_en_to_ko_history(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> AsyncIterator[str]:
+        yield "translated"
+        yield "_history"
+
+    async def stream_en_to_ko_draft(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        references: list[tuple[str, str]] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> AsyncIterator[str]:
+        yield "translated"
+        yield "_history"
+
+    async def correct_en_to_ko_batch(self, items: list) -> list[str | None]:  # type: ignore[type-arg]
+        return [None] * len(items)
+
     async def translate_for_display(
         self, text: str, confirmed_texts: list[str]
     ) -> str:
         return "translated_display"
 
-    async def translate_ko_to_en(self, text: str) -> str:
+    async def translate_ko_to_en(
+        self,
+        text: str,
+        recent_context: list[str] | None = None,
+        glossary: list[tuple[str, str]] | None = None,
+    ) -> str:
         return "translated"
 
 
@@ -34,11 +76,22 @@ class FakeSuggestionService:
     ):
         return []
 
+    async def stream_suggestions(  # type: ignore[no-untyped-def]
+        self, transcripts, system_prompt=None
+    ):
+        for item in await self.generate_suggestions(transcripts, system_prompt):
+            yield item
+
 
 class FakeSummaryService:
-    async def generate_summary(self, transcripts):  # type: ignore[no-untyped-def]
+    async def generate_summary(self, transcripts, chunk_summaries=None, priority=None):  # type: ignore[no-untyped-def]
         return "## 5줄 요약\n- 요약 1\n- 요약 2\n- 요약 3\n- 요약 4\n- 요약 5\n"
 
+    async def stream_summary(self, transcripts, chunk_summaries=None, priority=None):  # type: ignore[no-untyped-def]
+        markdown = await self.generate_summary(transcripts, chunk_summaries, priority)
+        for line in markdown.splitlines(keepends=True):
+            yield line
+
 
 def make_stt_service(events: Callable[[], AsyncIterator[TranscriptResult]]) -> type:
     class FakeSTTService:
@@ -69,6 +122,7 @@ def _set_app_state() -> None:
     app.state.bedrock_service = FakeTranslationService()
     app.state.suggestion_service = FakeSuggestionService()
     app.state.summary_service = FakeSummaryService()
+    app.state.translation_memory = None
 
 
 def _receive_until(
@@ -130,6 +184,502 @@ def test_ws_emits_translation_after_final(monkeypatch) -> None:
         assert "translation.final" in types
 
 
+def test_ws_streams_translation_deltas_before_final(monkeypatch) -> None:
+    async def transcript_stream() -> AsyncIterator[TranscriptResult]:
+        yield TranscriptResult(is_partial=False, text="Hello world.", speaker="spk_1")
+
+    _set_app_state()
+    monkeypatch.setattr(meetings_module, "create_stt_service", lambda settings: make_stt_service(transcript_stream)(settings))
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/v1/meetings/test-session") as websocket:
+        deltas = []
+        for _ in range(10):
+            message = _receive_until(websocket, skip_types={"display.update", "transcript.final"})
+            if message["type"] == "translation.delta":
+                deltas.append(message["delta"])
+                continue
+            assert message["type"] == "translation.final"
+            break
+        assert deltas == ["translated", "_history"]
+        assert message["translatedText"] == "translated_history"
+
+
+def test_ws_final_uses_single_translation_for_display_and_history(monkeypatch) -> None:
+    async def transcript_stream() -> AsyncIterator[TranscriptResult]:
+        yield TranscriptResult(is_partial=False, text="Hello world.", speaker="spk_1")
+
+    class CountingTranslationService(FakeTranslationService):
+        calls = 0
+
+        async def stream_en_to_ko_history(  # type: ignore[override]
+            self,
+            text: str,
+            recent_context: list[str] | None = None,
+            references: list[tuple[str, str]] | None = None,
+            glossary: list[tuple[str, str]] | None = None,
+        ) -> AsyncIterator[str]:
+            CountingTranslationService.calls += 1
+            yield "**안녕** 세상"
+
+        async def translate_for_display(self, text: str, confirmed_texts: list[str]) -> str:
+            raise AssertionError("display translation must reuse the final translation")
+
+    _set_app_state()
+    app.state.settings.translation_two_tier = False
+    app.state.translation_service = CountingTranslationService()
+    monkeypatch.setattr(meetings_module, "create_stt_service", lambda settings: make_stt_service(transcript_stream)(settings))
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/v1/meetings/test-session") as websocket:
+        display_translation = None
+        final = None
+        for _ in range(10):
+            message = websocket.receive_json()
+            if message["type"] == "display.update" and message["confirmed"]:
+                display_translation = message["confirmed"][-1]["translation"]
+            if message["type"] == "translation.final":
+                final = message
+            if final and display_translation:
+                break
+        assert display_translation == "**안녕** 세상"
+        assert final is not None
+        assert final["translatedText"] == "안녕 세상"
+        assert CountingTranslationService.calls == 1
+
+
+def test_ws_two_tier_emits_correction_only_when_it_differs(monkeypatch) -> None:
+    async def transcript_stream() -> AsyncIterator[TranscriptResult]:
+        yield TranscriptResult(is_partial=False, text="Hello world.", speaker="spk_1")
+        yield TranscriptResult(is_partial=False, text="See you.", speaker="spk_1")
+
+    class TwoTierTranslationService(FakeTranslationService):
+        batches: list[list[str]] = []
+
+        async def stream_en_to_ko_draft(  # type: ignore[override]
+            self,
+            text: str,
+            recent_context: list[str] | None = None,
+            references: list[tuple[str, str]] | None = None,
+            glossary: list[tuple[str, str]] | None = None,
+        ) -> AsyncIterator[str]:
+            yield "초안 " + text
+
+        async def stream_en_to_ko_history(  # type: ignore[override]
+            self,
+            text: str,
+            recent_context: list[str] | None = None,
+            references: list[tuple[str, str]] | None = None,
+            glossary: list[tuple[str, str]] | None = None,
+        ) -> AsyncIterator[str]:
+            raise AssertionError("finals must be drafted on the fast model")
+            yield ""
+
+        async def correct_en_to_ko_batch(self, items: list) -> list[str | None]:  # type: ignore[override, type-arg]
+            TwoTierTranslationService.batches.append([item.source_text for item in items])
+            return ["**안녕** 세상", "초안 See you."]
+
+    _set_app_state()
+    app.state.settings.translation_correction_max_batch = 2
+    app.state.translation_service = TwoTierTranslationService()
+    monkeypatch.setattr(meetings_module, "create_stt_service", lambda settings: make_stt_service(transcript_stream)(settings))
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/v1/meetings/test-session") as websocket:
+        finals = []
+        corrected = None
+        corrected_display = None
+        for _ in range(30):
+            message = websocket.receive_json()
+            if message["type"] == "translation.final":
+                finals.append(message["translatedText"])
+            if message["type"] == "translation.corrected":
+                corrected = message
+            if message["type"] == "display.update" and corrected is None:
+                segments = message["confirmed"]
+                if segments and segments[0]["llmCorrected"]:
+                    corrected_display = segments[0]
+            if corrected and corrected_display:
+                break
+        assert finals == ["초안 Hello world.", "초안 See you."]
+        assert TwoTierTranslationService.batches == [["Hello world.", "See you."]]
+        assert corrected is not None
+        assert corrected["segmentId"] == 1
+        assert corrected["translatedText"] == "안녕 세상"
+        assert corrected_display is not None
+        assert corrected_display["translation"] == "**안녕** 세상"
+
+
+def test_ws_two_tier_remembers_only_checked_translations(monkeypatch, tmp_path) -> None:
+    async def transcript_stream() -> AsyncIterator[TranscriptResult]:
+        yield TranscriptResult(is_partial=False, text="Hello world.", speaker="spk_1")
+        yield TranscriptResult(is_partial=False, text="See you.", speaker="spk_1")
+        yield TranscriptResult(is_partial=False, text="Bye now.", speaker="spk_1")
+
+    class TwoTierTranslationService(FakeTranslationService):
+        async def stream_en_to_ko_draft(  # type: ignore[override]
+            self,
+            text: str,
+            recent_context: list[str] | None = None,
+            references: list[tuple[str, str]] | None = None,
+            glossary: list[tuple[str, str]] | None = None,
+        ) -> AsyncIterator[str]:
+            yield "초안 " + text
+
+        async def correct_en_to_ko_batch(self, items: list) -> list[str | None]:  # type: ignore[override, type-arg]
+            return ["**안녕** 세상", "초안 See you.", None]
+
+    memory = TranslationMemory(tmp_path / "memory.sqlite3")
+    _set_app_state()
+    app.state.settings.translation_correction_max_batch = 3
+    app.state.translation_service = TwoTierTranslationService()
+    app.state.translation_memory = memory
+    monkeypatch.setattr(meetings_module, "create_stt_service", lambda settings: make_stt_service(transcript_stream)(settings))
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/v1/meetings/test-session") as websocket:
+        for _ in range(30):
+            if websocket.receive_json()["type"] == "translation.corrected":
+                break
+        for _ in range(100):
+            if len(memory) >= 2:
+                break
+            time.sleep(0.01)
+    app.state.translation_memory = None
+
+    assert memory.lookup("Hello world.")[0].translated_text == "**안녕** 세상"
+    assert memory.lookup("See you.")[0].translated_text == "초안 See you."
+    assert memory.lookup("Bye now.") == []
+    memory.close()
+
+
+def test_ws_pending_corrections_do_not_hold_final_slots(monkeypatch) -> None:
+    async def transcript_stream() -> AsyncIterator[TranscriptResult]:
+        for text in ("First line.", "Second line.", "Third line."):
+            yield TranscriptResult(is_partial=False, text=text, speaker="spk_1")
+            await asyncio.sleep(0.05)
+
+    class StalledCorrectionService(FakeTranslationService):
+        async def correct_en_to_ko_batch(self, items: list) -> list[str | None]:  # type: ignore[override, type-arg]
+            # Stands in for a correction still waiting for background admission.
+            await asyncio.sleep(10)
+            return [None] * len(items)
+
+    _set_app_state()
+    app.state.settings.translation_correction_max_batch = 1
+    app.state.translation_service = StalledCorrectionService()
+    monkeypatch.setattr(meetings_module, "create_stt_service", lambda settings: make_stt_service(transcript_stream)(settings))
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/v1/meetings/test-session") as websocket:
+        started = time.monotonic()
+        finals = []
+        for _ in range(40):
+            message = websocket.receive_json()
+            if message["type"] == "translation.final":
+                finals.append(message["sourceText"])
+            if len(finals) == 3:
+                break
+        elapsed = time.monotonic() - started
+
+    assert finals == ["First line.", "Second line.", "Third line."]
+    assert elapsed < 5
+
+
+def test_ws_serves_translation_memory_hits_without_llm(monkeypatch, tmp_path) -> None:
+    async def transcript_stream() -> AsyncIterator[TranscriptResult]:
+        yield TranscriptResult(is_partial=False, text="Hello world.", speaker="spk_1")
+        yield TranscriptResult(is_partial=False, text="Hello world again.", speaker="spk_1")
+
+    class RecordingTranslationService(FakeTranslationService):
+        calls: list[tuple[str, list[tuple[str, str]] | None]] = []
+
+        async def stream_en_to_ko_history(  # type: ignore[override]
+            self,
+            text: str,
+            recent_context: list[str] | None = None,
+            references: list[tuple[str, str]] | None = None,
+            glossary: list[tuple[str, str]] | None = None,
+        ) -> AsyncIterator[str]:
+            RecordingTranslationService.calls.append((text, references))
+            yield "다시 안녕 세상"
+
+    memory = TranslationMemory(tmp_path / "memory.sqlite3")
+    memory.record("Hello world.", "**안녕** 세상")
+    _set_app_state()
+    app.state.settings.translation_two_tier = False
+    app.state.translation_service = RecordingTranslationService()
+    app.state.translation_memory = memory
+    monkeypatch.setattr(meetings_module, "create_stt_service", lambda settings: make_stt_service(transcript_stream)(settings))
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/v1/meetings/test-session") as websocket:
+        finals = []
+        for _ in range(20):
+            message = websocket.receive_json()
+            if message["type"] == "translation.final":
+                finals.append(message["translatedText"])
+            if len(finals) == 2:
+                break
+    memory.close()
+    app.state.translation_memory = None
+
+    assert finals == ["안녕 세상", "다시 안녕 세상"]
+    assert RecordingTranslationService.calls == [("Hello world again.", [("Hello world.", "**안녕** 세상")])]
+
+
+def test_ws_glossary_seed_renders_terms_locally_and_reaches_prompts(monkeypatch) -> None:
+    seeded = threading.Event()
+
+    async def transcript_stream() -> AsyncIterator[TranscriptResult]:
+        while not seeded.is_set():
+            await asyncio.sleep(0.01)
+        yield TranscriptResult(is_partial=False, text="Kubernetes?", speaker="spk_1")
+        yield TranscriptResult(is_partial=False, text="We moved billing to Kubernetes.", speaker="spk_1")
+
+    class GlossaryTranslationService(FakeTranslationService):
+        calls: list[tuple[str, list[tuple[str, str]] | None]] = []
+
+        async def stream_en_to_ko_history(  # type: ignore[override]
+            self,
+            text: str,
+            recent_context: list[str] | None = None,
+            references: list[tuple[str, str]] | None = None,
+            glossary: list[tuple[str, str]] | None = None,
+        ) -> AsyncIterator[str]:
+            GlossaryTranslationService.calls.append((text, glossary))
+            yield "결제를 **쿠버네티스**로 옮겼어요."
+
+    _set_app_state()
+    app.state.settings.translation_two_tier = False
+    app.state.translation_service = GlossaryTranslationService()
+    monkeypatch.setattr(meetings_module, "create_stt_service", lambda settings: make_stt_service(transcript_stream)(settings))
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/v1/meetings/test-session") as websocket:
+        websocket.send_json({"type": "glossary.seed", "terms": [{"en": "Kubernetes", "ko": "쿠버네티스"}]})
+        websocket.send_json({"type": "client.ping"})
+        assert _receive_until(websocket)["type"] == "server.pong"
+        seeded.set()
+        finals = []
+        for _ in range(20):
+            message = websocket.receive_json()
+            if message["type"] == "translation.final":
+                finals.append(message["translatedText"])
+            if len(finals) == 2:
+                break
+
+    assert finals == ["쿠버네티스?", "결제를 쿠버네티스로 옮겼어요."]
+    assert GlossaryTranslationService.calls == [("We moved billing to Kubernetes.", [("Kubernetes", "쿠버네티스")])]
+
+
+def test_ws_composing_sentences_use_fast_translation(monkeypatch) -> None:
+    done = threading.Event()
+
+    async def transcript_stream() -> AsyncIterator[TranscriptResult]:
+        yield TranscriptResult(is_partial=True, text="We shipped the release to every region. Then", speaker="spk_1")
+        while not done.is_set():
+            await asyncio.sleep(0.01)
+
+    class ComposingTranslationService(FakeTranslationService):
+        fast_calls: list[str] = []
+        history_calls: list[str] = []
+
+        async def translate_en_to_ko(  # type: ignore[override]
+            self,
+            text: str,
+            recent_context: list[str] | None = None,
+            glossary: list[tuple[str, str]] | None = None,
+        ) -> str:
+            ComposingTranslationService.fast_calls.append(text)
+            return "릴리스를 배포했어요."
+
+        async def translate_en_to_ko_history(  # type: ignore[override]
+            self,
+            text: str,
+            recent_context: list[str] | None = None,
+            references: list[tuple[str, str]] | None = None,
+            glossary: list[tuple[str, str]] | None = None,
+        ) -> str:
+            ComposingTranslationService.history_calls.append(text)
+            return "translated_history"
+
+    _set_app_state()
+    app.state.translation_service = ComposingTranslationService()
+    monkeypatch.setattr(meetings_module, "create_stt_service", lambda settings: make_stt_service(transcript_stream)(settings))
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/v1/meetings/test-session") as websocket:
+        translation = None
+        for _ in range(20):
+            message = websocket.receive_json()
+            current = message.get("current") if message["type"] == "display.update" else None
+            if current and current.get("translation"):
+                translation = current["translation"]
+                break
+        done.set()
+
+    assert translation is not None and translation.startswith("릴리스를 배포했어요.")
+    assert ComposingTranslationService.fast_calls == ["We shipped the release to every region."]
+    assert ComposingTranslationService.history_calls == []
+
+
+def test_ws_invalid_glossary_seed_returns_error(monkeypatch) -> None:
+    async def empty_stream() -> AsyncIterator[TranscriptResult]:
+        if False:
+            yield TranscriptResult(is_partial=False, text="", speaker="spk_1")
+
+    _set_app_state()
+    monkeypatch.setattr(meetings_module, "create_stt_service", lambda settings: make_stt_service(empty_stream)(settings))
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/v1/meetings/test-session") as websocket:
+        websocket.send_json({"type": "glossary.seed", "terms": [{"en": "Kubernetes"}]})
+        message = _receive_until(websocket)
+        assert message["type"] == "error"
+        assert message["code"] == "INVALID_MESSAGE"
+
+
+def test_ws_quick_translate_uses_session_context_and_supports_cancel(monkeypatch) -> None:
+    async def transcript_stream() -> AsyncIterator[TranscriptResult]:
+        yield TranscriptResult(is_partial=False, text="We moved billing to Kubernetes.", speaker="spk_1")
+
+    class QuickTranslationService(FakeTranslationService):
+        calls: list[tuple[str, list[str] | None, list[tuple[str, str]] | None]] = []
+
+        async def translate_ko_to_en(  # type: ignore[override]
+            self,
+            text: str,
+            recent_context: list[str] | None = None,
+            glossary: list[tuple[str, str]] | None = None,
+        ) -> str:
+            QuickTranslationService.calls.append((text, recent_context, glossary))
+            if text == "느린 요청":
+                await asyncio.sleep(5)
+            return "Is **Kubernetes** ready?"
+
+    _set_app_state()
+    app.state.settings.translation_two_tier = False
+    app.state.translation_service = QuickTranslationService()
+    monkeypatch.setattr(meetings_module, "create_stt_service", lambda settings: make_stt_service(transcript_stream)(settings))
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/v1/meetings/test-session") as websocket:
+        websocket.send_json({"type": "glossary.seed", "terms": [{"en": "Kubernetes", "ko": "쿠버네티스"}]})
+        for _ in range(20):
+            if websocket.receive_json()["type"] == "translation.final":
+                break
+        websocket.send_json({"type": "translate.request", "requestId": "slow", "text": "느린 요청"})
+        websocket.send_json({"type": "translate.cancel", "requestId": "slow"})
+        websocket.send_json({"type": "translate.request", "requestId": "q1", "text": "쿠버네티스 준비됐나요?"})
+        result = _receive_until(websocket, skip_types={"display.update", "translation.delta"})
+
+    assert result["type"] == "translate.result"
+    assert result["requestId"] == "q1"
+    assert result["translatedText"] == "Is Kubernetes ready?"
+    assert result["error"] is None
+    assert QuickTranslationService.calls[-1] == (
+        "쿠버네티스 준비됐나요?",
+        ["spk_1: We moved billing to Kubernetes."],
+        [("Kubernetes", "쿠버네티스")],
+    )
+
+
+def test_ws_commits_speculative_suggestions_when_final_matches_partial(monkeypatch) -> None:
+    async def transcript_stream() -> AsyncIterator[TranscriptResult]:
+        yield TranscriptResult(is_partial=False, text="Welcome to the planning sync.", speaker="spk_1")
+        # Let the first suggestions finish so the speculation is not skipped as overlapping.
+        await asyncio.sleep(0.1)
+        yield TranscriptResult(is_partial=True, text="Can we ship the release by Friday?", speaker="spk_1")
+        await asyncio.sleep(0.1)
+        yield TranscriptResult(is_partial=False, text="So can we ship the release by Friday?", speaker="spk_1")
+
+    class RecordingSuggestionService(FakeSuggestionService):
+        contexts: list[list[str]] = []
+
+        async def stream_suggestions(  # type: ignore[no-untyped-def]
+            self, transcripts, system_prompt=None
+        ):
+            RecordingSuggestionService.contexts.append([entry.text for entry in transcripts])
+            yield {"en": "Friday works for me.", "ko": "금요일 괜찮아요."}
+
+    _set_app_state()
+    app.state.settings.suggestions_min_interval_s = 0
+    app.state.suggestion_service = RecordingSuggestionService()
+    monkeypatch.setattr(meetings_module, "create_stt_service", lambda settings: make_stt_service(transcript_stream)(settings))
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/v1/meetings/test-session") as websocket:
+        suggestion_events = []
+        for _ in range(40):
+            message = websocket.receive_json()
+            if message["type"] in {"suggestions.delta", "suggestions.update"}:
+                suggestion_events.append(message["type"])
+                if suggestion_events.count("suggestions.update") == 2:
+                    break
+
+    # The committed speculation streams its delta like a regular generation.
+    assert suggestion_events == ["suggestions.delta", "suggestions.update"] * 2
+    assert len(RecordingSuggestionService.contexts) == 2
+    # Built from the partial, not from the final that committed it.
+    assert RecordingSuggestionService.contexts[1][-1] == "Can we ship the release by Friday?"
+
+
+def test_ws_discarded_speculation_makes_way_for_regular_suggestions(monkeypatch) -> None:
+    async def transcript_stream() -> AsyncIterator[TranscriptResult]:
+        yield TranscriptResult(is_partial=False, text="Welcome to the planning sync.", speaker="spk_1")
+        await asyncio.sleep(0.1)
+        yield TranscriptResult(is_partial=True, text="Can we ship the release by Friday?", speaker="spk_1")
+        await asyncio.sleep(0.1)
+        yield TranscriptResult(is_partial=False, text="What about the budget review next week?", speaker="spk_1")
+
+    class RecordingSuggestionService(FakeSuggestionService):
+        contexts: list[list[str]] = []
+
+        async def stream_suggestions(  # type: ignore[no-untyped-def]
+            self, transcripts, system_prompt=None
+        ):
+            RecordingSuggestionService.contexts.append([entry.text for entry in transcripts])
+            yield {"en": "Sounds good.", "ko": "좋아요."}
+
+    _set_app_state()
+    app.state.settings.suggestions_min_interval_s = 0
+    app.state.suggestion_service = RecordingSuggestionService()
+    monkeypatch.setattr(meetings_module, "create_stt_service", lambda settings: make_stt_service(transcript_stream)(settings))
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/v1/meetings/test-session") as websocket:
+        updates = 0
+        for _ in range(40):
+            if websocket.receive_json()["type"] == "suggestions.update":
+                updates += 1
+                if updates == 2:
+                    break
+
+    assert updates == 2
+    # Speculation from the partial, then a fresh generation for the final that replaced it.
+    assert [context[-1] for context in RecordingSuggestionService.contexts[1:]] == [
+        "Can we ship the release by Friday?",
+        "What about the budget review next week?",
+    ]
+
+
+def test_ws_invalid_translate_request_returns_error(monkeypatch) -> None:
+    async def empty_stream() -> AsyncIterator[TranscriptResult]:
+        if False:
+            yield TranscriptResult(is_partial=False, text="", speaker="spk_1")
+
+    _set_app_state()
+    monkeypatch.setattr(meetings_module, "create_stt_service", lambda settings: make_stt_service(empty_stream)(settings))
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/v1/meetings/test-session") as websocket:
+        websocket.send_json({"type": "translate.request", "requestId": "q1", "text": "안녕", "direction": "ko-ja"})
+        message = _receive_until(websocket)
+        assert message["type"] == "error"
+        assert message["code"] == "INVALID_MESSAGE"
+
+
 def test_ws_invalid_message_returns_error(monkeypatch) -> None:
     async def empty_stream() -> AsyncIterator[TranscriptResult]:
         if False:  # pragma: no cover
@@ -173,17 +723,62 @@ def test_ws_summary_request_after_transcript(monkeypatch) -> None:
     with client.websocket_connect("/ws/v1/meetings/test-session") as websocket:
         message = _receive_until(
             websocket,
-            skip_types={"server.pong", "display.update", "translation.final"},
+            skip_types={"server.pong", "display.update", "translation.final", "translation.delta"},
         )
         assert message["type"] == "transcript.final"
 
+        websocket.send_text('{"type":"summary.request"}')
+        deltas = []
+        for _ in range(20):
+            response = _receive_until(
+                websocket,
+                skip_types={"translation.final", "translation.delta", "display.update"},
+            )
+            if response["type"] != "summary.delta":
+                break
+            deltas.append(response["delta"])
+        assert response["type"] == "summary.update"
+        assert response["summaryMarkdown"].startswith("## 5줄 요약")
+        assert deltas[0] == "## 5줄 요약\n"
+        assert "".join(deltas).strip() == response["summaryMarkdown"]
+
+
+def test_ws_summary_request_is_served_from_background_refresh(monkeypatch) -> None:
+    async def transcript_stream() -> AsyncIterator[TranscriptResult]:
+        yield TranscriptResult(is_partial=False, text="We agreed on the launch date.", speaker="spk_1")
+
+    class CountingSummaryService(FakeSummaryService):
+        priorities: list[object] = []
+
+        async def generate_summary(self, transcripts, chunk_summaries=None, priority=None):  # type: ignore[no-untyped-def]
+            CountingSummaryService.priorities.append(priority)
+            return await super().generate_summary(transcripts)
+
+    _set_app_state()
+    app.state.settings.summary_refresh_min_transcripts = 1
+    app.state.settings.summary_refresh_idle_s = 0.01
+    app.state.summary_service = CountingSummaryService()
+    monkeypatch.setattr(meetings_module, "create_stt_service", lambda settings: make_stt_service(transcript_stream)(settings))
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/v1/meetings/test-session") as websocket:
+        _receive_until(
+            websocket,
+            skip_types={"server.pong", "display.update", "translation.final", "translation.delta"},
+        )
+        for _ in range(50):
+            if CountingSummaryService.priorities:
+                break
+            time.sleep(0.01)
         websocket.send_text('{"type":"summary.request"}')
         response = _receive_until(
             websocket,
-            skip_types={"translation.final", "display.update"},
+            skip_types={"translation.final", "translation.delta", "display.update"},
         )
-        assert response["type"] == "summary.update"
-        assert response["summaryMarkdown"].startswith("## 5줄 요약")
+
+    assert response["type"] == "summary.update"
+    assert response["summaryMarkdown"].startswith("## 5줄 요약")
+    assert CountingSummaryService.priorities == [LLMPriority.BACKGROUND]
 
 
 def test_ws_summary_request_error_handling(monkeypatch) -> None:
@@ -191,8 +786,12 @@ def test_ws_summary_request_error_handling(monkeypatch) -> None:
         yield TranscriptResult(is_partial=False, text="Hello world.", speaker="spk_1")
 
     class ErrorSummaryService:
-        async def generate_summary(self, transcripts):  # type: ignore[no-untyped-def]
+        async def generate_summary(self, transcripts, chunk_summaries=None, priority=None):  # type: ignore[no-untyped-def]
+            raise ValueError("Something went wrong")
+
+        async def stream_summary(self, transcripts, chunk_summaries=None, priority=None):  # type: ignore[no-untyped-def]
             raise ValueError("Something went wrong")
+            yield ""
 
     _set_app_state()
     # Override summary service with error one
@@ -204,7 +803,7 @@ def test_ws_summary_request_error_handling(monkeypatch) -> None:
     with client.websocket_connect("/ws/v1/meetings/test-session") as websocket:
         _receive_until(
             websocket,
-            skip_types={"server.pong", "display.update", "translation.final"},
+            skip_types={"server.pong", "display.update", "translation.final", "translation.delta"},
         )
         
         # Send summary request
@@ -213,7 +812,7 @@ def test_ws_summary_request_error_handling(monkeypatch) -> None:
         # Expect error in summary.update
         response = _receive_until(
             websocket,
-            skip_types={"translation.final", "display.update"},
+            skip_types={"translation.final", "translation.delta", "display.update"},
         )
             
         assert response["type"] == "summary.update"
@@ -71,7 +71,7 @@ export default function App() {
       </main>
       <div className="fixed bottom-0 left-0 right-0 z-40 pb-6">
         <div className="mx-auto w-full max-w-7xl px-4 md:px-6">
-          <QuickTranslate />
+          <QuickTranslate socketTranslate={meeting.quickTranslate} />
         </div>
       </div>
     </div>
@@ -23,7 +23,7 @@ interface MeetingPanelProps {
   transcripts: TranscriptEntry[];
   orphanTranslations: OrphanTranslationEntry[];
   summary: SummaryData | null;
-  summaryStatus: "idle" | "loading" | "ready" | "error";
+  summaryStatus: "idle" | "loading" | "streaming" | "ready" | "error";
   summaryError: string | null;
   error: ErrorEvent | null;
   onReconnect: () => void;
@@ -49,7 +49,10 @@ export function MeetingPanel({
   const [historyView, setHistoryView] = useState<"both" | "ko" | "en">("both");
   const [historyCopied, setHistoryCopied] = useState(false);
   const [summaryCopied, setSummaryCopied] = useState(false);
-  const summaryDisabled = transcripts.length === 0 || summaryStatus === "loading";
+  const summaryDisabled =
+    transcripts.length === 0 ||
+    summaryStatus === "loading" ||
+    summaryStatus === "streaming";
   const showSummary = summaryStatus !== "idle" || summary;
   const liveScrollRef = useRef<HTMLDivElement>(null);
   const historyScrollRef = useRef<HTMLDivElement>(null);
@@ -1,8 +1,12 @@
 import { useState } from "react";
 
-import { useTranslate } from "../hooks/useTranslate";
+import { SocketTranslator, useTranslate } from "../hooks/useTranslate";
 
-export function QuickTranslate() {
+interface QuickTranslateProps {
+  socketTranslate?: SocketTranslator;
+}
+
+export function QuickTranslate({ socketTranslate }: QuickTranslateProps) {
   const {
     inputText,
     outputText,
@@ -12,7 +16,7 @@ export function QuickTranslate() {
     translate,
     copyToClipboard,
     clear,
-  } = useTranslate();
+  } = useTranslate(socketTranslate);
   const [copied, setCopied] = useState(false);
 
   const handleCopy = async () => {
@@ -46,6 +46,13 @@ export function TranscriptItem({
             {translation.translatedText}
           </p>
         ))}
+      {showKorean &&
+        transcript.translations.length === 0 &&
+        transcript.pendingTranslation && (
+          <p className={`${translationClass} opacity-70`}>
+            {transcript.pendingTranslation}
+          </p>
+        )}
     </div>
   );
 }
@@ -80,8 +80,11 @@ vi.mock("../lib/ws", () => {
   };
 });
 
+let latestMeeting: ReturnType<typeof useMeeting> | null = null;
+
 function TestHarness() {
   const meeting = useMeeting("ws://localhost", "AWS");
+  latestMeeting = meeting;
   return (
     <div>
       <button type="button" onClick={() => meeting.startMeeting()}>
@@ -244,7 +247,10 @@ test("updates translation on translation.corrected event", async () => {
     expect(transcripts).toHaveLength(1);
     expect(transcripts[0].translations).toHaveLength(1);
     expect(transcripts[0].translations[0].translatedText).toBe("안녕하세요");
+    expect(transcripts[0].translations[0].sourceTs).toBe(1000);
   });
+  const live = latestMeeting?.liveTranscripts.find((entry) => entry.segmentId === 5);
+  expect(live?.translations.map((entry) => entry.translatedText)).toEqual(["안녕하세요"]);
 });
 
 test("ignores correction for non-existent segment", async () => {
@@ -456,6 +462,23 @@ test("moves current to confirmed on final", async () => {
   });
 });
 
+test("cancelled quick translate rejects with AbortError", async () => {
+  render(<TestHarness />);
+
+  await act(async () => {
+    fireEvent.click(screen.getByRole("button", { name: "start" }));
+  });
+
+  const call = latestMeeting?.quickTranslate("안녕하세요");
+  expect(call).toBeTruthy();
+  call?.cancel();
+
+  await expect(call?.result).rejects.toMatchObject({ name: "AbortError" });
+  expect(__getLastWsClient()?.sentControls).toContainEqual(
+    expect.objectContaining({ type: "translate.cancel" })
+  );
+});
+
 test("handles summary.update event", async () => {
   render(<TestHarness />);
   const button = screen.getByRole("button", { name: "start" });
@@ -484,6 +507,44 @@ test("handles summary.update event", async () => {
   });
 });
 
+test("streams summary.delta chunks before summary.update", async () => {
+  render(<TestHarness />);
+  const button = screen.getByRole("button", { name: "start" });
+
+  await act(async () => {
+    fireEvent.click(button);
+  });
+
+  const client = __getLastWsClient();
+  expect(client).not.toBeNull();
+
+  await act(async () => {
+    client?.emit?.({ type: "summary.delta", ts: Date.now(), sessionId: "sess_1", delta: "## 5줄 요약\n" });
+    client?.emit?.({ type: "summary.delta", ts: Date.now(), sessionId: "sess_1", delta: "- 요약 1\n" });
+  });
+
+  await waitFor(() => {
+    const summary = JSON.parse(screen.getByTestId("summary").textContent ?? "{}");
+    expect(summary.markdown).toBe("## 5줄 요약\n- 요약 1\n");
+    expect(screen.getByTestId("summary-status").textContent).toBe("streaming");
+  });
+
+  await act(async () => {
+    client?.emit?.({
+      type: "summary.update",
+      ts: Date.now(),
+      sessionId: "sess_1",
+      summaryMarkdown: "## 5줄 요약\n- 요약 1\n- 요약 2",
+    });
+  });
+
+  await waitFor(() => {
+    const summary = JSON.parse(screen.getByTestId("summary").textContent ?? "{}");
+    expect(summary.markdown).toBe("## 5줄 요약\n- 요약 1\n- 요약 2");
+    expect(screen.getByTestId("summary-status").textContent).toBe("ready");
+  });
+});
+
 test("handles summary.update error", async () => {
   render(<TestHarness />);
   const button = screen.getByRole("button", { name: "start" });
@@ -6,11 +6,13 @@ import { MeetingWsClient } from "../lib/ws";
 import {
   DisplayUpdateEvent,
   ErrorEvent,
+  GlossaryTerm,
   SuggestionItem,
   SubtitleSegment,
   TranscriptCorrectedEvent,
   TranscriptFinalEvent,
   TranscriptPartialEvent,
+  TranslationDeltaEvent,
   TranslationFinalEvent,
   TranslationCorrectedEvent,
   WebSocketEvent,
@@ -26,6 +28,17 @@ export interface TranscriptEntry {
   ts: number;
   segmentId: number;
   translations: TranslationEntry[];
+  pendingTranslation?: string;
+}
+
+export interface QuickTranslateCall {
+  result: Promise<string>;
+  cancel: () => void;
+}
+
+interface PendingTranslate {
+  resolve: (text: string) => void;
+  reject: (error: Error) => void;
 }
 
 export interface TranslationEntry {
@@ -56,7 +69,7 @@ export interface MeetingState {
   orphanTranslations: OrphanTranslationEntry[];
   suggestions: SuggestionItem[];
   summary: SummaryData | null;
-  summaryStatus: "idle" | "loading" | "ready" | "error";
+  summaryStatus: "idle" | "loading" | "streaming" | "ready" | "error";
   summaryError: string | null;
   error: ErrorEvent | null;
   displayBuffer: {
@@ -98,6 +111,8 @@ export function useMeeting(
   const audioCaptureRef = useRef<AudioCapture | null>(null);
   const pendingPromptRef = useRef<string | null>(null);
   const lastPromptRef = useRef<string | null>(null);
+  const glossaryRef = useRef<GlossaryTerm[]>([]);
+  const pendingTranslatesRef = useRef<Map<string, PendingTranslate>>(new Map());
   const lastLiveCountRef = useRef<number>(0);
   const lastHistoryCountRef = useRef<number>(0);
   const lastConfirmedCountRef = useRef<number>(0);
@@ -184,6 +199,21 @@ export function useMeeting(
     });
   };
 
+  const handleTranslationDelta = (event: TranslationDeltaEvent) => {
+    const appendDelta = (entry: TranscriptEntry): TranscriptEntry =>
+      entry.segmentId === event.segmentId
+        ? {
+            ...entry,
+            pendingTranslation: (entry.pendingTranslation ?? "") + event.delta,
+          }
+        : entry;
+    setState((current) => ({
+      ...current,
+      transcripts: current.transcripts.map(appendDelta),
+      liveTranscripts: current.liveTranscripts.map(appendDelta),
+    }));
+  };
+
   const handleTranslation = (event: TranslationFinalEvent) => {
     const translationEntry: TranslationEntry = {
       speaker: event.speaker,
@@ -209,10 +239,11 @@ export function useMeeting(
         transcripts[targetIndex] = {
           ...target,
           translations,
+          pendingTranslation: undefined,
         };
         const liveTranscripts = current.liveTranscripts.map((entry) =>
           entry.segmentId === event.segmentId
-            ? { ...entry, translations }
+            ? { ...entry, translations, pendingTranslation: undefined }
             : entry
         );
         return { ...current, transcripts, liveTranscripts };
@@ -234,6 +265,7 @@ export function useMeeting(
         liveTranscripts[liveIndex] = {
           ...target,
           translations,
+          pendingTranslation: undefined,
         };
         return { ...current, liveTranscripts };
       }
@@ -260,20 +292,24 @@ export function useMeeting(
   };
 
   const handleTranslationCorrected = (event: TranslationCorrectedEvent) => {
-    const translationEntry: TranslationEntry = {
-      speaker: event.speaker,
-      sourceTs: event.ts,
-      sourceText: event.sourceText,
-      translatedText: event.translatedText,
-      segmentId: event.segmentId,
+    // The event carries no source timestamp; keep the one of the draft it replaces.
+    const correct = (entry: TranscriptEntry): TranscriptEntry => {
+      if (entry.segmentId !== event.segmentId) {
+        return entry;
+      }
+      const translationEntry: TranslationEntry = {
+        speaker: event.speaker,
+        sourceTs: entry.translations[0]?.sourceTs ?? entry.ts,
+        sourceText: event.sourceText,
+        translatedText: event.translatedText,
+        segmentId: event.segmentId,
+      };
+      return { ...entry, translations: [translationEntry], pendingTranslation: undefined };
     };
     setState((current) => ({
       ...current,
-      transcripts: current.transcripts.map((entry) =>
-        entry.segmentId === event.segmentId
-          ? { ...entry, translations: [translationEntry] }
-          : entry
-      ),
+      transcripts: current.transcripts.map(correct),
+      liveTranscripts: current.liveTranscripts.map(correct),
     }));
   };
 
@@ -330,6 +366,13 @@ export function useMeeting(
     });
   };
 
+  const rejectPendingTranslates = useCallback(() => {
+    pendingTranslatesRef.current.forEach((pending) =>
+      pending.reject(new Error("Connection closed"))
+    );
+    pendingTranslatesRef.current.clear();
+  }, []);
+
   const handleEvent = useCallback((event: WebSocketEvent) => {
     logDebug(
       "meeting.event",
@@ -357,6 +400,9 @@ export function useMeeting(
       case "transcript.final":
         handleFinalTranscript(event);
         break;
+      case "translation.delta":
+        handleTranslationDelta(event);
+        break;
       case "translation.final":
         handleTranslation(event);
         break;
@@ -369,9 +415,46 @@ export function useMeeting(
       case "display.update":
         handleDisplayUpdate(event);
         break;
+      case "suggestions.delta":
+        // Index 0 starts a new batch; later items fill in behind it.
+        setState((current) => ({
+          ...current,
+          suggestions:
+            event.index === 0
+              ? [event.item]
+              : [...current.suggestions.slice(0, event.index), event.item],
+        }));
+        break;
       case "suggestions.update":
         setState((current) => ({ ...current, suggestions: event.items }));
         break;
+      case "translate.result": {
+        const pending = pendingTranslatesRef.current.get(event.requestId);
+        if (!pending) {
+          break;
+        }
+        pendingTranslatesRef.current.delete(event.requestId);
+        if (event.error || event.translatedText === null) {
+          pending.reject(new Error(event.error ?? "Translation failed"));
+        } else {
+          pending.resolve(event.translatedText);
+        }
+        break;
+      }
+      case "summary.delta":
+        // The first delta replaces the previous summary; later ones extend it.
+        setState((current) => ({
+          ...current,
+          summary: {
+            markdown:
+              current.summaryStatus === "streaming" && current.summary
+                ? current.summary.markdown + event.delta
+                : event.delta,
+          },
+          summaryStatus: "streaming",
+          summaryError: null,
+        }));
+        break;
       case "summary.update":
         setState((current) => ({
           ...current,
@@ -399,8 +482,12 @@ export function useMeeting(
     wsClientRef.current = new MeetingWsClient(
       wsBaseUrl,
       handleEvent,
-      (connected) =>
-        setState((current) => ({ ...current, isConnected: connected })),
+      (connected) => {
+        if (!connected) {
+          rejectPendingTranslates();
+        }
+        setState((current) => ({ ...current, isConnected: connected }));
+      },
       () => {
         audioCaptureRef.current?.stop();
         setState((current) => ({
@@ -449,7 +536,7 @@ export function useMeeting(
       error: null,
       displayBuffer: { confirmed: [], current: null },
     }));
-  }, [handleEvent, providerMode, wsBaseUrl]);
+  }, [handleEvent, providerMode, rejectPendingTranslates, wsBaseUrl]);
 
   const pauseMeeting = useCallback(() => {
     audioCaptureRef.current?.stop();
@@ -543,6 +630,47 @@ export function useMeeting(
     [state.isConnected]
   );
 
+  const seedGlossary = useCallback(
+    (terms: GlossaryTerm[]) => {
+      const cleaned = terms
+        .map((term) => ({ en: term.en.trim(), ko: term.ko.trim() }))
+        .filter((term) => term.en && term.ko);
+      glossaryRef.current = cleaned;
+      if (wsClientRef.current && state.isConnected && cleaned.length > 0) {
+        wsClientRef.current.sendControl({ type: "glossary.seed", terms: cleaned });
+      }
+    },
+    [state.isConnected]
+  );
+
+  const quickTranslate = useCallback(
+    (text: string): QuickTranslateCall | null => {
+      const client = wsClientRef.current;
+      if (!client || !state.isConnected) {
+        return null;
+      }
+      const requestId = crypto.randomUUID();
+      const result = new Promise<string>((resolve, reject) => {
+        pendingTranslatesRef.current.set(requestId, { resolve, reject });
+      });
+      client.sendControl({ type: "translate.request", requestId, text });
+      return {
+        result,
+        cancel: () => {
+          const pending = pendingTranslatesRef.current.get(requestId);
+          if (!pending) {
+            return;
+          }
+          pendingTranslatesRef.current.delete(requestId);
+          client.sendControl({ type: "translate.cancel", requestId });
+          // Settle the promise so awaiting callers can finish; they ignore AbortError.
+          pending.reject(new DOMException("Translation cancelled", "AbortError"));
+        },
+      };
+    },
+    [state.isConnected]
+  );
+
   const requestSummary = useCallback(() => {
     if (!wsClientRef.current || !state.isConnected) {
       setState((current) => ({
@@ -575,6 +703,17 @@ export function useMeeting(
     });
   }, [state.isConnected]);
 
+  useEffect(() => {
+    // Each connection is a fresh server session, so the glossary is re-seeded.
+    if (!state.isConnected || glossaryRef.current.length === 0) {
+      return;
+    }
+    wsClientRef.current?.sendControl({
+      type: "glossary.seed",
+      terms: glossaryRef.current,
+    });
+  }, [state.isConnected]);
+
   useEffect(() => {
     if (!state.isRecording) {
       return;
@@ -657,6 +796,8 @@ export function useMeeting(
     reconnect,
     dismissError,
     sendSuggestionsPrompt,
+    seedGlossary,
+    quickTranslate,
     requestSummary,
   };
 }
@@ -1,6 +1,7 @@
-import { useCallback, useState } from "react";
+import { useCallback, useEffect, useRef, useState } from "react";
 
 import { translateKoToEn } from "../lib/api";
+import type { QuickTranslateCall } from "./useMeeting";
 
 export interface TranslateState {
   inputText: string;
@@ -9,13 +10,24 @@ export interface TranslateState {
   error: string | null;
 }
 
-export function useTranslate() {
+/** Sends the request over the live meeting socket; null when not connected. */
+export type SocketTranslator = (text: string) => QuickTranslateCall | null;
+
+export function useTranslate(socketTranslate?: SocketTranslator) {
   const [state, setState] = useState<TranslateState>({
     inputText: "",
     outputText: "",
     isLoading: false,
     error: null,
   });
+  const inflightRef = useRef<QuickTranslateCall | null>(null);
+
+  const cancelInflight = useCallback(() => {
+    inflightRef.current?.cancel();
+    inflightRef.current = null;
+  }, []);
+
+  useEffect(() => cancelInflight, [cancelInflight]);
 
   const setInputText = useCallback((text: string) => {
     setState((current) => ({ ...current, inputText: text, error: null }));
@@ -26,23 +38,36 @@ export function useTranslate() {
       return;
     }
 
+    cancelInflight();
     setState((current) => ({ ...current, isLoading: true, error: null }));
 
+    const call = socketTranslate?.(state.inputText) ?? null;
+    inflightRef.current = call;
     try {
-      const response = await translateKoToEn(state.inputText);
+      const translatedText = call
+        ? await call.result
+        : (await translateKoToEn(state.inputText)).translatedText;
+      if (call && inflightRef.current !== call) {
+        return;
+      }
+      inflightRef.current = null;
       setState((current) => ({
         ...current,
-        outputText: response.translatedText,
+        outputText: translatedText,
         isLoading: false,
       }));
     } catch (error) {
+      if (isAbortError(error) || (call && inflightRef.current !== call)) {
+        return;
+      }
+      inflightRef.current = null;
       setState((current) => ({
         ...current,
         error: error instanceof Error ? error.message : "Translation failed",
         isLoading: false,
       }));
     }
-  }, [state.inputText]);
+  }, [cancelInflight, socketTranslate, state.inputText]);
 
   const copyToClipboard = useCallback(async () => {
     if (state.outputText) {
@@ -53,8 +78,9 @@ export function useTranslate() {
   }, [state.outputText]);
 
   const clear = useCallback(() => {
+    cancelInflight();
     setState({ inputText: "", outputText: "", isLoading: false, error: null });
-  }, []);
+  }, [cancelInflight]);
 
   return {
     ...state,
@@ -64,3 +90,7 @@ export function useTranslate() {
     clear,
   };
 }
+
+function isAbortError(error: unknown): boolean {
+  return error instanceof DOMException && error.name === "AbortError";
+}
@@ -28,6 +28,38 @@ export async function translateKoToEn(
   return response.json();
 }
 
+export type TranslateDirection = "ko-en" | "en-ko";
+
+export interface BatchTranslateItem {
+  translatedText: string | null;
+  error: string | null;
+  cache: "HIT" | "MISS" | "COALESCED" | null;
+}
+
+export interface BatchTranslateResponse {
+  results: BatchTranslateItem[];
+}
+
+export async function translateBatch(
+  texts: string[],
+  direction: TranslateDirection = "ko-en"
+): Promise<BatchTranslateResponse> {
+  const response = await fetch(`${API_BASE_URL}/api/v1/translate/batch`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ texts, direction }),
+  });
+
+  if (!response.ok) {
+    const error = await response.json().catch(() => ({
+      detail: "Unknown error",
+    }));
+    throw new Error(error.detail || `Translation failed: ${response.status}`);
+  }
+
+  return response.json();
+}
+
 export async function getHealth(): Promise<{ status: string }> {
   const response = await fetch(`${API_BASE_URL}/api/v1/health`);
   if (!response.ok) {
@@ -48,6 +48,14 @@ export interface TranslationFinalEvent extends BaseEvent {
   translatedText: string;
 }
 
+export interface TranslationDeltaEvent extends BaseEvent {
+  type: "translation.delta";
+  sessionId: string;
+  sourceTs: number;
+  segmentId: number;
+  delta: string;
+}
+
 export interface TranslationCorrectedEvent extends BaseEvent {
   type: "translation.corrected";
   sessionId: string;
@@ -76,6 +84,19 @@ export interface SuggestionsUpdateEvent extends BaseEvent {
   items: SuggestionItem[];
 }
 
+export interface SuggestionsDeltaEvent extends BaseEvent {
+  type: "suggestions.delta";
+  sessionId: string;
+  index: number;
+  item: SuggestionItem;
+}
+
+export interface SummaryDeltaEvent extends BaseEvent {
+  type: "summary.delta";
+  sessionId: string;
+  delta: string;
+}
+
 export interface SummaryUpdateEvent extends BaseEvent {
   type: "summary.update";
   sessionId: string;
@@ -94,17 +115,28 @@ export interface ServerPongEvent extends BaseEvent {
   type: "server.pong";
 }
 
+export interface TranslateResultEvent extends BaseEvent {
+  type: "translate.result";
+  requestId: string;
+  translatedText: string | null;
+  error: string | null;
+}
+
 export type WebSocketEvent =
   | DisplayUpdateEvent
   | TranscriptPartialEvent
   | TranscriptFinalEvent
   | TranscriptCorrectedEvent
+  | TranslationDeltaEvent
   | TranslationFinalEvent
   | TranslationCorrectedEvent
+  | SuggestionsDeltaEvent
   | SuggestionsUpdateEvent
+  | SummaryDeltaEvent
   | SummaryUpdateEvent
   | ErrorEvent
-  | ServerPongEvent;
+  | ServerPongEvent
+  | TranslateResultEvent;
 
 export interface SessionStartMessage {
   type: "session.start";
@@ -131,9 +163,34 @@ export interface SummaryRequestMessage {
   type: "summary.request";
 }
 
+export interface GlossaryTerm {
+  en: string;
+  ko: string;
+}
+
+export interface GlossarySeedMessage {
+  type: "glossary.seed";
+  terms: GlossaryTerm[];
+}
+
+export interface TranslateRequestMessage {
+  type: "translate.request";
+  requestId: string;
+  text: string;
+  direction?: "ko-en" | "en-ko";
+}
+
+export interface TranslateCancelMessage {
+  type: "translate.cancel";
+  requestId: string;
+}
+
 export type ClientControlMessage =
   | SessionStartMessage
   | SessionStopMessage
   | ClientPingMessage
   | SuggestionsPromptMessage
-  | SummaryRequestMessage;
+  | SummaryRequestMessage
+  | GlossarySeedMessage
+  | TranslateRequestMessage
+  | TranslateCancelMessage;